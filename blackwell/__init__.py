@@ -6,6 +6,9 @@ to users without requiring Python/CDK expertise. It provides intelligent provide
 selection, cost optimization, and simplified deployment workflows.
 """
 
+import importlib
+from typing import Any
+
 __version__ = "0.1.0"
 __author__ = "Blackwell Development Team"
 __email__ = "dev@blackwell.dev"
@@ -31,9 +34,13 @@ PLATFORM_INFRASTRUCTURE_REQUIRED_VERSION = "1.0.0"
 CDK_REQUIRED_VERSION = "2.100.0"
 PYTHON_REQUIRED_VERSION = "3.13"
 
-# Export main components
-from blackwell.core.config_manager import ConfigManager
-from blackwell.core.client_manager import ClientManager
+# Export main components, imported on first access so that reading the
+# constants above (as the CLI entry point does) doesn't load the managers
+# and their dependencies
+_LAZY_EXPORTS = {
+    "ConfigManager": "blackwell.core.config_manager",
+    "ClientManager": "blackwell.core.client_manager",
+}
 # Cost calculator removed - platform focuses on capabilities, not pricing
 
 __all__ = [
@@ -48,4 +55,11 @@ __all__ = [
     # "CLI_CLIENTS_FILE",  # REMOVED - deprecated in favor of registry/ directory
     "ConfigManager",
     "ClientManager",
-]
\ No newline at end of file
+]
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
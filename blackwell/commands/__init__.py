@@ -5,8 +5,8 @@ This module contains all command implementations for the Blackwell CLI.
 Commands are organized by functionality and provide the main user interface.
 """
 
-# Import all command modules for registration
-from blackwell.commands import init, create, deploy, migrate, list, config, templates
+import importlib
+from typing import Any
 
 __all__ = [
     "init",
@@ -16,4 +16,12 @@ __all__ = [
     "list",
     "config",
     "templates",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Command modules are imported on first access, so loading one command
+    # group doesn't pull in every other group and its dependencies
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
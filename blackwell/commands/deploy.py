@@ -11,11 +11,20 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm
 
+from blackwell.commands import bootstrap
 from blackwell.core.config_manager import ConfigManager
 
 app = typer.Typer(help="Deploy, update, and destroy infrastructure", no_args_is_help=True)
 console = Console()
 
+# Add bootstrap commands as subcommands under deploy
+app.add_typer(
+    bootstrap.app,
+    name="bootstrap",
+    help="Manage CDK bootstrap operations",
+    rich_help_panel="Bootstrap Management",
+)
+
 
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager."""
@@ -8,6 +8,8 @@ Handles:
 - Integration diagnostics and troubleshooting
 """
 
+from collections.abc import Mapping
+
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -257,10 +259,10 @@ def providers(
                     table.add_column("Features", style="dim")
 
                     # Handle both list and dictionary formats
-                    if isinstance(providers, dict):
+                    if isinstance(providers, Mapping):
                         # Dictionary format - iterate over items
                         for provider_key, provider_data in providers.items():
-                            if isinstance(provider_data, dict):
+                            if isinstance(provider_data, Mapping):
                                 name = provider_data.get("name", provider_key.title())
                                 features = ", ".join(provider_data.get("features", [])[:3])  # Show first 3 features
                                 if len(provider_data.get("features", [])) > 3:
@@ -275,7 +277,7 @@ def providers(
                         for provider_key in providers:
                             provider_data = provider_matrix.get_provider_info(provider_type, provider_key)
 
-                            if isinstance(provider_data, dict):
+                            if isinstance(provider_data, Mapping):
                                 name = provider_data.get("name", provider_key.title())
                                 features = ", ".join(provider_data.get("features", [])[:3])  # Show first 3 features
                                 if len(provider_data.get("features", [])) > 3:
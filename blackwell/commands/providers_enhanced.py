@@ -32,7 +32,8 @@ def list(
     This command demonstrates the performance benefits of the JsonProviderRegistry
     system, delivering 13,000x faster operations than traditional implementation loading.
     """
-    from blackwell.core.fast_provider_registry import fast_provider_registry
+    from blackwell.core.fast_provider_registry import get_fast_provider_registry
+    fast_provider_registry = get_fast_provider_registry()
 
     console.print("🚀 [bold blue]Enhanced Provider Discovery[/bold blue]")
 
@@ -203,7 +204,8 @@ def show(
     Displays comprehensive provider metadata including features, compatibility,
     costs, and technical requirements.
     """
-    from blackwell.core.fast_provider_registry import fast_provider_registry
+    from blackwell.core.fast_provider_registry import get_fast_provider_registry
+    fast_provider_registry = get_fast_provider_registry()
 
     console.print(f"🔍 [bold blue]Provider Details: {provider_id}[/bold blue]")
 
@@ -303,6 +305,7 @@ def recommend(
     ssg_engine: Optional[str] = typer.Option(None, "--ssg", help="Required SSG engine"),
     budget: Optional[float] = typer.Option(None, "--budget", "-b", help="Maximum monthly budget"),
     complexity: Optional[str] = typer.Option(None, "--complexity", help="Maximum complexity (simple, intermediate, advanced)"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", help="Show only the top N recommendations"),
 ):
     """
     Get provider recommendations based on requirements.
@@ -310,7 +313,8 @@ def recommend(
     Uses advanced matching algorithms to recommend the best providers
     for your specific needs and constraints.
     """
-    from blackwell.core.fast_provider_registry import fast_provider_registry
+    from blackwell.core.fast_provider_registry import get_fast_provider_registry
+    fast_provider_registry = get_fast_provider_registry()
 
     console.print("🎯 [bold blue]Provider Recommendations[/bold blue]")
 
@@ -343,7 +347,7 @@ def recommend(
     start_time = time.time()
 
     try:
-        recommendations = fast_provider_registry.get_provider_recommendations(requirements)
+        recommendations = fast_provider_registry.get_provider_recommendations(requirements, limit=limit)
 
         if not recommendations:
             console.print("[red]No providers found matching your requirements.[/red]")
@@ -396,7 +400,8 @@ def benchmark():
     Demonstrates the 13,000x performance improvement over traditional
     implementation loading approaches.
     """
-    from blackwell.core.fast_provider_registry import fast_provider_registry
+    from blackwell.core.fast_provider_registry import get_fast_provider_registry
+    fast_provider_registry = get_fast_provider_registry()
 
     console.print("🏃 [bold blue]Performance Benchmark[/bold blue]")
 
@@ -460,7 +465,8 @@ def benchmark():
 
 def _show_available_features():
     """Show available features for search."""
-    from blackwell.core.fast_provider_registry import fast_provider_registry
+    from blackwell.core.fast_provider_registry import get_fast_provider_registry
+    fast_provider_registry = get_fast_provider_registry()
 
     try:
         all_providers = fast_provider_registry.list_providers_by_category()
@@ -486,7 +492,8 @@ def _show_available_ssg_engines():
 
 def _show_available_providers_brief():
     """Show brief list of available providers."""
-    from blackwell.core.fast_provider_registry import fast_provider_registry
+    from blackwell.core.fast_provider_registry import get_fast_provider_registry
+    fast_provider_registry = get_fast_provider_registry()
 
     try:
         all_providers = fast_provider_registry.list_providers_by_category()
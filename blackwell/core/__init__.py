@@ -6,11 +6,30 @@ including configuration management, client operations, cost calculation,
 and platform integration.
 """
 
-from blackwell.core.config_manager import ConfigManager
-from blackwell.core.client_manager import ClientManager
+import importlib
+from typing import Any
+
+# Components by name, imported on first access so that loading one core
+# module (or this package) doesn't pull in the others and their dependencies
+_LAZY_EXPORTS = {
+    "ConfigManager": "blackwell.core.config_manager",
+    "ClientManager": "blackwell.core.client_manager",
+    "ProviderMatrix": "blackwell.core.provider_matrix",
+    "DynamicProviderMatrix": "blackwell.core.dynamic_provider_matrix",
+}
 # Cost calculator removed - platform focuses on capabilities, not pricing
 
 __all__ = [
     "ConfigManager",
     "ClientManager",
-]
\ No newline at end of file
+    "ProviderMatrix",
+    "DynamicProviderMatrix",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1093,9 +1093,9 @@ class ClientManager:
             issues.append("Valid contact email is required")
 
         # Check provider compatibility
-        from blackwell.core.provider_matrix import ProviderMatrix
+        from blackwell.core.provider_matrix import get_default_matrix
 
-        matrix = ProviderMatrix()
+        matrix = get_default_matrix()
         if not matrix.is_provider_valid("cms", client.cms_provider):
             issues.append(f"Invalid CMS provider: {client.cms_provider}")
 
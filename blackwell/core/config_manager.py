@@ -17,7 +17,7 @@ from rich.console import Console
 import sys
 
 from blackwell import CLI_CONFIG_DIR, CLI_CONFIG_FILE
-from .provider_matrix import ProviderMatrix
+from .provider_matrix import get_default_matrix
 from .dynamic_provider_matrix import DynamicProviderMatrix
 from .platform_integration import is_platform_available, get_integration_status
 
@@ -463,35 +463,37 @@ class ConfigManager:
         if self.config.platform_infrastructure.force_static_mode:
             if self.verbose:
                 console.print("[dim]Using static provider matrix (forced)[/dim]")
-            return ProviderMatrix()
+            return get_default_matrix()
 
         # Check environment variable override
         if os.getenv("BLACKWELL_FORCE_STATIC", "").lower() in ("true", "1", "yes"):
             if self.verbose:
                 console.print("[dim]Using static provider matrix (env override)[/dim]")
-            return ProviderMatrix()
+            return get_default_matrix()
 
         # Check if platform integration is enabled
         if not self.config.platform_infrastructure.enable_live_metadata:
             if self.verbose:
                 console.print("[dim]Using static provider matrix (disabled)[/dim]")
-            return ProviderMatrix()
+            return get_default_matrix()
 
         # Try to use dynamic provider matrix
         if self.is_platform_available() and is_platform_available():
             try:
                 if self.verbose:
                     console.print("[dim]Using dynamic provider matrix with platform data[/dim]")
-                return DynamicProviderMatrix()
+                return DynamicProviderMatrix(
+                    cache_duration=self.config.platform_infrastructure.cache_duration
+                )
             except Exception as e:
                 if self.verbose:
                     console.print(f"[yellow]Dynamic provider matrix failed: {e}[/yellow]")
                     console.print("[dim]Falling back to static provider matrix[/dim]")
-                return ProviderMatrix()
+                return get_default_matrix()
         else:
             if self.verbose:
                 console.print("[dim]Using static provider matrix (platform unavailable)[/dim]")
-            return ProviderMatrix()
+            return get_default_matrix()
 
     def get_platform_integration_status(self) -> Dict[str, Any]:
         """Get detailed platform integration status."""
@@ -625,7 +627,7 @@ class ConfigManager:
             try:
                 # Try to get registry status from platform factory
                 provider_matrix = self.get_provider_matrix()
-                if hasattr(provider_matrix, '_data_source') and provider_matrix._data_source == "platform":
+                if hasattr(provider_matrix, 'get_data_source') and provider_matrix.get_data_source() == "platform":
                     registry_status = self._get_registry_status()
                     if registry_status:
                         # Registry Health
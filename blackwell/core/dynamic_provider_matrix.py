@@ -11,23 +11,87 @@ Key Features:
 - Graceful fallback to static data when platform unavailable
 - Full backward compatibility with existing CLI code
 - Enhanced intelligence using platform capabilities
+- Short-lived on-disk cache of transformed providers across CLI invocations
 """
 
+import importlib.util
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import sys
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+from blackwell import CLI_CONFIG_DIR
 from .provider_matrix import ProviderMatrix
 from .platform_integration import (
     get_platform_metadata,
+    get_platform_metadata_version,
+    get_registry_version,
     transform_to_cli_format,
     is_platform_available,
     get_platform_recommendations,
     estimate_platform_cost,
-    get_compatible_ssg_engines,
+    get_compatible_ssg_engines_many,
     get_integration_status
 )
 
 logger = logging.getLogger(__name__)
 
+# Seconds a platform cost estimate stays valid within a CLI session
+COST_ESTIMATE_TTL = 300
+
+# Transformed platform providers persisted across CLI invocations
+METADATA_CACHE_PATH = Path(CLI_CONFIG_DIR).expanduser() / "cache" / "platform_providers.json"
+METADATA_CACHE_DURATION = 300
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a requirements value into a hashable cache key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _freeze_provider_records(providers: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Compact platform provider records for long-lived storage.
+
+    Records stay dicts for ProviderMatrix API compatibility, but list fields such as
+    features and compatible_ssg become exact-size tuples that cannot be mutated
+    through the shared read-only diagnostics views. Their strings are interned, so
+    feature and engine names repeated across providers share one object.
+    """
+    return {
+        name: {
+            key: tuple(sys.intern(item) if isinstance(item, str) else item for item in value)
+            if isinstance(value, list) else value
+            for key, value in record.items()
+        }
+        for name, record in providers.items()
+    }
+
+
+def _platform_location() -> Optional[str]:
+    """Locate the platform-infrastructure checkout on sys.path without importing it."""
+    try:
+        spec = importlib.util.find_spec("shared")
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return str(Path(list(spec.submodule_search_locations)[0]).parent)
+
+
+def _compat_entry(engines: List[str]) -> Tuple[frozenset, Tuple[str, ...]]:
+    """Index compatible SSG engines as (set for lookups, sorted tuple for display)."""
+    return frozenset(engines), tuple(sorted(set(engines)))
+
 
 class DynamicProviderMatrix(ProviderMatrix):
     """
@@ -38,105 +102,371 @@ class DynamicProviderMatrix(ProviderMatrix):
     intelligence from the platform factory system.
     """
 
-    def __init__(self):
-        """Initialize dynamic provider matrix with platform integration."""
+    __slots__ = (
+        "_data_source",
+        "_platform_metadata_count",
+        "_integration_status",
+        "_platform_loaded",
+        "_platform_available",
+        "_metadata_version",
+        "_recommendation_cache",
+        "_cost_cache",
+        "_compat_sets",
+        "_cms_stack_ids",
+        "_ecommerce_stack_ids",
+        "_counts",
+        "_total_combinations",
+        "_providers_with_source",
+        "_cache_duration",
+    )
+
+    def __init__(self, cache_duration: int = METADATA_CACHE_DURATION):
+        """
+        Initialize dynamic provider matrix with static data, deferring platform load.
+
+        Args:
+            cache_duration: Seconds transformed platform providers are reused from
+                the on-disk cache (0 disables the cache)
+        """
         logger.debug("Initializing DynamicProviderMatrix")
+        self._cache_duration = cache_duration
+
+        # Static data is only a placeholder until provider data is first read
+        super().__init__()
 
         # Track data source for diagnostics
         self._data_source = "static"
         self._platform_metadata_count = 0
-        self._integration_status = get_integration_status()
+        self._integration_status: Optional[Dict[str, Any]] = None
+        self._platform_loaded = False
+        self._platform_available: Optional[bool] = None
+        self._metadata_version: Optional[str] = None
+
+        # Platform recommendations keyed by frozen requirements
+        self._recommendation_cache: Dict[Tuple, List[Dict[str, Any]]] = {}
+
+        # Platform cost estimates keyed by (stack_type, ssg_engine) with timestamps
+        self._cost_cache: Dict[Tuple[str, str], Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+        # Compatible SSG engines per platform stack type as (set, sorted tuple),
+        # built on metadata load
+        self._compat_sets: Dict[str, Tuple[frozenset, Tuple[str, ...]]] = {}
+
+        # Platform stack type identifiers per provider, built on metadata load
+        self._cms_stack_ids: Dict[str, str] = {}
+        self._ecommerce_stack_ids: Dict[str, str] = {}
+
+        # Provider counts, recomputed whenever provider data is replaced
+        self._counts: Tuple[int, int, int] = (0, 0, 0)
+        self._total_combinations = 0
+        self._providers_with_source: Optional[Mapping[str, Any]] = None
+        self._update_counts()
+
+        logger.debug("DynamicProviderMatrix initialized with deferred platform load: "
+                     "%d CMS, %d E-commerce, %d SSG providers",
+                     len(self.cms_providers), len(self.ecommerce_providers), len(self.ssg_engines))
+
+    def _ensure_platform(self) -> None:
+        """Load platform metadata on first use of provider data."""
+        if self._platform_loaded:
+            return
+
+        self._platform_loaded = True
+        if not self._load_from_disk_cache():
+            self._load_from_platform()
 
-        # Attempt to load from platform
-        self._load_from_platform()
+        logger.info("DynamicProviderMatrix loaded: %s mode, %d CMS, %d E-commerce, %d SSG providers",
+                    self._data_source, len(self.cms_providers), len(self.ecommerce_providers),
+                    len(self.ssg_engines))
 
-        # Call parent initialization (may use static data as fallback)
-        super().__init__()
+    def _fetch_platform_providers(self, force_refresh: bool = False
+                                  ) -> Optional[Tuple[Optional[Dict[str, Dict[str, Any]]], int, Optional[str]]]:
+        """
+        Fetch and transform platform metadata without touching current provider data.
+
+        Args:
+            force_refresh: Bypass the in-process platform metadata cache
 
-        logger.info(f"DynamicProviderMatrix initialized: {self._data_source} mode, "
-                   f"{len(self.cms_providers)} CMS, {len(self.ecommerce_providers)} E-commerce, "
-                   f"{len(self.ssg_engines)} SSG providers")
+        Returns:
+            Tuple of (CLI format metadata, platform stack count, metadata version),
+            or None if unavailable. The CLI format is None when the source reports
+            the same version as the last platform load.
+        """
+        # Get platform metadata using safe import pattern
+        platform_metadata = get_platform_metadata(force_refresh=force_refresh)
+        if not platform_metadata:
+            return None
+
+        version = get_platform_metadata_version(platform_metadata)
+        if version is not None and self._data_source == "platform" and version == self._metadata_version:
+            return None, len(platform_metadata), version
+
+        # Transform to CLI format
+        return transform_to_cli_format(platform_metadata), len(platform_metadata), version
+
+    def _apply_platform_providers(self, cli_format: Optional[Dict[str, Dict[str, Any]]],
+                                  stack_count: int, version: Optional[str]) -> None:
+        """Swap in freshly fetched platform provider data."""
+        if cli_format is None:
+            logger.debug("Platform metadata unchanged, keeping loaded provider data")
+            return
+
+        self._load_from_metadata(cli_format)
+
+        # Update status tracking
+        self._data_source = "platform"
+        self._platform_metadata_count = stack_count
+        self._metadata_version = version
+
+        logger.info("Loaded provider data from platform: %d stack types", stack_count)
+        self._save_to_disk_cache(cli_format, stack_count, version)
+
+    def _load_from_disk_cache(self) -> bool:
+        """
+        Load transformed platform providers persisted by a previous CLI invocation.
+
+        The cache is only used while it is younger than the cache duration and was
+        written for the same platform checkout and registry data version.
+
+        Returns:
+            True if fresh cached providers were loaded, False otherwise
+        """
+        if self._cache_duration <= 0 or not METADATA_CACHE_PATH.exists():
+            return False
 
-    def _load_from_platform(self) -> None:
-        """Load provider data from platform metadata using direct access pattern."""
         try:
-            # Get platform metadata using safe import pattern
-            platform_metadata = get_platform_metadata()
+            if time.time() - METADATA_CACHE_PATH.stat().st_mtime >= self._cache_duration:
+                return False
+
+            cached = json.loads(METADATA_CACHE_PATH.read_text())
+            if cached.get("platform_path") != _platform_location():
+                logger.debug("Ignoring platform provider cache written for another platform checkout")
+                return False
+            if cached.get("version") != get_registry_version():
+                logger.debug("Ignoring platform provider cache for an outdated registry version")
+                return False
+
+            self._load_from_metadata(cached["providers"], cached["compatible_ssg"])
+            self._data_source = "platform"
+            self._platform_metadata_count = cached["stack_count"]
+            self._metadata_version = cached["version"]
+
+            logger.debug("Loaded platform providers from cache: %s", METADATA_CACHE_PATH)
+            return True
 
-            if platform_metadata:
-                # Transform to CLI format
-                cli_format = transform_to_cli_format(platform_metadata)
+        except Exception as e:
+            logger.debug("Ignoring unreadable platform provider cache: %s", e)
+            return False
+
+    def _save_to_disk_cache(self, cli_format: Dict[str, Dict[str, Any]], stack_count: int,
+                            version: Optional[str]) -> None:
+        """Persist transformed platform providers for subsequent CLI invocations."""
+        if self._cache_duration <= 0:
+            return
 
-                # Load transformed metadata
-                self._load_from_metadata(cli_format)
+        try:
+            METADATA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            METADATA_CACHE_PATH.write_text(json.dumps({
+                "platform_path": _platform_location(),
+                "stack_count": stack_count,
+                "version": version,
+                "providers": cli_format,
+                "compatible_ssg": {stack_type: list(engines) for stack_type, (_, engines) in self._compat_sets.items()}
+            }))
+        except Exception as e:
+            logger.debug("Could not write platform provider cache: %s", e)
 
-                # Update status tracking
-                self._data_source = "platform"
-                self._platform_metadata_count = len(platform_metadata)
+    def _load_from_platform(self) -> None:
+        """Load provider data from platform metadata using direct access pattern."""
+        try:
+            fetched = self._fetch_platform_providers()
 
-                logger.info(f"Loaded provider data from platform: {len(platform_metadata)} stack types")
+            if fetched:
+                self._apply_platform_providers(*fetched)
             else:
                 logger.debug("No platform metadata available, using static fallback")
 
         except Exception as e:
-            logger.warning(f"Failed to load from platform, using static fallback: {e}")
+            logger.warning("Failed to load from platform, using static fallback: %s", e)
 
-    def _load_from_metadata(self, metadata: Dict[str, Dict[str, Any]]) -> None:
-        """Load provider dictionaries from transformed metadata."""
-        if "cms" in metadata:
-            self.cms_providers = metadata["cms"]
-            logger.debug(f"Loaded {len(self.cms_providers)} CMS providers from platform")
+    def _load_from_metadata(self, metadata: Dict[str, Dict[str, Any]],
+                            compatible_ssg: Optional[Dict[str, List[str]]] = None) -> None:
+        """
+        Load provider dictionaries from transformed metadata.
 
-        if "ecommerce" in metadata:
-            self.ecommerce_providers = metadata["ecommerce"]
-            logger.debug(f"Loaded {len(self.ecommerce_providers)} E-commerce providers from platform")
+        Provider records, stack identifiers and compatibility sets are all built
+        before any of them is assigned, so a failure leaves the current data intact.
 
-        if "ssg" in metadata:
-            self.ssg_engines = metadata["ssg"]
-            logger.debug(f"Loaded {len(self.ssg_engines)} SSG engines from platform")
+        Args:
+            metadata: Transformed CLI format metadata
+            compatible_ssg: Compatible SSG engines per stack type, fetched from the
+                platform when not given
+        """
+        cms_providers = _freeze_provider_records(metadata["cms"]) if "cms" in metadata else self.cms_providers
+        ecommerce_providers = (
+            _freeze_provider_records(metadata["ecommerce"]) if "ecommerce" in metadata else self.ecommerce_providers
+        )
+        ssg_engines = _freeze_provider_records(metadata["ssg"]) if "ssg" in metadata else self.ssg_engines
+
+        # Platform stack type identifiers per provider, interned
+        cms_stack_ids = {name: sys.intern(f"{name}_cms_tier") for name in cms_providers}
+        ecommerce_stack_ids = {name: sys.intern(f"{name}_ecommerce") for name in ecommerce_providers}
+        if compatible_ssg is None:
+            compatible_ssg = get_compatible_ssg_engines_many(
+                [*cms_stack_ids.values(), *ecommerce_stack_ids.values()]
+            )
+        compat_sets = {stack_type: _compat_entry(engines) for stack_type, engines in compatible_ssg.items()}
+
+        self._replace_providers(cms_providers, ecommerce_providers, ssg_engines)
+        self._cms_stack_ids = cms_stack_ids
+        self._ecommerce_stack_ids = ecommerce_stack_ids
+        self._compat_sets = compat_sets
+        self._update_counts()
+
+        logger.debug("Loaded %d CMS, %d E-commerce, %d SSG providers from platform",
+                     len(cms_providers), len(ecommerce_providers), len(ssg_engines))
+
+    def _cms_stack_id(self, cms_provider: str) -> str:
+        """Get the platform stack type for a CMS provider."""
+        return self._cms_stack_ids.get(cms_provider) or f"{cms_provider}_cms_tier"
+
+    def _ecommerce_stack_id(self, ecommerce_provider: str) -> str:
+        """Get the platform stack type for an e-commerce provider."""
+        return self._ecommerce_stack_ids.get(ecommerce_provider) or f"{ecommerce_provider}_ecommerce"
+
+    def _update_counts(self) -> None:
+        """Cache provider counts and total combinations for diagnostics."""
+        self._counts = (len(self.cms_providers), len(self.ecommerce_providers), len(self.ssg_engines))
+        self._total_combinations = self._counts[0] * self._counts[1] * self._counts[2]
+        self._providers_with_source = None
+
+    def _get_compat_sets(self, *stack_types: str) -> List[Tuple[frozenset, Tuple[str, ...]]]:
+        """Get compatible SSG engines per stack type, fetching unindexed ones in one batch."""
+        missing = [stack_type for stack_type in stack_types if stack_type not in self._compat_sets]
+        if missing:
+            for stack_type, engines in get_compatible_ssg_engines_many(missing).items():
+                self._compat_sets[stack_type] = _compat_entry(engines)
+
+        return [self._compat_sets[stack_type] for stack_type in stack_types]
+
+    # Inherited accessors answer from platform data once it is loaded, so every one
+    # loads it first; otherwise an instance could answer from static data, then
+    # switch sources after its first intelligence call
+
+    def is_provider_valid(self, provider_type: str, provider_name: str) -> bool:
+        """Check if a provider is valid for the given type."""
+        self._ensure_platform()
+        return super().is_provider_valid(provider_type, provider_name)
+
+    def get_provider_info(self, provider_type: str, provider_name: str) -> Mapping[str, Any]:
+        """Get detailed information about a provider as a read-only view (empty if unknown)."""
+        self._ensure_platform()
+        return super().get_provider_info(provider_type, provider_name)
+
+    def is_combination_compatible(self, cms_provider: str, ecommerce_provider: str, ssg_engine: str) -> bool:
+        """Check if a combination of providers is compatible."""
+        self._ensure_platform()
+        return super().is_combination_compatible(cms_provider, ecommerce_provider, ssg_engine)
+
+    def get_compatible_ssg_engines(self, cms_provider: str, ecommerce_provider: str = None) -> List[str]:
+        """Get list of SSG engines compatible with the given providers."""
+        self._ensure_platform()
+        return super().get_compatible_ssg_engines(cms_provider, ecommerce_provider)
+
+    def calculate_provider_cost(self, cms_provider: str, ecommerce_provider: str = None) -> Dict[str, float]:
+        """Calculate cost breakdown for provider combination."""
+        self._ensure_platform()
+        return super().calculate_provider_cost(cms_provider, ecommerce_provider)
+
+    def get_providers_by_budget(self, max_monthly_cost: float) -> Dict[str, List[str]]:
+        """Get providers within budget limit."""
+        self._ensure_platform()
+        return super().get_providers_by_budget(max_monthly_cost)
+
+    def get_complexity_level(self, cms_provider: str, ecommerce_provider: str = None,
+                             ssg_engine: str = "astro") -> str:
+        """Determine overall complexity level for provider combination."""
+        self._ensure_platform()
+        return super().get_complexity_level(cms_provider, ecommerce_provider, ssg_engine)
+
+    def list_all_providers(self) -> Mapping[str, Tuple[str, ...]]:
+        """Get all available providers by type (read-only, shared between calls)."""
+        self._ensure_platform()
+        return super().list_all_providers()
+
+    def get_recommended_combinations(self, budget: float = None, complexity: str = None,
+                                     limit: Optional[int] = None) -> List[Dict]:
+        """Get recommended provider combinations based on criteria, cheapest first (up to limit)."""
+        self._ensure_platform()
+        return super().get_recommended_combinations(budget=budget, complexity=complexity, limit=limit)
 
     def get_data_source(self) -> str:
         """Get current data source for diagnostics."""
+        self._ensure_platform()
         return self._data_source
 
     def get_platform_status(self) -> Dict[str, Any]:
         """Get platform integration status."""
+        self._ensure_platform()
         return {
             "data_source": self._data_source,
-            "platform_available": is_platform_available(),
+            "platform_available": self._is_platform_available(),
             "platform_metadata_count": self._platform_metadata_count,
-            "integration_status": self._integration_status
+            "integration_status": self._get_integration_status()
         }
 
+    def _is_platform_available(self) -> bool:
+        """Check platform availability, importing the factory only when first asked."""
+        if self._platform_available is None:
+            self._platform_available = is_platform_available()
+        return self._platform_available
+
+    def _get_integration_status(self) -> Dict[str, Any]:
+        """Get platform integration status, probing sources only when first needed."""
+        if self._integration_status is None:
+            self._integration_status = get_integration_status()
+        return self._integration_status
+
     def refresh_from_platform(self) -> bool:
         """
         Refresh provider data from platform.
 
+        Current provider data is only replaced when the platform returns fresh
+        metadata, so a failed refresh never leaves the matrix empty.
+
+        Always bypasses the on-disk provider cache and rewrites it on success.
+
         Returns:
             True if refresh successful, False otherwise
         """
         logger.info("Refreshing provider data from platform")
 
-        try:
-            # Clear current data
-            self.cms_providers = {}
-            self.ecommerce_providers = {}
-            self.ssg_engines = {}
+        # Platform call results are always re-fetched after a refresh
+        self._recommendation_cache.clear()
+        self._cost_cache.clear()
 
-            # Reload from platform
-            self._load_from_platform()
+        try:
+            fetched = self._fetch_platform_providers(force_refresh=True)
 
-            # Reinitialize parent static data if needed
-            if self._data_source == "static":
-                super().__init__()
+            self._platform_loaded = True
+            self._integration_status = get_integration_status()
+            self._platform_available = is_platform_available()
+            self._providers_with_source = None
 
-            logger.info(f"Provider data refreshed: {self._data_source} mode")
-            return True
+            if fetched:
+                # Builds everything before assigning, so a failure keeps the old data
+                self._apply_platform_providers(*fetched)
+            elif self._data_source == "platform":
+                logger.warning("Platform metadata unavailable, keeping previously loaded provider data")
+                return False
 
         except Exception as e:
-            logger.error(f"Failed to refresh provider data: {e}")
+            logger.error("Failed to refresh provider data: %s", e)
             return False
 
+        logger.info("Provider data refreshed: %s mode", self._data_source)
+        return True
+
     # Enhanced methods using platform intelligence
 
     def get_intelligent_recommendations(self, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -149,19 +479,45 @@ class DynamicProviderMatrix(ProviderMatrix):
         Returns:
             List of recommendations with enhanced platform intelligence
         """
+        self._ensure_platform()
         if self._data_source == "platform":
-            try:
-                platform_recommendations = get_platform_recommendations(requirements)
-                if platform_recommendations:
-                    logger.debug(f"Retrieved {len(platform_recommendations)} platform recommendations")
-                    return platform_recommendations
-            except Exception as e:
-                logger.warning(f"Failed to get platform recommendations: {e}")
-
-        # Fallback to parent method for static recommendations
+            platform_recommendations = self._platform_recommendations(requirements)
+            if platform_recommendations:
+                return platform_recommendations
+
+        return self._static_recommendations(requirements)
+
+    def _platform_recommendations(self, requirements: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Get platform recommendations, or None if the platform call fails."""
+        try:
+            platform_recommendations = self._get_cached_recommendations(requirements)
+        except Exception as e:
+            logger.warning("Failed to get platform recommendations: %s", e)
+            return None
+
+        if platform_recommendations:
+            logger.debug("Retrieved %d platform recommendations", len(platform_recommendations))
+        return platform_recommendations
+
+    def _static_recommendations(self, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fallback to parent method for static recommendations."""
         logger.debug("Using static recommendations fallback")
         return self.get_recommended_combinations(**requirements)
 
+    def _get_cached_recommendations(self, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get platform recommendations, reusing results for repeated requirements."""
+        try:
+            key = _freeze(requirements)
+            hash(key)
+        except TypeError:
+            # Unhashable requirement values - skip the cache
+            return get_platform_recommendations(requirements)
+
+        if key not in self._recommendation_cache:
+            self._recommendation_cache[key] = get_platform_recommendations(requirements)
+
+        return list(self._recommendation_cache[key])
+
     def get_accurate_cost_estimate(self, cms_provider: str, ecommerce_provider: Optional[str] = None,
                                  ssg_engine: str = "astro") -> Dict[str, Any]:
         """
@@ -175,52 +531,82 @@ class DynamicProviderMatrix(ProviderMatrix):
         Returns:
             Enhanced cost estimate with platform intelligence
         """
+        self._ensure_platform()
         if self._data_source == "platform":
-            try:
-                # Try to get platform cost estimate
-                if ecommerce_provider:
-                    # For composed stacks, we'd need to estimate both
-                    cms_cost = estimate_platform_cost(f"{cms_provider}_cms_tier", ssg_engine)
-                    ecommerce_cost = estimate_platform_cost(f"{ecommerce_provider}_ecommerce", ssg_engine)
-
-                    if cms_cost and ecommerce_cost:
-                        return {
-                            "cms_cost": cms_cost["monthly_cost_range"],
-                            "ecommerce_cost": ecommerce_cost["monthly_cost_range"],
-                            "total_monthly_range": [
-                                cms_cost["monthly_cost_range"][0] + ecommerce_cost["monthly_cost_range"][0],
-                                cms_cost["monthly_cost_range"][1] + ecommerce_cost["monthly_cost_range"][1]
-                            ],
-                            "setup_cost_estimate": {
-                                "min": cms_cost["setup_cost_range"][0] + ecommerce_cost["setup_cost_range"][0],
-                                "max": cms_cost["setup_cost_range"][1] + ecommerce_cost["setup_cost_range"][1]
-                            },
-                            "source": "platform"
-                        }
-                else:
-                    # CMS only
-                    cost_estimate = estimate_platform_cost(f"{cms_provider}_cms_tier", ssg_engine)
-                    if cost_estimate:
-                        return {
-                            "cms_cost": cost_estimate["monthly_cost_range"],
-                            "ecommerce_cost": [0, 0],
-                            "total_monthly_range": cost_estimate["monthly_cost_range"],
-                            "setup_cost_estimate": {
-                                "min": cost_estimate["setup_cost_range"][0],
-                                "max": cost_estimate["setup_cost_range"][1]
-                            },
-                            "source": "platform"
-                        }
-
-            except Exception as e:
-                logger.warning(f"Failed to get platform cost estimate: {e}")
-
-        # Fallback to parent method
+            platform_cost = self._platform_cost_estimate(cms_provider, ecommerce_provider, ssg_engine)
+            if platform_cost:
+                return platform_cost
+
+        return self._static_cost_estimate(cms_provider, ecommerce_provider)
+
+    def _platform_cost_estimate(self, cms_provider: str, ecommerce_provider: Optional[str],
+                                ssg_engine: str) -> Optional[Dict[str, Any]]:
+        """Get a platform cost estimate, or None if unavailable."""
+        try:
+            if ecommerce_provider:
+                # For composed stacks, we'd need to estimate both
+                cms_cost = self._estimate_cached(self._cms_stack_id(cms_provider), ssg_engine)
+                ecommerce_cost = self._estimate_cached(self._ecommerce_stack_id(ecommerce_provider), ssg_engine)
+
+                if cms_cost and ecommerce_cost:
+                    cms_monthly = cms_cost["monthly_cost_range"]
+                    ecommerce_monthly = ecommerce_cost["monthly_cost_range"]
+                    cms_low, cms_high = cms_monthly
+                    ecommerce_low, ecommerce_high = ecommerce_monthly
+                    cms_setup_low, cms_setup_high = cms_cost["setup_cost_range"]
+                    ecommerce_setup_low, ecommerce_setup_high = ecommerce_cost["setup_cost_range"]
+
+                    return {
+                        "cms_cost": cms_monthly,
+                        "ecommerce_cost": ecommerce_monthly,
+                        "total_monthly_range": [cms_low + ecommerce_low, cms_high + ecommerce_high],
+                        "setup_cost_estimate": {
+                            "min": cms_setup_low + ecommerce_setup_low,
+                            "max": cms_setup_high + ecommerce_setup_high
+                        },
+                        "source": "platform"
+                    }
+            else:
+                # CMS only
+                cost_estimate = self._estimate_cached(self._cms_stack_id(cms_provider), ssg_engine)
+                if cost_estimate:
+                    cms_monthly = cost_estimate["monthly_cost_range"]
+                    setup_low, setup_high = cost_estimate["setup_cost_range"]
+
+                    return {
+                        "cms_cost": cms_monthly,
+                        "ecommerce_cost": [0, 0],
+                        "total_monthly_range": cms_monthly,
+                        "setup_cost_estimate": {"min": setup_low, "max": setup_high},
+                        "source": "platform"
+                    }
+
+        except Exception as e:
+            logger.warning("Failed to get platform cost estimate: %s", e)
+
+        return None
+
+    def _static_cost_estimate(self, cms_provider: str, ecommerce_provider: Optional[str]) -> Dict[str, Any]:
+        """Fallback to parent method for static cost calculation."""
         logger.debug("Using static cost calculation fallback")
         static_cost = self.calculate_provider_cost(cms_provider, ecommerce_provider)
         static_cost["source"] = "static"
         return static_cost
 
+    def _estimate_cached(self, stack_type: str, ssg_engine: str,
+                         ttl: float = COST_ESTIMATE_TTL) -> Optional[Dict[str, Any]]:
+        """Get a platform cost estimate, reusing results younger than ttl seconds."""
+        key = (stack_type, ssg_engine)
+        cached = self._cost_cache.get(key)
+        now = time.monotonic()
+
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+
+        estimate = estimate_platform_cost(stack_type, ssg_engine)
+        self._cost_cache[key] = (now, estimate)
+        return estimate
+
     def get_enhanced_compatibility_check(self, cms_provider: str, ecommerce_provider: str,
                                        ssg_engine: str) -> Dict[str, Any]:
         """
@@ -234,62 +620,84 @@ class DynamicProviderMatrix(ProviderMatrix):
         Returns:
             Detailed compatibility analysis
         """
-        result = {
-            "compatible": False,
-            "issues": [],
-            "recommendations": [],
-            "source": "static"
-        }
-
+        self._ensure_platform()
         if self._data_source == "platform":
-            try:
-                # Use platform compatibility data
-                cms_engines = get_compatible_ssg_engines(f"{cms_provider}_cms_tier")
-                ecommerce_engines = get_compatible_ssg_engines(f"{ecommerce_provider}_ecommerce")
+            result = self._platform_compatibility_check(cms_provider, ecommerce_provider, ssg_engine)
+            if result:
+                return result
 
-                if cms_engines and ecommerce_engines:
-                    compatible_engines = set(cms_engines).intersection(set(ecommerce_engines))
+        return self._static_compatibility_check(cms_provider, ecommerce_provider, ssg_engine)
 
-                    result["compatible"] = ssg_engine in compatible_engines
-                    result["source"] = "platform"
-
-                    if not result["compatible"]:
-                        result["issues"].append(f"SSG engine '{ssg_engine}' not compatible with both providers")
-                        if compatible_engines:
-                            result["recommendations"].append(f"Compatible engines: {', '.join(sorted(compatible_engines))}")
+    def _platform_compatibility_check(self, cms_provider: str, ecommerce_provider: str,
+                                      ssg_engine: str) -> Optional[Dict[str, Any]]:
+        """Check compatibility using platform data, or None if unavailable."""
+        try:
+            # Use platform compatibility data
+            (cms_engines, cms_sorted), (ecommerce_engines, _) = self._get_compat_sets(
+                self._cms_stack_id(cms_provider), self._ecommerce_stack_id(ecommerce_provider)
+            )
+
+            if cms_engines and ecommerce_engines:
+                result = {
+                    "compatible": ssg_engine in cms_engines and ssg_engine in ecommerce_engines,
+                    "issues": [],
+                    "recommendations": [],
+                    "source": "platform"
+                }
+
+                if not result["compatible"]:
+                    result["issues"].append(f"SSG engine '{ssg_engine}' not compatible with both providers")
+                    # Filtering a pre-sorted tuple keeps the order without sorting
+                    compatible_engines = [engine for engine in cms_sorted if engine in ecommerce_engines]
+                    if compatible_engines:
+                        result["recommendations"].append(f"Compatible engines: {', '.join(compatible_engines)}")
+
+                logger.debug("Platform compatibility check: %s/%s/%s = %s",
+                             cms_provider, ecommerce_provider, ssg_engine, result["compatible"])
+                return result
 
-                    logger.debug(f"Platform compatibility check: {cms_provider}/{ecommerce_provider}/{ssg_engine} = {result['compatible']}")
-                    return result
+        except Exception as e:
+            logger.warning("Failed platform compatibility check: %s", e)
 
-            except Exception as e:
-                logger.warning(f"Failed platform compatibility check: {e}")
+        return None
 
-        # Fallback to parent method
+    def _static_compatibility_check(self, cms_provider: str, ecommerce_provider: str,
+                                    ssg_engine: str) -> Dict[str, Any]:
+        """Fallback to parent method for static compatibility check."""
         logger.debug("Using static compatibility check fallback")
-        result["compatible"] = self.is_combination_compatible(cms_provider, ecommerce_provider, ssg_engine)
-        result["source"] = "static"
+        result = {
+            "compatible": self.is_combination_compatible(cms_provider, ecommerce_provider, ssg_engine),
+            "issues": [],
+            "recommendations": [],
+            "source": "static"
+        }
 
         if not result["compatible"]:
             result["issues"].append("Combination not supported by static matrix")
 
         return result
 
-    def list_all_providers_with_source(self) -> Dict[str, Any]:
+    def list_all_providers_with_source(self) -> Mapping[str, Any]:
         """
         Get all providers with source information for diagnostics.
 
         Returns:
-            Provider information with full provider dictionaries and source details
+            Read-only provider information with full provider dictionaries and source details
         """
-        # Return full provider dictionaries instead of just lists of keys
-        return {
-            "cms": self.cms_providers,
-            "ecommerce": self.ecommerce_providers,
-            "ssg": self.ssg_engines,
-            "meta": {
-                "data_source": self._data_source,
-                "platform_available": is_platform_available(),
-                "total_combinations": len(self.cms_providers) * len(self.ecommerce_providers) * len(self.ssg_engines),
-                "last_updated": self._integration_status
-            }
-        }
\ No newline at end of file
+        self._ensure_platform()
+
+        if self._providers_with_source is None:
+            # Return read-only views of the full provider dictionaries
+            self._providers_with_source = MappingProxyType({
+                "cms": MappingProxyType(self.cms_providers),
+                "ecommerce": MappingProxyType(self.ecommerce_providers),
+                "ssg": MappingProxyType(self.ssg_engines),
+                "meta": MappingProxyType({
+                    "data_source": self._data_source,
+                    "platform_available": self._is_platform_available(),
+                    "total_combinations": self._total_combinations,
+                    "last_updated": self._get_integration_status()
+                })
+            })
+
+        return self._providers_with_source
@@ -8,25 +8,186 @@ implementation loading.
 Performance: 13,000x faster than loading CDK implementations
 """
 
+import heapq
+import json
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Mapping, Optional, Any, Tuple, TypedDict
 import logging
 
-# Add platform-infrastructure to path to access JsonProviderRegistry
-platform_infra_path = Path(__file__).parent.parent.parent.parent / "platform-infrastructure"
-sys.path.insert(0, str(platform_infra_path))
+from blackwell import CLI_CONFIG_DIR
 
 try:
-    from registry.json_provider_registry import JsonProviderRegistry, ProviderMetadata
-except ImportError as e:
-    logging.warning(f"Could not import JsonProviderRegistry: {e}")
-    # Fallback for development/testing
-    JsonProviderRegistry = None
-    ProviderMetadata = None
+    import orjson  # Optional faster JSON backend for the listing cache
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from registry.json_provider_registry import ProviderMetadata
 
 logger = logging.getLogger(__name__)
 
+# platform-infrastructure checkout that provides JsonProviderRegistry
+platform_infra_path = Path(__file__).parent.parent.parent.parent / "platform-infrastructure"
+
+# Rendered category listing persisted across CLI invocations, keyed by registry version
+LISTING_CACHE_PATH = Path(CLI_CONFIG_DIR).expanduser() / "cache" / "providers_by_category.json"
+
+# Minimal provider data used when JsonProviderRegistry is not available
+FALLBACK_PROVIDERS_PATH = Path(__file__).parent / "data" / "fallback_providers.json"
+
+# Memoized JsonProviderRegistry class (False once the import has failed)
+_json_registry_cls = None
+
+# Complexity levels ranked for "no more complex than" comparisons
+_COMPLEXITY_RANK: Dict[str, int] = {"simple": 1, "intermediate": 2, "advanced": 3}
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderSummary:
+    """Compact listing row for a provider."""
+    id: str
+    name: str
+    cost: str
+    complexity: str
+    features: Tuple[str, ...]
+    ssg_engines: Tuple[str, ...]
+    description: str = ""
+    tier_name: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProviderSummary":
+        """Create a summary from a listing dictionary."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            cost=data["cost"],
+            complexity=data["complexity"],
+            features=tuple(data.get("features", ())),
+            ssg_engines=tuple(data.get("ssg_engines", ())),
+            description=data.get("description", ""),
+            tier_name=data.get("tier_name", "")
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the listing dictionary format used by CLI commands."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "cost": self.cost,
+            "complexity": self.complexity,
+            "features": self.features,
+            "ssg_engines": self.ssg_engines,
+            "description": self.description,
+            "tier_name": self.tier_name
+        }
+
+
+def _load_json_registry_class():
+    """
+    Import JsonProviderRegistry on first use.
+
+    Deferring the sys.path change and import keeps module import free of
+    filesystem work for commands that never touch providers.
+
+    Returns:
+        JsonProviderRegistry class, or None if it is not available
+    """
+    global _json_registry_cls
+    if _json_registry_cls is None:
+        infra_path = str(platform_infra_path)
+        if infra_path not in sys.path:
+            sys.path.insert(0, infra_path)
+        try:
+            from registry.json_provider_registry import JsonProviderRegistry
+            _json_registry_cls = JsonProviderRegistry
+        except ImportError as e:
+            # Fallback for development/testing
+            logger.warning("Could not import JsonProviderRegistry: %s", e)
+            _json_registry_cls = False
+    return _json_registry_cls or None
+
+
+class ProviderRequirements(TypedDict, total=False):
+    """Requirements accepted by provider recommendations."""
+    category: str
+    features: List[str]
+    ssg_engine: str
+    max_budget: float
+    max_complexity: str
+
+
+def _score_rows(rows: List[int], matched_counts: List[int], required_count: int,
+                min_costs: List[float], complexities: List[int],
+                ssg_rows: FrozenSet[int], max_budget: Optional[float],
+                max_complexity_rank: Optional[int]) -> List[float]:
+    """
+    Calculate how well each indexed provider matches requirements (0-100).
+
+    Kept as a module-level function over plain typed columns so the hot loop has
+    no attribute lookups and stays friendly to ahead-of-time compilers.
+    """
+    scores: List[float] = []
+    for row, matched_count in zip(rows, matched_counts):
+        score: float = 50  # Base score
+
+        # Feature matching
+        if required_count:
+            score += (matched_count / required_count) * 30
+
+        # SSG engine support
+        if row in ssg_rows:
+            score += 15
+
+        # Budget consideration
+        if max_budget is not None and min_costs[row] <= max_budget:
+            score += 10
+
+        # Complexity matching
+        if max_complexity_rank is not None and complexities[row] <= max_complexity_rank:
+            score += 5
+
+        scores.append(min(100, max(0, score)))
+
+    return scores
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_only(value: Any) -> Any:
+    """Convert cached data to read-only form: dicts become views, lists become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def _load_fallback_data() -> Mapping[str, Any]:
+    """Load the bundled fallback provider data on first use (read-only, shared between calls)."""
+    return _read_only(json.loads(FALLBACK_PROVIDERS_PATH.read_text()))
+
+
+def _format_cost(min_cost: float, max_cost: float) -> str:
+    """Format a monthly cost range for display."""
+    return f"${min_cost}-${max_cost}/month" if max_cost > min_cost else f"${min_cost}/month"
+
 
 class FastProviderRegistry:
     """
@@ -41,12 +202,40 @@ class FastProviderRegistry:
         self._json_registry = None
         self._fallback_mode = False
 
-        if JsonProviderRegistry:
+        # Memoized listings, valid while their generation matches _generation, which
+        # advances whenever the registry reports a new data version
+        self._generation = 0
+        self._registry_data_version: Optional[str] = None
+        # Cached listings are handed out as read-only views shared between callers
+        self._category_cache: Optional[Tuple[int, Mapping[str, Tuple[Mapping[str, Any], ...]]]] = None
+        self._details_cache: Dict[str, Tuple[int, Optional[Mapping[str, Any]]]] = {}
+        self._summary_cache: Optional[Tuple[int, Mapping[str, Tuple[ProviderSummary, ...]]]] = None
+        self._search_cache: Optional[Tuple[int, List[Tuple[str, ProviderSummary, str]]]] = None
+
+        # Columnar provider index (one row per provider), rebuilt per generation
+        self._index_generation = -1
+        self._providers: List['ProviderMetadata'] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._provider_ids: List[str] = []
+        self._categories: List[str] = []
+        self._complexities: List[int] = []
+        self._min_costs: List[float] = []
+        self._max_costs: List[float] = []
+        self._cost_displays: List[str] = []
+        self._top_features: List[Tuple[str, ...]] = []
+
+        # Requested features and SSG engines, matched against each row on first request
+        self._feature_bits: Dict[str, int] = {}
+        self._feature_masks: List[int] = []
+        self._ssg_engine_rows: Dict[str, FrozenSet[int]] = {}
+
+        json_registry_cls = _load_json_registry_class()
+        if json_registry_cls:
             try:
-                self._json_registry = JsonProviderRegistry()
+                self._json_registry = json_registry_cls()
                 logger.info("FastProviderRegistry initialized with JsonProviderRegistry")
             except Exception as e:
-                logger.warning(f"Failed to initialize JsonProviderRegistry: {e}")
+                logger.warning("Failed to initialize JsonProviderRegistry: %s", e)
                 self._fallback_mode = True
         else:
             logger.warning("JsonProviderRegistry not available, using fallback mode")
@@ -56,12 +245,103 @@ class FastProviderRegistry:
         """Check if fast registry is available."""
         return self._json_registry is not None and not self._fallback_mode
 
-    def list_providers_by_category(self) -> Dict[str, List[Dict[str, Any]]]:
+    def invalidate_cache(self) -> None:
+        """Invalidate memoized listings after the underlying registry changes."""
+        self._generation += 1
+        self._category_cache = None
+        self._summary_cache = None
+        self._details_cache.clear()
+        self._search_cache = None
+
+    def _current_generation(self) -> int:
+        """Get the cache generation, invalidating memoized data when the registry version changes."""
+        version = self._registry_version()
+        if version != self._registry_data_version:
+            self._registry_data_version = version
+            self.invalidate_cache()
+        return self._generation
+
+    def _ensure_index(self) -> None:
+        """Build the columnar provider index once per cache generation."""
+        if self._index_generation == self._current_generation():
+            return
+
+        providers = list(self._json_registry.list_providers())
+        cost_ranges = [p.get_estimated_monthly_cost_range() for p in providers]
+
+        # Intern vocabulary strings so index keys share one object and compare by identity first
+        intern = sys.intern
+        provider_ids = [intern(p.provider_id) for p in providers]
+
+        self._providers = providers
+        self._row_by_id = {provider_id: row for row, provider_id in enumerate(provider_ids)}
+        self._provider_ids = provider_ids
+        self._categories = [intern(p.category) for p in providers]
+        self._complexities = [_COMPLEXITY_RANK.get(p.complexity_level, 2) for p in providers]
+        self._min_costs = [min_cost for min_cost, _ in cost_ranges]
+        self._max_costs = [max_cost for _, max_cost in cost_ranges]
+        self._cost_displays = [_format_cost(min_cost, max_cost) for min_cost, max_cost in cost_ranges]
+        self._top_features = [tuple(p.features[:3]) for p in providers]
+
+        self._feature_bits = {}
+        self._feature_masks = [0] * len(providers)
+        self._ssg_engine_rows = {}
+        self._index_generation = self._generation
+
+    def _cost_of(self, provider: 'ProviderMetadata') -> Tuple[float, float, str]:
+        """Get a provider's (min, max, display) monthly cost from the index."""
+        self._ensure_index()
+        row = self._row_by_id.get(provider.provider_id)
+        if row is not None:
+            return self._min_costs[row], self._max_costs[row], self._cost_displays[row]
+
+        min_cost, max_cost = provider.get_estimated_monthly_cost_range()
+        return min_cost, max_cost, _format_cost(min_cost, max_cost)
+
+    def _feature_bit(self, feature: str) -> int:
+        """
+        Get the bit for a requested feature, setting it in the mask of every provider that has it.
+
+        Rows are matched with the provider's own has_feature(), so case and alias
+        handling stay the registry's. Each feature is checked once per index generation.
+        """
+        bit = self._feature_bits.get(feature)
+        if bit is None:
+            bit = self._feature_bits[feature] = len(self._feature_bits)
+            flag = 1 << bit
+            masks = self._feature_masks
+            for row, provider in enumerate(self._providers):
+                if provider.has_feature(feature):
+                    masks[row] |= flag
+        return bit
+
+    def _rows_supporting_ssg_engine(self, ssg_engine: str) -> FrozenSet[int]:
+        """Get the rows whose supports_ssg_engine() accepts an engine, checked once per index generation."""
+        rows = self._ssg_engine_rows.get(ssg_engine)
+        if rows is None:
+            rows = self._ssg_engine_rows[ssg_engine] = frozenset(
+                row for row, provider in enumerate(self._providers) if provider.supports_ssg_engine(ssg_engine)
+            )
+        return rows
+
+    def _mask_of(self, features: List[str]) -> int:
+        """Encode requested features as a bitmask."""
+        mask = 0
+        for feature in features:
+            mask |= 1 << self._feature_bit(feature)
+        return mask
+
+    def _matched_features(self, required_features: List[str], matched_mask: int) -> List[str]:
+        """Decode a matched-feature bitmask back to names in requirement order."""
+        bits = self._feature_bits
+        return [f for f in required_features if matched_mask >> bits[f] & 1]
+
+    def list_providers_by_category(self) -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
         """
         List all providers organized by category with rich metadata.
 
         Returns:
-            Dictionary with categories as keys and provider info as values
+            Read-only mapping with categories as keys and provider info as values
             Format: {
                 "cms": [{"id": "tina", "name": "TinaCMS", "cost": "$0-125", ...}],
                 "ecommerce": [{"id": "shopify_basic", "name": "Shopify Basic", ...}]
@@ -70,34 +350,162 @@ class FastProviderRegistry:
         if not self.is_available():
             return self._fallback_provider_list()
 
+        if self._category_cache and self._category_cache[0] == self._current_generation():
+            return self._category_cache[1]
+
         try:
-            providers_by_category = self._json_registry.get_providers_by_category()
-            result = {}
-
-            for category, providers in providers_by_category.items():
-                result[category] = []
-                for provider in providers:
-                    min_cost, max_cost = provider.get_estimated_monthly_cost_range()
-                    cost_str = f"${min_cost}-${max_cost}/month" if max_cost > min_cost else f"${min_cost}/month"
-
-                    result[category].append({
-                        "id": provider.provider_id,
-                        "name": provider.provider_name,
-                        "cost": cost_str,
-                        "complexity": provider.complexity_level,
-                        "features": provider.features[:3],  # Top 3 features for display
-                        "ssg_engines": provider.supported_ssg_engines,
-                        "description": provider.description,
-                        "tier_name": provider.tier_name
-                    })
+            summaries = self.list_provider_summaries()
+            result = MappingProxyType({
+                category: tuple(MappingProxyType(summary.to_dict()) for summary in category_summaries)
+                for category, category_summaries in summaries.items()
+            })
 
+            self._category_cache = (self._generation, result)
             return result
 
         except Exception as e:
-            logger.error(f"Error in list_providers_by_category: {e}")
+            logger.error("Error in list_providers_by_category: %s", e)
             return self._fallback_provider_list()
 
-    def get_provider_details(self, provider_id: str) -> Optional[Dict[str, Any]]:
+    def list_provider_summaries(self) -> Mapping[str, Tuple[ProviderSummary, ...]]:
+        """
+        List all providers organized by category as compact summary rows.
+
+        Returns:
+            Read-only mapping with categories as keys and ProviderSummary rows as values
+        """
+        if not self.is_available():
+            return {
+                category: tuple(ProviderSummary.from_dict(p) for p in providers)
+                for category, providers in self._fallback_provider_list().items()
+            }
+
+        generation = self._current_generation()
+        if self._summary_cache and self._summary_cache[0] == generation:
+            return self._summary_cache[1]
+
+        version = self._registry_data_version
+        summaries = self._load_listing_from_disk(version)
+        if summaries is None:
+            summaries = self._build_provider_listing()
+            self._save_listing_to_disk(version, summaries)
+
+        summaries = MappingProxyType(summaries)
+        self._summary_cache = (self._generation, summaries)
+        return summaries
+
+    def _build_provider_listing(self) -> Dict[str, Tuple[ProviderSummary, ...]]:
+        """Render the category listing from registry metadata."""
+        self._ensure_index()
+        providers_by_category = self._json_registry.get_providers_by_category()
+        return {
+            category: tuple(self._make_summary(provider) for provider in providers)
+            for category, providers in providers_by_category.items()
+        }
+
+    def _make_summary(self, provider: 'ProviderMetadata') -> ProviderSummary:
+        """Build the listing row for a provider."""
+        _, _, cost_str = self._cost_of(provider)
+        row = self._row_by_id.get(provider.provider_id)
+        top_features = self._top_features[row] if row is not None else tuple(provider.features[:3])
+
+        return ProviderSummary(
+            id=provider.provider_id,
+            name=provider.provider_name,
+            cost=cost_str,
+            complexity=provider.complexity_level,
+            features=top_features,  # Top 3 features for display
+            ssg_engines=tuple(provider.supported_ssg_engines),
+            description=provider.description,
+            tier_name=provider.tier_name
+        )
+
+    def _registry_version(self) -> Optional[str]:
+        """Get the registry data version used to key the on-disk listing cache."""
+        try:
+            stats = self._json_registry.get_cache_stats()
+        except Exception:
+            return None
+        version = stats.get("version") or stats.get("cache_hash")
+        return str(version) if version else None
+
+    def _load_listing_from_disk(self, version: Optional[str]) -> Optional[Dict[str, Tuple[ProviderSummary, ...]]]:
+        """Load a listing persisted by a previous CLI invocation for the same registry version."""
+        if not version or not LISTING_CACHE_PATH.exists():
+            return None
+
+        try:
+            cached = _load_json(LISTING_CACHE_PATH.read_bytes())
+            if cached.get("version") != version:
+                return None
+            logger.debug("Loaded provider listing from cache: %s", LISTING_CACHE_PATH)
+            return {
+                category: tuple(ProviderSummary.from_dict(p) for p in providers)
+                for category, providers in cached["providers"].items()
+            }
+        except Exception as e:
+            logger.debug("Ignoring unreadable provider listing cache: %s", e)
+            return None
+
+    def _save_listing_to_disk(self, version: Optional[str], listing: Dict[str, Tuple[ProviderSummary, ...]]) -> None:
+        """Persist the rendered listing for subsequent CLI invocations."""
+        if not version:
+            return
+
+        try:
+            LISTING_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            providers = {
+                category: [summary.to_dict() for summary in summaries]
+                for category, summaries in listing.items()
+            }
+            LISTING_CACHE_PATH.write_bytes(_dump_json({"version": version, "providers": providers}))
+        except Exception as e:
+            logger.debug("Could not write provider listing cache: %s", e)
+
+    def _search_entries(self) -> List[Tuple[str, ProviderSummary, str]]:
+        """Get (category, summary, lowercased searchable text) rows for the current listing."""
+        if self._search_cache and self._search_cache[0] == self._current_generation():
+            return self._search_cache[1]
+
+        entries = []
+        for category, summaries in self.list_provider_summaries().items():
+            for summary in summaries:
+                # Search in name, features, description
+                searchable_text = " ".join([
+                    summary.name,
+                    summary.description,
+                    " ".join(summary.features)
+                ]).lower()
+                entries.append((category, summary, searchable_text))
+
+        self._search_cache = (self._generation, entries)
+        return entries
+
+    def search_providers(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Search providers by name, feature, or description.
+
+        Args:
+            query: Case-insensitive substring to look for
+
+        Returns:
+            Matching providers with their category included
+        """
+        if not self.is_available():
+            return []
+
+        try:
+            query_lower = query.lower()
+            return [
+                {**summary.to_dict(), "category": category}
+                for category, summary, searchable_text in self._search_entries()
+                if query_lower in searchable_text
+            ]
+        except Exception as e:
+            logger.error("Error searching providers for %r: %s", query, e)
+            return []
+
+    def get_provider_details(self, provider_id: str) -> Optional[Mapping[str, Any]]:
         """
         Get detailed information about a specific provider.
 
@@ -105,55 +513,116 @@ class FastProviderRegistry:
             provider_id: Provider identifier (e.g., "tina", "shopify_basic")
 
         Returns:
-            Detailed provider information or None if not found
+            Read-only detailed provider information or None if not found
         """
         if not self.is_available():
             return self._fallback_provider_details(provider_id)
 
-        try:
-            metadata = self._json_registry.get_provider_metadata(provider_id)
-            if not metadata:
-                return None
+        cached = self._details_cache.get(provider_id)
+        if cached and cached[0] == self._current_generation():
+            return cached[1]
 
-            min_cost, max_cost = metadata.get_estimated_monthly_cost_range()
+        try:
+            details = _read_only(self._build_provider_details(provider_id))
 
-            return {
-                "id": metadata.provider_id,
-                "name": metadata.provider_name,
-                "category": metadata.category,
-                "tier_name": metadata.tier_name,
-                "description": metadata.description,
-                "features": metadata.features,
-                "supported_ssg_engines": metadata.supported_ssg_engines,
-                "integration_modes": metadata.integration_modes,
-                "complexity_level": metadata.complexity_level,
-                "target_market": metadata.target_market,
-                "use_cases": metadata.use_cases,
-                "cost_range": {
-                    "min": min_cost,
-                    "max": max_cost,
-                    "display": f"${min_cost}-${max_cost}/month" if max_cost > min_cost else f"${min_cost}/month"
-                },
-                "technical_requirements": metadata.technical_requirements,
-                "performance_characteristics": metadata.performance_characteristics,
-                "compatibility": metadata.compatibility,
-                "documentation": metadata.documentation
-            }
+            # Ids outside the index (typos, aliases the registry resolves) are still
+            # looked up but not memoized, so arbitrary input cannot grow the cache
+            self._ensure_index()
+            if provider_id in self._row_by_id:
+                self._details_cache[provider_id] = (self._generation, details)
+            return details
 
         except Exception as e:
-            logger.error(f"Error getting provider details for {provider_id}: {e}")
+            logger.error("Error getting provider details for %s: %s", provider_id, e)
             return self._fallback_provider_details(provider_id)
 
+    def _build_provider_details(self, provider_id: str) -> Optional[Dict[str, Any]]:
+        """Build the detailed information dictionary for a provider."""
+        metadata = self._json_registry.get_provider_metadata(provider_id)
+        if not metadata:
+            return None
+
+        min_cost, max_cost, cost_display = self._cost_of(metadata)
+
+        return {
+            "id": metadata.provider_id,
+            "name": metadata.provider_name,
+            "category": metadata.category,
+            "tier_name": metadata.tier_name,
+            "description": metadata.description,
+            "features": metadata.features,
+            "supported_ssg_engines": metadata.supported_ssg_engines,
+            "integration_modes": metadata.integration_modes,
+            "complexity_level": metadata.complexity_level,
+            "target_market": metadata.target_market,
+            "use_cases": metadata.use_cases,
+            "cost_range": {
+                "min": min_cost,
+                "max": max_cost,
+                "display": cost_display
+            },
+            "technical_requirements": metadata.technical_requirements,
+            "performance_characteristics": metadata.performance_characteristics,
+            "compatibility": metadata.compatibility,
+            "documentation": metadata.documentation
+        }
+
+    def _query_rows(self, feature: Optional[str] = None, ssg_engine: Optional[str] = None,
+                    max_budget: Optional[float] = None, category: Optional[str] = None) -> List[int]:
+        """Get index rows matching all given filters, in registry order."""
+        self._ensure_index()
+
+        candidates = None
+        if feature is not None:
+            bit = self._feature_bit(feature)
+            candidates = {row for row, mask in enumerate(self._feature_masks) if mask >> bit & 1}
+        if ssg_engine is not None:
+            ssg_rows = self._rows_supporting_ssg_engine(ssg_engine)
+            candidates = set(ssg_rows) if candidates is None else candidates & ssg_rows
+
+        rows = range(len(self._provider_ids)) if candidates is None else sorted(candidates)
+        if category is not None:
+            categories = self._categories
+            rows = [row for row in rows if categories[row] == category]
+        if max_budget is not None:
+            min_costs = self._min_costs
+            rows = [row for row in rows if min_costs[row] <= max_budget]
+        return list(rows)
+
+    def query(self, *, feature: Optional[str] = None, ssg_engine: Optional[str] = None,
+              max_budget: Optional[float] = None, category: Optional[str] = None) -> List[str]:
+        """
+        Find providers matching every given filter in a single pass.
+
+        Args:
+            feature: Feature the provider must support
+            ssg_engine: SSG engine the provider must support
+            max_budget: Maximum acceptable minimum monthly cost
+            category: Provider category ("cms" or "ecommerce")
+
+        Returns:
+            Matching provider IDs in registry order
+        """
+        if not self.is_available():
+            return []
+
+        try:
+            rows = self._query_rows(feature, ssg_engine, max_budget, category)
+            return [self._provider_ids[row] for row in rows]
+        except Exception as e:
+            logger.error("Error querying providers: %s", e)
+            return []
+
     def find_providers_by_feature(self, feature: str) -> List[str]:
         """Find all providers that support a specific feature."""
         if not self.is_available():
             return []
 
         try:
-            providers = self._json_registry.list_providers(feature=feature)
-            return [p.provider_id for p in providers]
+            rows = self._query_rows(feature=feature)
+            return [self._provider_ids[row] for row in rows]
         except Exception as e:
-            logger.error(f"Error finding providers by feature {feature}: {e}")
+            logger.error("Error finding providers by feature %s: %s", feature, e)
             return []
 
     def find_providers_by_ssg_engine(self, ssg_engine: str) -> List[str]:
@@ -162,10 +631,10 @@ class FastProviderRegistry:
             return []
 
         try:
-            providers = self._json_registry.list_providers(ssg_engine=ssg_engine)
-            return [p.provider_id for p in providers]
+            rows = self._query_rows(ssg_engine=ssg_engine)
+            return [self._provider_ids[row] for row in rows]
         except Exception as e:
-            logger.error(f"Error finding providers by SSG engine {ssg_engine}: {e}")
+            logger.error("Error finding providers by SSG engine %s: %s", ssg_engine, e)
             return []
 
     def find_providers_by_budget(self, max_budget: float) -> Dict[str, List[str]]:
@@ -175,19 +644,17 @@ class FastProviderRegistry:
 
         try:
             result = {"cms": [], "ecommerce": []}
-            all_providers = self._json_registry.list_providers()
 
-            for provider in all_providers:
-                min_cost, max_cost = provider.get_estimated_monthly_cost_range()
-                if min_cost <= max_budget:
-                    result[provider.category].append(provider.provider_id)
+            for row in self._query_rows(max_budget=max_budget):
+                result[self._categories[row]].append(self._provider_ids[row])
 
             return result
         except Exception as e:
-            logger.error(f"Error finding providers by budget {max_budget}: {e}")
+            logger.error("Error finding providers by budget %s: %s", max_budget, e)
             return {"cms": [], "ecommerce": []}
 
-    def get_provider_recommendations(self, requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def get_provider_recommendations(self, requirements: ProviderRequirements,
+                                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get provider recommendations based on requirements.
 
@@ -200,22 +667,58 @@ class FastProviderRegistry:
                     "max_budget": 100,
                     "max_complexity": "intermediate"
                 }
+            limit: Only return the best-scoring N providers (default: every match)
 
         Returns:
-            List of recommended providers with scores and explanations
+            List of recommended providers with scores and explanations, highest
+            score first with ties in registry order
         """
         if not self.is_available():
             return []
 
         try:
+            self._ensure_index()
             matches = self._json_registry.find_providers_for_requirements(requirements)
+            # Matches come from the same registry, so every one has an index row
+            rows = [self._row_by_id[p.provider_id] for p in matches if p.provider_id in self._row_by_id]
+
+            required_features = requirements.get("features", [])
+            required_mask = self._mask_of(required_features)
+            matched_masks = [self._feature_masks[row] & required_mask for row in rows]
+
+            # A repeated feature counts once per mention, as it did with has_feature()
+            if len(set(required_features)) == len(required_features):
+                matched_counts = [matched_mask.bit_count() for matched_mask in matched_masks]
+            else:
+                matched_counts = [len(self._matched_features(required_features, matched_mask))
+                                  for matched_mask in matched_masks]
+
+            # Bind requirement fields once per call
+            ssg_engine = requirements.get("ssg_engine")
+            max_budget = requirements.get("max_budget")
+            max_complexity = requirements.get("max_complexity")
+            ssg_rows = self._rows_supporting_ssg_engine(ssg_engine) if ssg_engine is not None else frozenset()
+            max_complexity_rank = _COMPLEXITY_RANK.get(max_complexity, 2) if max_complexity is not None else None
+
+            # Calculate match scores for all candidates in one pass
+            scores = _score_rows(rows, matched_counts, len(required_features),
+                                 self._min_costs, self._complexities,
+                                 ssg_rows, max_budget, max_complexity_rank)
+
+            # Rank by score with ties in registry order, so a limit returns exactly the
+            # first rows of the full ranking; only returned rows get detail and reason strings
+            selected = range(len(rows))
+            if limit is None:
+                selected = sorted(selected, key=lambda i: (-scores[i], i))
+            else:
+                selected = heapq.nsmallest(max(0, limit), selected, key=lambda i: (-scores[i], i))
 
             recommendations = []
-            for provider in matches:
-                min_cost, max_cost = provider.get_estimated_monthly_cost_range()
-
-                # Calculate match score based on requirements
-                score = self._calculate_match_score(provider, requirements)
+            for i in selected:
+                row, matched_mask, score = rows[i], matched_masks[i], scores[i]
+                provider = self._providers[row]
+                min_cost, max_cost = self._min_costs[row], self._max_costs[row]
+                matched_features = self._matched_features(required_features, matched_mask)
 
                 recommendations.append({
                     "provider_id": provider.provider_id,
@@ -224,114 +727,51 @@ class FastProviderRegistry:
                     "match_score": score,
                     "cost_range": f"${min_cost}-${max_cost}/month",
                     "complexity": provider.complexity_level,
-                    "matched_features": [f for f in requirements.get("features", []) if provider.has_feature(f)],
+                    "matched_features": matched_features,
                     "supported_ssg": provider.supported_ssg_engines,
-                    "why_recommended": self._generate_recommendation_reason(provider, requirements)
+                    "why_recommended": self._generate_recommendation_reason(
+                        row, matched_features, ssg_engine, ssg_rows, max_budget, max_complexity
+                    )
                 })
 
             return recommendations
 
         except Exception as e:
-            logger.error(f"Error getting provider recommendations: {e}")
+            logger.error("Error getting provider recommendations: %s", e)
             return []
 
-    def _calculate_match_score(self, provider: 'ProviderMetadata', requirements: Dict[str, Any]) -> int:
-        """Calculate how well a provider matches requirements (0-100)."""
-        score = 50  # Base score
-
-        # Feature matching
-        required_features = requirements.get("features", [])
-        if required_features:
-            matched = sum(1 for f in required_features if provider.has_feature(f))
-            score += (matched / len(required_features)) * 30
-
-        # SSG engine support
-        if "ssg_engine" in requirements:
-            if provider.supports_ssg_engine(requirements["ssg_engine"]):
-                score += 15
-
-        # Budget consideration
-        if "max_budget" in requirements:
-            min_cost, max_cost = provider.get_estimated_monthly_cost_range()
-            if min_cost <= requirements["max_budget"]:
-                score += 10
-
-        # Complexity matching
-        complexity_scores = {"simple": 1, "intermediate": 2, "advanced": 3}
-        if "max_complexity" in requirements:
-            req_complexity = complexity_scores.get(requirements["max_complexity"], 2)
-            provider_complexity = complexity_scores.get(provider.complexity_level, 2)
-            if provider_complexity <= req_complexity:
-                score += 5
-
-        return min(100, max(0, score))
-
-    def _generate_recommendation_reason(self, provider: 'ProviderMetadata', requirements: Dict[str, Any]) -> str:
+    def _generate_recommendation_reason(self, row: int, matched_features: List[str],
+                                        ssg_engine: Optional[str], ssg_rows: FrozenSet[int],
+                                        max_budget: Optional[float], max_complexity: Optional[str]) -> str:
         """Generate human-readable reason for recommendation."""
         reasons = []
 
         # Feature matches
-        required_features = requirements.get("features", [])
-        if required_features:
-            matched = [f for f in required_features if provider.has_feature(f)]
-            if matched:
-                reasons.append(f"Supports {', '.join(matched)}")
+        if matched_features:
+            reasons.append(f"Supports {', '.join(matched_features)}")
 
         # SSG compatibility
-        if "ssg_engine" in requirements and provider.supports_ssg_engine(requirements["ssg_engine"]):
-            reasons.append(f"Excellent {requirements['ssg_engine']} compatibility")
+        if row in ssg_rows:
+            reasons.append(f"Excellent {ssg_engine} compatibility")
 
         # Budget fit
-        if "max_budget" in requirements:
-            min_cost, max_cost = provider.get_estimated_monthly_cost_range()
-            if min_cost <= requirements["max_budget"]:
-                reasons.append(f"Within ${requirements['max_budget']} budget")
+        if max_budget is not None and self._min_costs[row] <= max_budget:
+            reasons.append(f"Within ${max_budget} budget")
 
         # Complexity match
-        if "max_complexity" in requirements:
-            if provider.complexity_level == requirements["max_complexity"]:
-                reasons.append(f"Perfect {provider.complexity_level} complexity match")
+        complexity_level = self._providers[row].complexity_level
+        if max_complexity is not None and complexity_level == max_complexity:
+            reasons.append(f"Perfect {complexity_level} complexity match")
 
         return "; ".join(reasons) if reasons else "Good general match"
 
-    def _fallback_provider_list(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _fallback_provider_list(self) -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
         """Fallback provider list when JsonProviderRegistry is not available."""
-        return {
-            "cms": [
-                {"id": "tina", "name": "TinaCMS", "cost": "$0-125/month", "complexity": "intermediate",
-                 "features": ["visual_editing", "git_based"], "ssg_engines": ["nextjs", "astro", "gatsby"]},
-                {"id": "sanity", "name": "Sanity CMS", "cost": "$65-280/month", "complexity": "advanced",
-                 "features": ["structured_content", "api_based"], "ssg_engines": ["astro", "gatsby", "nextjs"]},
-            ],
-            "ecommerce": [
-                {"id": "shopify_basic", "name": "Shopify Basic", "cost": "$80-125/month", "complexity": "intermediate",
-                 "features": ["ecommerce_platform", "product_sync"], "ssg_engines": ["eleventy", "astro", "nextjs"]},
-            ]
-        }
+        return _load_fallback_data()["providers"]
 
-    def _fallback_provider_details(self, provider_id: str) -> Optional[Dict[str, Any]]:
+    def _fallback_provider_details(self, provider_id: str) -> Optional[Mapping[str, Any]]:
         """Fallback provider details when JsonProviderRegistry is not available."""
-        fallback_data = {
-            "tina": {
-                "id": "tina", "name": "TinaCMS", "category": "cms",
-                "description": "Visual editing with git workflow",
-                "features": ["visual_editing", "git_based", "real_time_preview"],
-                "cost_range": {"min": 0, "max": 125, "display": "$0-125/month"}
-            },
-            "sanity": {
-                "id": "sanity", "name": "Sanity CMS", "category": "cms",
-                "description": "Structured content with real-time APIs",
-                "features": ["structured_content", "api_based", "real_time_preview"],
-                "cost_range": {"min": 65, "max": 280, "display": "$65-280/month"}
-            },
-            "shopify_basic": {
-                "id": "shopify_basic", "name": "Shopify Basic", "category": "ecommerce",
-                "description": "Performance e-commerce with flexible SSG",
-                "features": ["ecommerce_platform", "product_sync", "inventory_tracking"],
-                "cost_range": {"min": 80, "max": 125, "display": "$80-125/month"}
-            }
-        }
-        return fallback_data.get(provider_id)
+        return _load_fallback_data()["details"].get(provider_id)
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics for the registry."""
@@ -348,57 +788,51 @@ class FastProviderRegistry:
             return {"status": "error", "error": str(e), "registry_available": False}
 
 
-# Global instance for CLI use
-fast_provider_registry = FastProviderRegistry()
+# Global instance for CLI use, created on first access
+_fast_provider_registry: Optional[FastProviderRegistry] = None
+
+
+def get_fast_provider_registry() -> FastProviderRegistry:
+    """Get the shared FastProviderRegistry, creating it on first use."""
+    global _fast_provider_registry
+    if _fast_provider_registry is None:
+        _fast_provider_registry = FastProviderRegistry()
+    return _fast_provider_registry
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from ... import fast_provider_registry` working without eager loading
+    if name == "fast_provider_registry":
+        return get_fast_provider_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # CLI-friendly convenience functions
-def list_cms_providers() -> List[Dict[str, Any]]:
+def list_cms_providers() -> Tuple[Mapping[str, Any], ...]:
     """List all CMS providers with metadata."""
-    providers = fast_provider_registry.list_providers_by_category()
-    return providers.get("cms", [])
+    providers = get_fast_provider_registry().list_providers_by_category()
+    return providers.get("cms", ())
 
 
-def list_ecommerce_providers() -> List[Dict[str, Any]]:
+def list_ecommerce_providers() -> Tuple[Mapping[str, Any], ...]:
     """List all e-commerce providers with metadata."""
-    providers = fast_provider_registry.list_providers_by_category()
-    return providers.get("ecommerce", [])
+    providers = get_fast_provider_registry().list_providers_by_category()
+    return providers.get("ecommerce", ())
 
 
 def search_providers(query: str) -> List[Dict[str, Any]]:
     """Search providers by name, feature, or description."""
-    if not fast_provider_registry.is_available():
-        return []
-
-    results = []
-    all_providers = fast_provider_registry.list_providers_by_category()
-
-    query_lower = query.lower()
+    return get_fast_provider_registry().search_providers(query)
 
-    for category, providers in all_providers.items():
-        for provider in providers:
-            # Search in name, features, description
-            searchable_text = " ".join([
-                provider.get("name", ""),
-                provider.get("description", ""),
-                " ".join(provider.get("features", []))
-            ]).lower()
 
-            if query_lower in searchable_text:
-                provider["category"] = category
-                results.append(provider)
-
-    return results
-
-
-def get_provider_by_id(provider_id: str) -> Optional[Dict[str, Any]]:
+def get_provider_by_id(provider_id: str) -> Optional[Mapping[str, Any]]:
     """Get provider details by ID."""
-    return fast_provider_registry.get_provider_details(provider_id)
+    return get_fast_provider_registry().get_provider_details(provider_id)
 
 
-def recommend_providers(requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+def recommend_providers(requirements: ProviderRequirements) -> List[Dict[str, Any]]:
     """Get provider recommendations based on requirements."""
-    return fast_provider_registry.get_provider_recommendations(requirements)
+    return get_fast_provider_registry().get_provider_recommendations(requirements)
 
 
 # Example usage
@@ -406,6 +840,8 @@ if __name__ == "__main__":
     # Demo the fast registry
     import time
 
+    fast_provider_registry = get_fast_provider_registry()
+
     print("🚀 FastProviderRegistry Demo")
     print(f"Registry available: {fast_provider_registry.is_available()}")
 
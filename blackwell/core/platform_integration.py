@@ -13,38 +13,136 @@ Key Features:
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
-# Import registry from blackwell-core
-try:
-    from blackwell_core.registry import default_registry
-    REGISTRY_AVAILABLE = True
-    logger = logging.getLogger(__name__)
-    logger.info("S3 Provider Registry available")
-except ImportError as e:
-    default_registry = None
-    REGISTRY_AVAILABLE = False
-    logger = logging.getLogger(__name__)
-    logger.debug(f"S3 Provider Registry unavailable: {e}")
-
-# Safe Import Pattern - CLI works even without platform-infrastructure
-try:
-    from shared.factories.platform_stack_factory import PlatformStackFactory
-    PLATFORM_AVAILABLE = True
-    logger.info("Platform integration available: PlatformStackFactory imported successfully")
-except ImportError as e:
-    PlatformStackFactory = None
-    PLATFORM_AVAILABLE = False
-    logger.debug(f"Platform integration unavailable: {e}")
+logger = logging.getLogger(__name__)
 
 
+# Safe Import Pattern - CLI works even without blackwell-core or platform-infrastructure.
+# Both imports are deferred to first use so commands that never touch platform data
+# don't pay for them at startup.
+
+@lru_cache(maxsize=None)
+def _get_registry() -> Optional[Any]:
+    """Import the S3 Provider Registry from blackwell-core on first use."""
+    try:
+        from blackwell_core.registry import default_registry
+        logger.info("S3 Provider Registry available")
+        return default_registry
+    except ImportError as e:
+        logger.debug("S3 Provider Registry unavailable: %s", e)
+        return None
+
+
+@lru_cache(maxsize=None)
+def _get_factory() -> Optional[Any]:
+    """Import PlatformStackFactory from platform-infrastructure on first use."""
+    try:
+        from shared.factories.platform_stack_factory import PlatformStackFactory
+        logger.info("Platform integration available: PlatformStackFactory imported successfully")
+        return PlatformStackFactory
+    except ImportError as e:
+        logger.debug("Platform integration unavailable: %s", e)
+        return None
+
+
+def __getattr__(name: str) -> Any:
+    # Backward-compatible module attributes, resolved lazily
+    if name == "default_registry":
+        return _get_registry()
+    if name == "REGISTRY_AVAILABLE":
+        return _get_registry() is not None
+    if name == "PlatformStackFactory":
+        return _get_factory()
+    if name == "PLATFORM_AVAILABLE":
+        return _get_factory() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Upper bound on concurrent registry requests when fetching stack metadata
+REGISTRY_FETCH_WORKERS = 8
+
+# Stale-while-revalidate windows for get_platform_metadata() (seconds)
+METADATA_FRESH_TTL = 60
+METADATA_STALE_TTL = 3600
+
+_metadata_cache: Dict[str, Any] = {
+    "data": None, "source": "none", "version": None, "timestamp": 0.0, "refreshing": False
+}
+_metadata_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
 def is_platform_available() -> bool:
-    """Check if platform integration is available."""
-    return PLATFORM_AVAILABLE and PlatformStackFactory is not None
+    """Check if platform integration is available (fixed once the import is resolved)."""
+    return _get_factory() is not None
+
+
+def _fetch_registry_bundle(default_registry: Any) -> Dict[str, Any]:
+    """
+    Fetch all stack metadata in a single bundled registry request.
 
+    Registry clients that publish a consolidated metadata bundle expose
+    get_all_stack_metadata_sync(); older clients don't, in which case the
+    caller falls back to per-stack requests.
 
-def get_platform_metadata() -> Dict[str, Any]:
+    Returns:
+        Stack metadata keyed by stack type, or empty dict if no bundle is available
+    """
+    fetch_all = getattr(default_registry, "get_all_stack_metadata_sync", None)
+    if fetch_all is None:
+        return {}
+
+    try:
+        return fetch_all() or {}
+    except Exception as e:
+        logger.debug("Registry metadata bundle unavailable, fetching stacks individually: %s", e)
+        return {}
+
+
+def _fetch_registry_stacks(default_registry: Any, stack_types: List[str]) -> Dict[str, Any]:
+    """
+    Fetch metadata for several stacks from the registry concurrently.
+
+    Each fetch is an independent network request, so overlapping them turns
+    N sequential round trips into roughly one.
+
+    Args:
+        default_registry: Registry client to fetch from
+        stack_types: Stack type identifiers, in manifest order
+
+    Returns:
+        Metadata for every stack that was fetched successfully, in manifest order
+    """
+    fetch = default_registry.get_stack_metadata_sync
+
+    def fetch_stack(stack_type: str) -> Tuple[bool, Any]:
+        try:
+            return True, fetch(stack_type)
+        except Exception as e:
+            logger.warning("Failed to fetch %s from registry: %s", stack_type, e)
+            return False, None
+
+    workers = min(REGISTRY_FETCH_WORKERS, len(stack_types))
+    if workers <= 1:
+        results = [fetch_stack(stack_type) for stack_type in stack_types]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch_stack, stack_types))
+
+    return {
+        stack_type: stack_data
+        for stack_type, (fetched, stack_data) in zip(stack_types, results)
+        if fetched
+    }
+
+
+def get_platform_metadata(force_refresh: bool = False) -> Dict[str, Any]:
     """
     Get platform metadata with multi-tier fallback system.
 
@@ -53,47 +151,157 @@ def get_platform_metadata() -> Dict[str, Any]:
     2. PlatformStackFactory (direct platform access)
     3. Empty dict (graceful degradation)
 
+    Results are cached stale-while-revalidate: fresh metadata is returned
+    directly, stale metadata is returned immediately while a background thread
+    refreshes it, and only a missing or expired cache blocks on a fetch.
+
+    Args:
+        force_refresh: Always fetch from the sources, bypassing the cache
+
     Returns:
         Platform metadata dictionary, or empty dict if unavailable
     """
+    metadata, _ = _fetch_metadata(force_refresh)
+    return metadata
+
+
+def _fetch_metadata(force_refresh: bool = False) -> Tuple[Dict[str, Any], str]:
+    """
+    Get platform metadata together with the source it came from.
+
+    Args:
+        force_refresh: Always fetch from the sources, bypassing the cache
+
+    Returns:
+        Tuple of (metadata, source) where source is "registry",
+        "platform_factory" or "none"
+    """
+    if not force_refresh:
+        with _metadata_lock:
+            cached = _metadata_cache["data"]
+            age = time.monotonic() - _metadata_cache["timestamp"]
+
+            if cached is not None and age < METADATA_FRESH_TTL:
+                return cached, _metadata_cache["source"]
+
+            if cached is not None and age < METADATA_STALE_TTL:
+                if not _metadata_cache["refreshing"]:
+                    _metadata_cache["refreshing"] = True
+                    threading.Thread(target=_refresh_platform_metadata, daemon=True).start()
+                return cached, _metadata_cache["source"]
+
+    return _refresh_platform_metadata()
+
+
+def _refresh_platform_metadata() -> Tuple[Dict[str, Any], str]:
+    """Fetch platform metadata and update the cache, keeping stale data on failure."""
+    try:
+        metadata, source = _load_platform_metadata()
+    except Exception as e:
+        logger.warning("Failed to refresh platform metadata: %s", e)
+        metadata, source = {}, "none"
+
+    with _metadata_lock:
+        _metadata_cache["refreshing"] = False
+        if metadata:
+            _metadata_cache["data"] = metadata
+            _metadata_cache["source"] = source
+            _metadata_cache["version"] = _source_version(source)
+            _metadata_cache["timestamp"] = time.monotonic()
+        elif _metadata_cache["data"] is not None:
+            logger.debug("Platform metadata sources failed, serving stale metadata")
+            return _metadata_cache["data"], _metadata_cache["source"]
+
+    return metadata, source
+
+
+def _source_version(source: str) -> Optional[str]:
+    """Get the data version the registry reports in its cache stats, if any."""
+    if source != "registry":
+        return None
+
+    try:
+        stats = _get_registry().get_cache_stats()
+    except Exception as e:
+        logger.debug("Registry cache stats unavailable: %s", e)
+        return None
+
+    version = stats.get("version") or stats.get("cache_hash")
+    return str(version) if version else None
+
+
+def get_registry_version() -> Optional[str]:
+    """
+    Get the data version the registry currently reports, without fetching metadata.
+
+    Returns:
+        Version string, or None if the registry is unavailable or reports no version
+    """
+    if _get_registry() is None:
+        return None
+    return _source_version("registry")
+
+
+def get_platform_metadata_version(platform_metadata: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the source-reported version of metadata returned by get_platform_metadata().
+
+    Args:
+        platform_metadata: Metadata previously returned by get_platform_metadata()
+
+    Returns:
+        Version string, or None if the source reports no version or the metadata
+        has since been replaced by a refresh
+    """
+    with _metadata_lock:
+        if platform_metadata is _metadata_cache["data"]:
+            return _metadata_cache["version"]
+    return None
+
+
+def _load_platform_metadata() -> Tuple[Dict[str, Any], str]:
+    """Fetch platform metadata and its source from the first available source."""
 
     # Primary: Try S3 Provider Registry
-    if REGISTRY_AVAILABLE and default_registry:
+    default_registry = _get_registry()
+    if default_registry:
         try:
             logger.debug("Attempting to fetch metadata from S3 Provider Registry...")
 
-            # Get manifest to understand available stacks
-            manifest = default_registry.get_manifest_sync()
-            metadata = {}
+            # One bundled request when the registry offers it
+            metadata = _fetch_registry_bundle(default_registry)
 
-            # Fetch all stack metadata from registry
-            for category, stacks in manifest.get("stacks", {}).items():
-                for stack_type in stacks:
-                    try:
-                        stack_data = default_registry.get_stack_metadata_sync(stack_type)
-                        metadata[stack_type] = stack_data
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch {stack_type} from registry: {e}")
+            if not metadata:
+                # Get manifest to understand available stacks
+                manifest = default_registry.get_manifest_sync()
+                stack_types = [
+                    stack_type
+                    for stacks in manifest.get("stacks", {}).values()
+                    for stack_type in stacks
+                ]
+
+                # Fetch all stack metadata from registry
+                metadata = _fetch_registry_stacks(default_registry, stack_types)
 
             if metadata:
-                logger.info(f"✅ Retrieved registry metadata: {len(metadata)} stack types")
-                return metadata
+                logger.info("✅ Retrieved registry metadata: %d stack types", len(metadata))
+                return metadata, "registry"
 
         except Exception as e:
-            logger.warning(f"S3 Provider Registry failed: {e}, falling back to platform factory")
+            logger.warning("S3 Provider Registry failed: %s, falling back to platform factory", e)
 
     # Secondary: Try PlatformStackFactory
     if is_platform_available():
         try:
-            metadata = PlatformStackFactory.STACK_METADATA
-            logger.info(f"Retrieved platform factory metadata: {len(metadata)} stack types")
-            return metadata
+            metadata = _get_factory().STACK_METADATA
+            logger.info("Retrieved platform factory metadata: %d stack types", len(metadata))
+            return metadata, "platform_factory"
         except Exception as e:
-            logger.warning(f"Failed to retrieve platform metadata: {e}")
+            logger.warning("Failed to retrieve platform metadata: %s", e)
 
     # Tertiary: Graceful degradation
     logger.warning("All metadata sources unavailable - using empty metadata")
-    return {}
+    return {}, "none"
 
 
 def get_platform_recommendations(requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -108,11 +316,11 @@ def get_platform_recommendations(requirements: Dict[str, Any]) -> List[Dict[str,
     """
     if is_platform_available():
         try:
-            recommendations = PlatformStackFactory.get_recommendations(requirements)
-            logger.debug(f"Retrieved {len(recommendations)} platform recommendations")
+            recommendations = _get_factory().get_recommendations(requirements)
+            logger.debug("Retrieved %d platform recommendations", len(recommendations))
             return recommendations
         except Exception as e:
-            logger.warning(f"Failed to get platform recommendations: {e}")
+            logger.warning("Failed to get platform recommendations: %s", e)
             return []
     else:
         logger.debug("Platform recommendations unavailable")
@@ -132,11 +340,11 @@ def estimate_platform_cost(stack_type: str, ssg_engine: Optional[str] = None) ->
     """
     if is_platform_available():
         try:
-            cost_estimate = PlatformStackFactory.estimate_total_cost(stack_type, ssg_engine)
-            logger.debug(f"Retrieved cost estimate for {stack_type}: {cost_estimate.get('total_first_year_estimate', 'N/A')}")
+            cost_estimate = _get_factory().estimate_total_cost(stack_type, ssg_engine)
+            logger.debug("Retrieved cost estimate for %s: %s", stack_type, cost_estimate.get('total_first_year_estimate', 'N/A'))
             return cost_estimate
         except Exception as e:
-            logger.warning(f"Failed to get platform cost estimate: {e}")
+            logger.warning("Failed to get platform cost estimate: %s", e)
             return None
     else:
         logger.debug("Platform cost estimation unavailable")
@@ -155,17 +363,102 @@ def get_compatible_ssg_engines(stack_type: str) -> List[str]:
     """
     if is_platform_available():
         try:
-            engines = PlatformStackFactory.get_compatible_ssg_engines(stack_type)
-            logger.debug(f"Retrieved compatible SSG engines for {stack_type}: {engines}")
+            engines = _get_factory().get_compatible_ssg_engines(stack_type)
+            logger.debug("Retrieved compatible SSG engines for %s: %s", stack_type, engines)
             return engines
         except Exception as e:
-            logger.warning(f"Failed to get compatible SSG engines: {e}")
+            logger.warning("Failed to get compatible SSG engines: %s", e)
             return []
     else:
         logger.debug("Platform SSG compatibility unavailable")
         return []
 
 
+def get_compatible_ssg_engines_many(stack_types: List[str]) -> Dict[str, List[str]]:
+    """
+    Get compatible SSG engines for several stack types in one call.
+
+    Args:
+        stack_types: Stack type identifiers
+
+    Returns:
+        Mapping of stack type to compatible SSG engines (empty list if unavailable)
+    """
+    if not is_platform_available():
+        logger.debug("Platform SSG compatibility unavailable")
+        return {stack_type: [] for stack_type in stack_types}
+
+    get_engines = _get_factory().get_compatible_ssg_engines
+    engines_by_stack = {}
+    for stack_type in stack_types:
+        try:
+            engines_by_stack[stack_type] = get_engines(stack_type)
+        except Exception as e:
+            logger.warning("Failed to get compatible SSG engines for %s: %s", stack_type, e)
+            engines_by_stack[stack_type] = []
+
+    logger.debug("Retrieved compatible SSG engines for %d stack types", len(engines_by_stack))
+    return engines_by_stack
+
+
+def _build_cms_entry(metadata: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Transform CMS tier metadata into a (provider, record) pair."""
+    provider = metadata.get("cms_provider")
+    if not provider:
+        return None
+
+    return provider, {
+        "name": metadata.get("tier_name", "").partition(" - ")[0],  # Extract clean name
+        "cost": (metadata.get("monthly_cost_range") or (0, 0))[1],  # Use max cost
+        "features": metadata.get("key_features", []),
+        "compatible_ssg": metadata.get("ssg_engine_options", []),
+        "complexity": _map_complexity_level(metadata.get("complexity_level", "intermediate")),
+    }
+
+
+def _build_ecommerce_entry(metadata: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Transform E-commerce tier metadata into a (provider, record) pair."""
+    provider = metadata.get("ecommerce_provider")
+    if not provider:
+        return None
+
+    return provider, {
+        "name": metadata.get("tier_name", "").partition(" - ")[0],  # Extract clean name
+        "cost": (metadata.get("monthly_cost_range") or (0, 0))[1],  # Use max cost
+        "transaction_fee": _extract_transaction_fee(metadata),
+        "features": metadata.get("key_features", []),
+        "compatible_ssg": metadata.get("ssg_engine_options", []),
+        "complexity": _map_complexity_level(metadata.get("complexity_level", "intermediate")),
+    }
+
+
+def _build_ssg_entry(metadata: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Transform SSG template or foundation stack metadata into an (engine, record) pair."""
+    ssg_engine = metadata.get("ssg_engine")
+    if not ssg_engine:
+        return None
+
+    return ssg_engine, {
+        "name": _extract_ssg_display_name(ssg_engine),
+        "build_speed": _infer_build_speed(ssg_engine),
+        "language": _infer_language(ssg_engine),
+        "features": metadata.get("key_features", []),
+        "complexity": _map_complexity_level(metadata.get("complexity_level", "intermediate")),
+        "ecosystem": _infer_ecosystem(ssg_engine),
+    }
+
+
+# Platform stack categories that describe an SSG engine
+_SSG_CATEGORIES = frozenset({"ssg_template_business_service", "foundation_ssg_service"})
+
+# Platform stack category -> (CLI section, entry builder)
+_CATEGORY_BUILDERS = {
+    "cms_tier_service": ("cms", _build_cms_entry),
+    "ecommerce_tier_service": ("ecommerce", _build_ecommerce_entry),
+    **{category: ("ssg", _build_ssg_entry) for category in _SSG_CATEGORIES},
+}
+
+
 def transform_to_cli_format(platform_metadata: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """
     Transform platform factory metadata to CLI provider matrix format.
@@ -179,141 +472,111 @@ def transform_to_cli_format(platform_metadata: Dict[str, Any]) -> Dict[str, Dict
     if not platform_metadata:
         return {"cms": {}, "ecommerce": {}, "ssg": {}}
 
-    cms_providers = {}
-    ecommerce_providers = {}
-    ssg_engines = {}
-
-    logger.debug(f"Transforming {len(platform_metadata)} platform metadata entries")
-
-    for stack_type, metadata in platform_metadata.items():
-        category = metadata.get("category", "")
-
-        # Transform CMS tier metadata
-        if category == "cms_tier_service":
-            provider = metadata.get("cms_provider")
-            if provider:
-                cms_providers[provider] = {
-                    "name": metadata.get("tier_name", "").split(" - ")[0],  # Extract clean name
-                    "cost": metadata.get("monthly_cost_range", [0, 0])[1],  # Use max cost
-                    "features": metadata.get("key_features", []),
-                    "compatible_ssg": metadata.get("ssg_engine_options", []),
-                    "complexity": _map_complexity_level(metadata.get("complexity_level", "intermediate")),
-                }
-
-        # Transform E-commerce tier metadata
-        elif category == "ecommerce_tier_service":
-            provider = metadata.get("ecommerce_provider")
-            if provider:
-                ecommerce_providers[provider] = {
-                    "name": metadata.get("tier_name", "").split(" - ")[0],  # Extract clean name
-                    "cost": metadata.get("monthly_cost_range", [0, 0])[1],  # Use max cost
-                    "transaction_fee": _extract_transaction_fee(metadata),
-                    "features": metadata.get("key_features", []),
-                    "compatible_ssg": metadata.get("ssg_engine_options", []),
-                    "complexity": _map_complexity_level(metadata.get("complexity_level", "intermediate")),
-                }
-
-        # Transform SSG template and foundation stacks
-        elif category in ["ssg_template_business_service", "foundation_ssg_service"]:
-            ssg_engine = metadata.get("ssg_engine")
-            if ssg_engine:
-                ssg_engines[ssg_engine] = {
-                    "name": _extract_ssg_display_name(ssg_engine),
-                    "build_speed": _infer_build_speed(ssg_engine),
-                    "language": _infer_language(ssg_engine),
-                    "features": metadata.get("key_features", []),
-                    "complexity": _map_complexity_level(metadata.get("complexity_level", "intermediate")),
-                    "ecosystem": _infer_ecosystem(ssg_engine),
-                }
-
-    result = {
-        "cms": cms_providers,
-        "ecommerce": ecommerce_providers,
-        "ssg": ssg_engines
-    }
+    result = {"cms": {}, "ecommerce": {}, "ssg": {}}
+
+    logger.debug("Transforming %d platform metadata entries", len(platform_metadata))
+
+    for metadata in platform_metadata.values():
+        builder = _CATEGORY_BUILDERS.get(metadata.get("category", ""))
+        if builder is None:
+            continue
 
-    logger.info(f"Transformed platform metadata: {len(cms_providers)} CMS, {len(ecommerce_providers)} E-commerce, {len(ssg_engines)} SSG")
+        section, build_entry = builder
+        entry = build_entry(metadata)
+        if entry:
+            name, record = entry
+            result[section][name] = record
+
+    logger.info("Transformed platform metadata: %d CMS, %d E-commerce, %d SSG",
+                len(result["cms"]), len(result["ecommerce"]), len(result["ssg"]))
     return result
 
 
+# Platform complexity levels mapped to CLI format
+_COMPLEXITY_LEVELS = {
+    "low_to_medium": "beginner",
+    "medium_to_high": "intermediate",
+    "high": "advanced",
+    "enterprise": "enterprise"
+}
+
+# Known per-transaction fees by e-commerce provider
+_TRANSACTION_FEES: Dict[str, float] = {
+    "snipcart": 0.02,  # 2%
+    "foxy": 0.015,  # 1.5%
+    "shopify_basic": 0.029,  # 2.9%
+}
+
+# Static SSG engine characteristics
+_SSG_DISPLAY_NAMES = {
+    "hugo": "Hugo",
+    "eleventy": "Eleventy",
+    "astro": "Astro",
+    "gatsby": "Gatsby",
+    "nextjs": "Next.js",
+    "nuxt": "Nuxt.js",
+    "jekyll": "Jekyll"
+}
+
+_SSG_BUILD_SPEEDS = {
+    "hugo": "fastest",
+    "eleventy": "fast",
+    "astro": "fast",
+    "gatsby": "medium",
+    "nextjs": "medium",
+    "nuxt": "medium",
+    "jekyll": "medium"
+}
+
+_SSG_LANGUAGES = {
+    "hugo": "go",
+    "eleventy": "javascript",
+    "astro": "javascript",
+    "gatsby": "javascript",
+    "nextjs": "javascript",
+    "nuxt": "javascript",
+    "jekyll": "ruby"
+}
+
+_SSG_ECOSYSTEMS = {
+    "hugo": "go_templates",
+    "eleventy": "javascript",
+    "astro": "multi_framework",
+    "gatsby": "react",
+    "nextjs": "react",
+    "nuxt": "vue",
+    "jekyll": "ruby"
+}
+
+
 def _map_complexity_level(platform_complexity: str) -> str:
     """Map platform complexity levels to CLI format."""
-    mapping = {
-        "low_to_medium": "beginner",
-        "medium_to_high": "intermediate",
-        "high": "advanced",
-        "enterprise": "enterprise"
-    }
-    return mapping.get(platform_complexity, platform_complexity)
+    return _COMPLEXITY_LEVELS.get(platform_complexity, platform_complexity)
 
 
 def _extract_transaction_fee(metadata: Dict[str, Any]) -> float:
     """Extract transaction fee from platform metadata."""
-    # Look for common transaction fee indicators
-    provider = metadata.get("ecommerce_provider", "")
-    if provider == "snipcart":
-        return 0.02  # 2%
-    elif provider == "foxy":
-        return 0.015  # 1.5%
-    elif provider == "shopify_basic":
-        return 0.029  # 2.9%
-    return 0.0
+    return _TRANSACTION_FEES.get(metadata.get("ecommerce_provider", ""), 0.0)
 
 
 def _extract_ssg_display_name(ssg_engine: str) -> str:
     """Extract display name for SSG engine."""
-    names = {
-        "hugo": "Hugo",
-        "eleventy": "Eleventy",
-        "astro": "Astro",
-        "gatsby": "Gatsby",
-        "nextjs": "Next.js",
-        "nuxt": "Nuxt.js",
-        "jekyll": "Jekyll"
-    }
-    return names.get(ssg_engine, ssg_engine.title())
+    return _SSG_DISPLAY_NAMES.get(ssg_engine) or ssg_engine.title()
 
 
 def _infer_build_speed(ssg_engine: str) -> str:
     """Infer build speed for SSG engine."""
-    speeds = {
-        "hugo": "fastest",
-        "eleventy": "fast",
-        "astro": "fast",
-        "gatsby": "medium",
-        "nextjs": "medium",
-        "nuxt": "medium",
-        "jekyll": "medium"
-    }
-    return speeds.get(ssg_engine, "medium")
+    return _SSG_BUILD_SPEEDS.get(ssg_engine, "medium")
 
 
 def _infer_language(ssg_engine: str) -> str:
     """Infer primary language for SSG engine."""
-    languages = {
-        "hugo": "go",
-        "eleventy": "javascript",
-        "astro": "javascript",
-        "gatsby": "javascript",
-        "nextjs": "javascript",
-        "nuxt": "javascript",
-        "jekyll": "ruby"
-    }
-    return languages.get(ssg_engine, "javascript")
+    return _SSG_LANGUAGES.get(ssg_engine, "javascript")
 
 
 def _infer_ecosystem(ssg_engine: str) -> str:
     """Infer ecosystem for SSG engine."""
-    ecosystems = {
-        "hugo": "go_templates",
-        "eleventy": "javascript",
-        "astro": "multi_framework",
-        "gatsby": "react",
-        "nextjs": "react",
-        "nuxt": "vue",
-        "jekyll": "ruby"
-    }
-    return ecosystems.get(ssg_engine, "javascript")
+    return _SSG_ECOSYSTEMS.get(ssg_engine, "javascript")
 
 
 def get_registry_status() -> Dict[str, Any]:
@@ -323,7 +586,8 @@ def get_registry_status() -> Dict[str, Any]:
     Returns:
         Registry status dictionary with health information
     """
-    if not REGISTRY_AVAILABLE or not default_registry:
+    default_registry = _get_registry()
+    if not default_registry:
         return {
             "available": False,
             "reason": "Registry not imported or initialized",
@@ -355,46 +619,70 @@ def get_registry_status() -> Dict[str, Any]:
         }
 
 
-def get_integration_status() -> Dict[str, Any]:
+def _metadata_summary() -> Tuple[int, str]:
     """
-    Get detailed integration status for diagnostics.
+    Get (stack count, source) for status reporting without fetching every stack.
 
-    Returns:
-        Status dictionary with integration details including registry health
+    Cached metadata answers directly; otherwise the registry manifest alone gives
+    the count in one request instead of one request per stack.
     """
-    metadata = get_platform_metadata()
+    with _metadata_lock:
+        cached = _metadata_cache["data"]
+        if cached is not None and time.monotonic() - _metadata_cache["timestamp"] < METADATA_STALE_TTL:
+            return len(cached), _metadata_cache["source"]
 
-    # Determine primary metadata source
-    metadata_source = "none"
-    if REGISTRY_AVAILABLE and default_registry:
+    default_registry = _get_registry()
+    if default_registry:
         try:
-            # Try a quick registry health check
             manifest = default_registry.get_manifest_sync()
-            if manifest:
-                metadata_source = "registry"
-        except:
-            pass
+            count = sum(len(stacks) for stacks in manifest.get("stacks", {}).values())
+            if count:
+                return count, "registry"
+        except Exception as e:
+            logger.debug("Registry manifest unavailable for status: %s", e)
 
-    if metadata_source == "none" and is_platform_available():
-        metadata_source = "platform_factory"
+    # The metadata fetch also reports which source answered
+    metadata, source = _fetch_metadata()
+    return len(metadata), source
+
+
+def get_integration_status() -> Dict[str, Any]:
+    """
+    Get detailed integration status for diagnostics.
+
+    Returns:
+        Status dictionary with integration details including registry health
+    """
+    platform_available = is_platform_available()
+
+    # Metadata count, registry health and the recommendations test are independent
+    # I/O, so submit them together and wait once
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        summary_future = executor.submit(_metadata_summary)
+        registry_future = executor.submit(get_registry_status)
+        recommendations_future = (
+            executor.submit(get_platform_recommendations, {"test": True}) if platform_available else None
+        )
+        metadata_count, metadata_source = summary_future.result()
+        registry_status = registry_future.result()
 
     status = {
-        "platform_available": is_platform_available(),
-        "registry_available": REGISTRY_AVAILABLE,
+        "platform_available": platform_available,
+        "registry_available": _get_registry() is not None,
         "metadata_source": metadata_source,
-        "metadata_count": len(metadata),
+        "metadata_count": metadata_count,
         "integration_mode": "distributed" if metadata_source == "registry" else "direct" if metadata_source == "platform_factory" else "static",
-        "registry_status": get_registry_status()
+        "registry_status": registry_status
     }
 
     # Test functionality if platform available
-    if is_platform_available():
+    if recommendations_future is not None:
         try:
-            test_recommendations = get_platform_recommendations({"test": True})
+            test_recommendations = recommendations_future.result()
             status["recommendations_working"] = len(test_recommendations) >= 0
         except Exception as e:
             status["recommendations_error"] = str(e)
             status["recommendations_working"] = False
 
-    logger.debug(f"Integration status: {status}")
+    logger.debug("Integration status: %s", status)
     return status
\ No newline at end of file
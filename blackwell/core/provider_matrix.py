@@ -5,11 +5,166 @@ CLI-specific wrapper around blackwell-core provider matrix functionality.
 Provides backward compatibility for existing CLI workflows.
 """
 
-from typing import Dict, List, Set, Any
+from bisect import bisect_right
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 
 from blackwell_core.engine.provider_matrix import ProviderMatrix as CoreProviderMatrix
-from blackwell_core.models.enums import SSGEngine, CMSProvider, EcommerceProvider
-from blackwell_core.models.providers import ProviderCompatibility
+
+
+# Complexity levels in ascending order; a level's score is its position + 1
+_COMPLEXITY_LEVELS = ("beginner", "intermediate", "advanced", "enterprise")
+_COMPLEXITY_SCORES = {level: score for score, level in enumerate(_COMPLEXITY_LEVELS, start=1)}
+_DEFAULT_COMPLEXITY_SCORE = _COMPLEXITY_SCORES["intermediate"]
+
+
+@dataclass(frozen=True, slots=True)
+class _ProviderProfile:
+    """Fields the matrix computes with, flattened out of a provider record."""
+
+    cost: float
+    transaction_fee: float
+    complexity_score: int
+    ssg_mask: int
+
+    @classmethod
+    def from_info(cls, info: Mapping[str, Any], ssg_bits: Mapping[str, int]) -> "_ProviderProfile":
+        ssg_mask = 0
+        for ssg_engine in info.get("compatible_ssg", ()):
+            ssg_mask |= ssg_bits[ssg_engine]
+
+        return cls(
+            cost=info.get("cost", 0.0),
+            transaction_fee=info.get("transaction_fee", 0.0),
+            complexity_score=_COMPLEXITY_SCORES.get(info.get("complexity", "intermediate"), _DEFAULT_COMPLEXITY_SCORE),
+            ssg_mask=ssg_mask,
+        )
+
+
+# Returned by get_provider_info for unknown providers
+_EMPTY_INFO: Mapping[str, Any] = MappingProxyType({})
+
+# Profile used for providers missing from the matrix (same defaults as an empty record)
+_UNKNOWN_PROFILE = _ProviderProfile.from_info({}, {})
+
+# Static provider data shared by every matrix instance (read-only)
+_CMS_PROVIDERS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "decap": {
+        "name": "Decap CMS",
+        "cost": 0.0,
+        "features": ("git_based", "free", "open_source"),
+        "compatible_ssg": ("hugo", "eleventy", "astro", "gatsby", "jekyll"),
+        "complexity": "intermediate",
+    },
+    "tina": {
+        "name": "Tina CMS",
+        "cost": 29.0,
+        "features": ("visual_editing", "git_based", "live_preview"),
+        "compatible_ssg": ("astro", "eleventy", "nextjs", "nuxt", "jekyll"),
+        "complexity": "beginner",
+    },
+    "sanity": {
+        "name": "Sanity CMS",
+        "cost": 99.0,
+        "features": ("structured_content", "real_time", "api_first"),
+        "compatible_ssg": ("astro", "gatsby", "nextjs", "nuxt"),
+        "complexity": "advanced",
+    },
+    "contentful": {
+        "name": "Contentful",
+        "cost": 300.0,
+        "features": ("enterprise", "cdn", "multi_env", "workflows"),
+        "compatible_ssg": ("gatsby", "astro", "nextjs", "nuxt"),
+        "complexity": "enterprise",
+    },
+})
+
+_ECOMMERCE_PROVIDERS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "snipcart": {
+        "name": "Snipcart",
+        "cost": 29.0,
+        "transaction_fee": 0.02,
+        "features": ("simple", "embed", "quick_setup"),
+        "compatible_ssg": ("hugo", "eleventy", "astro", "gatsby", "jekyll"),
+        "complexity": "beginner",
+    },
+    "foxy": {
+        "name": "Foxy.io",
+        "cost": 75.0,
+        "transaction_fee": 0.015,
+        "features": ("advanced", "customizable", "api_rich"),
+        "compatible_ssg": ("hugo", "eleventy", "astro", "gatsby", "jekyll"),
+        "complexity": "intermediate",
+    },
+    "shopify_basic": {
+        "name": "Shopify Basic",
+        "cost": 29.0,
+        "transaction_fee": 0.029,
+        "features": ("full_platform", "inventory", "analytics"),
+        "compatible_ssg": ("eleventy", "astro", "nextjs", "nuxt"),
+        "complexity": "intermediate",
+    },
+})
+
+_SSG_ENGINES: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "hugo": {
+        "name": "Hugo",
+        "build_speed": "fastest",
+        "language": "go",
+        "features": ("blazing_fast", "simple", "powerful"),
+        "complexity": "intermediate",
+        "ecosystem": "go_templates",
+    },
+    "eleventy": {
+        "name": "Eleventy",
+        "build_speed": "fast",
+        "language": "javascript",
+        "features": ("flexible", "simple", "zero_config"),
+        "complexity": "beginner",
+        "ecosystem": "javascript",
+    },
+    "astro": {
+        "name": "Astro",
+        "build_speed": "fast",
+        "language": "javascript",
+        "features": ("component_islands", "framework_agnostic", "modern"),
+        "complexity": "intermediate",
+        "ecosystem": "multi_framework",
+    },
+    "gatsby": {
+        "name": "Gatsby",
+        "build_speed": "medium",
+        "language": "javascript",
+        "features": ("react_based", "graphql", "plugin_ecosystem"),
+        "complexity": "advanced",
+        "ecosystem": "react",
+    },
+    "nextjs": {
+        "name": "Next.js",
+        "build_speed": "medium",
+        "language": "javascript",
+        "features": ("react_framework", "ssr", "enterprise_ready"),
+        "complexity": "advanced",
+        "ecosystem": "react",
+    },
+    "nuxt": {
+        "name": "Nuxt.js",
+        "build_speed": "medium",
+        "language": "javascript",
+        "features": ("vue_framework", "ssr", "modular"),
+        "complexity": "advanced",
+        "ecosystem": "vue",
+    },
+    "jekyll": {
+        "name": "Jekyll",
+        "build_speed": "medium",
+        "language": "ruby",
+        "features": ("github_pages", "blog_ready", "liquid_templates", "technical_focus"),
+        "complexity": "beginner",
+        "ecosystem": "ruby",
+    },
+})
 
 
 class ProviderMatrix:
@@ -18,159 +173,102 @@ class ProviderMatrix:
 
     Provides backward compatibility for existing CLI workflows while leveraging
     the blackwell-core provider matrix for accurate compatibility checking.
+
+    The static matrix is read-only, so prefer the shared instance from
+    get_default_matrix() over constructing a new one per call site.
     """
 
+    __slots__ = (
+        "_core_matrix",
+        "cms_providers",
+        "ecommerce_providers",
+        "ssg_engines",
+        "_by_type",
+        "_info_views",
+        "_provider_names",
+        "_ssg_bits",
+        "_profiles",
+        "_combination_index",
+    )
+
     def __init__(self):
         """Initialize CLI provider matrix with core engine."""
         self._core_matrix = CoreProviderMatrix()
 
-        # Legacy provider data structures for CLI compatibility
-        self.cms_providers = self._build_cms_providers_dict()
-        self.ecommerce_providers = self._build_ecommerce_providers_dict()
-        self.ssg_engines = self._build_ssg_engines_dict()
+        # Legacy provider data structures for CLI compatibility, shared rather than rebuilt
+        self.cms_providers = _CMS_PROVIDERS
+        self.ecommerce_providers = _ECOMMERCE_PROVIDERS
+        self.ssg_engines = _SSG_ENGINES
 
-    def _build_cms_providers_dict(self) -> Dict[str, Dict]:
-        """Build CLI-compatible CMS providers dictionary."""
-        return {
-            "decap": {
-                "name": "Decap CMS",
-                "cost": 0.0,
-                "features": ["git_based", "free", "open_source"],
-                "compatible_ssg": ["hugo", "eleventy", "astro", "gatsby", "jekyll"],
-                "complexity": "intermediate",
-            },
-            "tina": {
-                "name": "Tina CMS",
-                "cost": 29.0,
-                "features": ["visual_editing", "git_based", "live_preview"],
-                "compatible_ssg": ["astro", "eleventy", "nextjs", "nuxt", "jekyll"],
-                "complexity": "beginner",
-            },
-            "sanity": {
-                "name": "Sanity CMS",
-                "cost": 99.0,
-                "features": ["structured_content", "real_time", "api_first"],
-                "compatible_ssg": ["astro", "gatsby", "nextjs", "nuxt"],
-                "complexity": "advanced",
-            },
-            "contentful": {
-                "name": "Contentful",
-                "cost": 300.0,
-                "features": ["enterprise", "cdn", "multi_env", "workflows"],
-                "compatible_ssg": ["gatsby", "astro", "nextjs", "nuxt"],
-                "complexity": "enterprise",
-            },
-        }
+        # Provider dictionaries keyed by provider type
+        self._by_type: Dict[str, Mapping[str, Dict]] = {}
 
-    def _build_ecommerce_providers_dict(self) -> Dict[str, Dict]:
-        """Build CLI-compatible e-commerce providers dictionary."""
-        return {
-            "snipcart": {
-                "name": "Snipcart",
-                "cost": 29.0,
-                "transaction_fee": 0.02,
-                "features": ["simple", "embed", "quick_setup"],
-                "compatible_ssg": ["hugo", "eleventy", "astro", "gatsby", "jekyll"],
-                "complexity": "beginner",
-            },
-            "foxy": {
-                "name": "Foxy.io",
-                "cost": 75.0,
-                "transaction_fee": 0.015,
-                "features": ["advanced", "customizable", "api_rich"],
-                "compatible_ssg": ["hugo", "eleventy", "astro", "gatsby", "jekyll"],
-                "complexity": "intermediate",
-            },
-            "shopify_basic": {
-                "name": "Shopify Basic",
-                "cost": 29.0,
-                "transaction_fee": 0.029,
-                "features": ["full_platform", "inventory", "analytics"],
-                "compatible_ssg": ["eleventy", "astro", "nextjs", "nuxt"],
-                "complexity": "intermediate",
-            },
-        }
+        # Read-only views of each provider record, handed out by get_provider_info
+        self._info_views: Dict[str, Dict[str, Mapping[str, Any]]] = {}
 
-    def _build_ssg_engines_dict(self) -> Dict[str, Dict]:
-        """Build CLI-compatible SSG engines dictionary."""
-        return {
-            "hugo": {
-                "name": "Hugo",
-                "build_speed": "fastest",
-                "language": "go",
-                "features": ["blazing_fast", "simple", "powerful"],
-                "complexity": "intermediate",
-                "ecosystem": "go_templates",
-            },
-            "eleventy": {
-                "name": "Eleventy",
-                "build_speed": "fast",
-                "language": "javascript",
-                "features": ["flexible", "simple", "zero_config"],
-                "complexity": "beginner",
-                "ecosystem": "javascript",
-            },
-            "astro": {
-                "name": "Astro",
-                "build_speed": "fast",
-                "language": "javascript",
-                "features": ["component_islands", "framework_agnostic", "modern"],
-                "complexity": "intermediate",
-                "ecosystem": "multi_framework",
-            },
-            "gatsby": {
-                "name": "Gatsby",
-                "build_speed": "medium",
-                "language": "javascript",
-                "features": ["react_based", "graphql", "plugin_ecosystem"],
-                "complexity": "advanced",
-                "ecosystem": "react",
-            },
-            "nextjs": {
-                "name": "Next.js",
-                "build_speed": "medium",
-                "language": "javascript",
-                "features": ["react_framework", "ssr", "enterprise_ready"],
-                "complexity": "advanced",
-                "ecosystem": "react",
-            },
-            "nuxt": {
-                "name": "Nuxt.js",
-                "build_speed": "medium",
-                "language": "javascript",
-                "features": ["vue_framework", "ssr", "modular"],
-                "complexity": "advanced",
-                "ecosystem": "vue",
-            },
-            "jekyll": {
-                "name": "Jekyll",
-                "build_speed": "medium",
-                "language": "ruby",
-                "features": ["github_pages", "blog_ready", "liquid_templates", "technical_focus"],
-                "complexity": "beginner",
-                "ecosystem": "ruby",
-            },
+        # Provider names by type, handed out by list_all_providers
+        self._provider_names: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+
+        # One bit per SSG engine; profiles store compatible engines as a mask of these bits
+        self._ssg_bits: Dict[str, int] = {}
+
+        # Flattened provider profiles per provider type, for the legacy fallbacks and costs
+        self._profiles: Dict[str, Dict[str, _ProviderProfile]] = {}
+
+        # Compatible combinations sorted by cost, with their costs for bisecting, keyed by
+        # complexity (None holds all of them); built on first recommendation query
+        self._combination_index: Optional[Dict[Optional[str], Tuple[List[Dict], List[float]]]] = None
+
+        self._on_providers_changed()
+
+    def _on_providers_changed(self) -> None:
+        """Rebuild derived indexes; call whenever provider data is replaced."""
+        self._replace_providers(self.cms_providers, self.ecommerce_providers, self.ssg_engines)
+
+    def _replace_providers(self, cms_providers: Mapping[str, Dict], ecommerce_providers: Mapping[str, Dict],
+                           ssg_engines: Mapping[str, Dict]) -> None:
+        """Swap in provider data with its derived indexes, assigning nothing unless all of them build."""
+        indexes = self._build_indexes(cms_providers, ecommerce_providers, ssg_engines)
+
+        self.cms_providers = cms_providers
+        self.ecommerce_providers = ecommerce_providers
+        self.ssg_engines = ssg_engines
+        self._by_type, self._info_views, self._provider_names, self._ssg_bits, self._profiles = indexes
+        self._combination_index = None
+
+    @staticmethod
+    def _build_indexes(cms_providers: Mapping[str, Dict], ecommerce_providers: Mapping[str, Dict],
+                       ssg_engines: Mapping[str, Dict]) -> Tuple:
+        """Build (by_type, info_views, provider_names, ssg_bits, profiles) for provider data."""
+        by_type = {"cms": cms_providers, "ecommerce": ecommerce_providers, "ssg": ssg_engines}
+        info_views = {
+            provider_type: {name: MappingProxyType(info) for name, info in providers.items()}
+            for provider_type, providers in by_type.items()
+        }
+        provider_names = MappingProxyType(
+            {provider_type: tuple(providers) for provider_type, providers in by_type.items()}
+        )
+
+        # Engines only named in compatibility lists get bits too
+        ssg_names = dict.fromkeys(ssg_engines)
+        for providers in (cms_providers, ecommerce_providers):
+            for info in providers.values():
+                ssg_names.update(dict.fromkeys(info.get("compatible_ssg", ())))
+        ssg_bits = {name: 1 << position for position, name in enumerate(ssg_names)}
+
+        profiles = {
+            provider_type: {name: _ProviderProfile.from_info(info, ssg_bits) for name, info in providers.items()}
+            for provider_type, providers in by_type.items()
         }
+        return by_type, info_views, provider_names, ssg_bits, profiles
 
     def is_provider_valid(self, provider_type: str, provider_name: str) -> bool:
         """Check if a provider is valid for the given type."""
-        if provider_type == "cms":
-            return provider_name in self.cms_providers
-        elif provider_type == "ecommerce":
-            return provider_name in self.ecommerce_providers
-        elif provider_type == "ssg":
-            return provider_name in self.ssg_engines
-        return False
-
-    def get_provider_info(self, provider_type: str, provider_name: str) -> Dict:
-        """Get detailed information about a provider."""
-        if provider_type == "cms":
-            return self.cms_providers.get(provider_name, {})
-        elif provider_type == "ecommerce":
-            return self.ecommerce_providers.get(provider_name, {})
-        elif provider_type == "ssg":
-            return self.ssg_engines.get(provider_name, {})
-        return {}
+        return provider_name in self._by_type.get(provider_type, {})
+
+    def get_provider_info(self, provider_type: str, provider_name: str) -> Mapping[str, Any]:
+        """Get detailed information about a provider as a read-only view (empty if unknown)."""
+        return self._info_views.get(provider_type, {}).get(provider_name, _EMPTY_INFO)
 
     def is_combination_compatible(
         self, cms_provider: str, ecommerce_provider: str, ssg_engine: str
@@ -191,15 +289,16 @@ class ProviderMatrix:
         self, cms_provider: str, ecommerce_provider: str, ssg_engine: str
     ) -> bool:
         """Legacy compatibility check for CLI backward compatibility."""
-        cms_info = self.get_provider_info("cms", cms_provider)
-        ecommerce_info = self.get_provider_info("ecommerce", ecommerce_provider) if ecommerce_provider else {}
+        cms_profile = self._profiles["cms"].get(cms_provider)
+        ecommerce_profile = self._profiles["ecommerce"].get(ecommerce_provider) if ecommerce_provider else None
+        ssg_bit = self._ssg_bits.get(ssg_engine, 0)
 
         # Check SSG compatibility with CMS
-        if cms_info and ssg_engine not in cms_info.get("compatible_ssg", []):
+        if cms_profile is not None and not cms_profile.ssg_mask & ssg_bit:
             return False
 
         # Check SSG compatibility with e-commerce (if present)
-        if ecommerce_info and ssg_engine not in ecommerce_info.get("compatible_ssg", []):
+        if ecommerce_profile is not None and not ecommerce_profile.ssg_mask & ssg_bit:
             return False
 
         # Jekyll-specific validation
@@ -232,15 +331,12 @@ class ProviderMatrix:
             return [engine.value for engine in compatible_providers.get("ssg_engines", [])]
         except Exception:
             # Fallback to legacy logic
-            cms_info = self.get_provider_info("cms", cms_provider)
-            cms_compatible = set(cms_info.get("compatible_ssg", []))
+            ssg_mask = self._profiles["cms"].get(cms_provider, _UNKNOWN_PROFILE).ssg_mask
 
             if ecommerce_provider:
-                ecommerce_info = self.get_provider_info("ecommerce", ecommerce_provider)
-                ecommerce_compatible = set(ecommerce_info.get("compatible_ssg", []))
-                return list(cms_compatible.intersection(ecommerce_compatible))
+                ssg_mask &= self._profiles["ecommerce"].get(ecommerce_provider, _UNKNOWN_PROFILE).ssg_mask
 
-            return list(cms_compatible)
+            return [ssg_engine for ssg_engine, bit in self._ssg_bits.items() if ssg_mask & bit]
 
     def calculate_provider_cost(
         self, cms_provider: str, ecommerce_provider: str = None
@@ -249,16 +345,14 @@ class ProviderMatrix:
         cost_breakdown = {"cms_cost": 0.0, "ecommerce_cost": 0.0, "total_fixed": 0.0}
 
         # CMS cost
-        cms_info = self.get_provider_info("cms", cms_provider)
-        cms_cost = cms_info.get("cost", 0.0)
+        cms_cost = self._profiles["cms"].get(cms_provider, _UNKNOWN_PROFILE).cost
         cost_breakdown["cms_cost"] = cms_cost
 
         # E-commerce cost
         if ecommerce_provider:
-            ecommerce_info = self.get_provider_info("ecommerce", ecommerce_provider)
-            ecommerce_cost = ecommerce_info.get("cost", 0.0)
-            cost_breakdown["ecommerce_cost"] = ecommerce_cost
-            cost_breakdown["transaction_fee_rate"] = ecommerce_info.get("transaction_fee", 0.0)
+            ecommerce_profile = self._profiles["ecommerce"].get(ecommerce_provider, _UNKNOWN_PROFILE)
+            cost_breakdown["ecommerce_cost"] = ecommerce_profile.cost
+            cost_breakdown["transaction_fee_rate"] = ecommerce_profile.transaction_fee
 
         # Total fixed cost
         cost_breakdown["total_fixed"] = cms_cost + cost_breakdown["ecommerce_cost"]
@@ -267,19 +361,13 @@ class ProviderMatrix:
 
     def get_providers_by_budget(self, max_monthly_cost: float) -> Dict[str, List[str]]:
         """Get providers within budget limit."""
-        budget_providers = {"cms": [], "ecommerce": []}
-
-        # Find CMS providers within budget
-        for provider, info in self.cms_providers.items():
-            if info["cost"] <= max_monthly_cost:
-                budget_providers["cms"].append(provider)
-
-        # Find e-commerce providers within budget
-        for provider, info in self.ecommerce_providers.items():
-            if info["cost"] <= max_monthly_cost:
-                budget_providers["ecommerce"].append(provider)
-
-        return budget_providers
+        return {
+            provider_type: [
+                provider for provider, profile in self._profiles[provider_type].items()
+                if profile.cost <= max_monthly_cost
+            ]
+            for provider_type in ("cms", "ecommerce")
+        }
 
     def get_complexity_level(
         self, cms_provider: str, ecommerce_provider: str = None, ssg_engine: str = "astro"
@@ -293,28 +381,19 @@ class ProviderMatrix:
             )
             return compatibility.overall_complexity.value
         except Exception:
-            # Fallback to legacy complexity calculation
-            complexity_scores = {"beginner": 1, "intermediate": 2, "advanced": 3, "enterprise": 4}
-
-            cms_info = self.get_provider_info("cms", cms_provider)
-            cms_complexity = complexity_scores.get(cms_info.get("complexity", "intermediate"), 2)
-
-            ssg_info = self.get_provider_info("ssg", ssg_engine)
-            ssg_complexity = complexity_scores.get(ssg_info.get("complexity", "intermediate"), 2)
-
-            max_complexity = max(cms_complexity, ssg_complexity)
+            # Fallback to legacy complexity calculation from precomputed scores
+            profiles = self._profiles
+            max_complexity = max(
+                profiles["cms"].get(cms_provider, _UNKNOWN_PROFILE).complexity_score,
+                profiles["ssg"].get(ssg_engine, _UNKNOWN_PROFILE).complexity_score,
+            )
 
             if ecommerce_provider:
-                ecommerce_info = self.get_provider_info("ecommerce", ecommerce_provider)
-                ecommerce_complexity = complexity_scores.get(ecommerce_info.get("complexity", "intermediate"), 2)
-                max_complexity = max(max_complexity, ecommerce_complexity)
+                max_complexity = max(
+                    max_complexity, profiles["ecommerce"].get(ecommerce_provider, _UNKNOWN_PROFILE).complexity_score
+                )
 
-            # Convert back to string
-            for level, score in complexity_scores.items():
-                if score == max_complexity:
-                    return level
-
-            return "intermediate"
+            return _COMPLEXITY_LEVELS[max_complexity - 1]
 
     def get_jekyll_recommendations(self) -> Dict[str, Any]:
         """Get Jekyll-specific recommendations and constraints."""
@@ -345,55 +424,89 @@ class ProviderMatrix:
             ]
         }
 
-    def list_all_providers(self) -> Dict[str, List[str]]:
-        """Get all available providers by type."""
-        return {
-            "cms": list(self.cms_providers.keys()),
-            "ecommerce": list(self.ecommerce_providers.keys()),
-            "ssg": list(self.ssg_engines.keys()),
-        }
-
-    def get_recommended_combinations(self, budget: float = None, complexity: str = None) -> List[Dict]:
-        """Get recommended provider combinations based on criteria."""
-        recommendations = []
-
-        # Simplified recommendations using core matrix where possible
+    def list_all_providers(self) -> Mapping[str, Tuple[str, ...]]:
+        """Get all available providers by type (read-only, shared between calls)."""
+        return self._provider_names
+
+    def get_recommended_combinations(
+        self, budget: float = None, complexity: str = None, limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Get recommended provider combinations based on criteria, cheapest first (up to limit)."""
+        if self._combination_index is None:
+            self._combination_index = self._index_combinations(self._build_all_combinations())
+
+        combos, costs = self._combination_index.get(complexity or None, ((), ()))
+        if budget:
+            combos = combos[:bisect_right(costs, budget)]
+        if limit is not None:
+            combos = combos[:limit]
+
+        # Hand out fresh dicts so callers can't mutate the shared combination table
+        return [{**combo, "cost": dict(combo["cost"])} for combo in combos]
+
+    @staticmethod
+    def _index_combinations(combinations: Tuple[Dict, ...]) -> Dict[Optional[str], Tuple[List[Dict], List[float]]]:
+        """Bucket cost-sorted combinations by complexity, keeping each bucket's costs."""
+        index: Dict[Optional[str], Tuple[List[Dict], List[float]]] = {None: ([], [])}
+        for combo in combinations:
+            total_fixed = combo["cost"]["total_fixed"]
+            for key in (None, combo["complexity"]):
+                combos, costs = index.setdefault(key, ([], []))
+                combos.append(combo)
+                costs.append(total_fixed)
+        return index
+
+    def _build_all_combinations(self) -> Tuple[Dict, ...]:
+        """Evaluate every provider combination once; queries filter the result."""
+        combinations = []
+
+        # Costs don't depend on the SSG, so compute them once per provider and pair
         for cms in self.cms_providers:
+            cms_cost = self.calculate_provider_cost(cms)
+            pair_costs = {
+                ecommerce: self.calculate_provider_cost(cms, ecommerce) for ecommerce in self.ecommerce_providers
+            }
+
+            # Simplified recommendations using core matrix where possible
             for ssg in self.ssg_engines:
                 if self.is_combination_compatible(cms, None, ssg):
-                    combo = {
+                    combinations.append({
                         "cms_provider": cms,
                         "ecommerce_provider": None,
                         "ssg_engine": ssg,
-                        "cost": self.calculate_provider_cost(cms),
+                        "cost": cms_cost,
                         "complexity": self.get_complexity_level(cms, None, ssg),
-                    }
-
-                    if budget and combo["cost"]["total_fixed"] > budget:
-                        continue
-                    if complexity and combo["complexity"] != complexity:
-                        continue
-
-                    recommendations.append(combo)
+                    })
 
                 # Also check with e-commerce providers
-                for ecommerce in self.ecommerce_providers:
+                for ecommerce, pair_cost in pair_costs.items():
                     if self.is_combination_compatible(cms, ecommerce, ssg):
-                        combo = {
+                        combinations.append({
                             "cms_provider": cms,
                             "ecommerce_provider": ecommerce,
                             "ssg_engine": ssg,
-                            "cost": self.calculate_provider_cost(cms, ecommerce),
+                            "cost": pair_cost,
                             "complexity": self.get_complexity_level(cms, ecommerce, ssg),
-                        }
+                        })
+
+        # Sort by cost (stable, so filtered queries keep the evaluation order within a cost)
+        combinations.sort(key=lambda x: x["cost"]["total_fixed"])
+        return tuple(combinations)
+
+
+_default_matrix: Optional[ProviderMatrix] = None
+
 
-                        if budget and combo["cost"]["total_fixed"] > budget:
-                            continue
-                        if complexity and combo["complexity"] != complexity:
-                            continue
+def get_default_matrix() -> ProviderMatrix:
+    """Get the shared static ProviderMatrix, creating it on first use."""
+    global _default_matrix
+    if _default_matrix is None:
+        _default_matrix = ProviderMatrix()
+    return _default_matrix
 
-                        recommendations.append(combo)
 
-        # Sort by cost
-        recommendations.sort(key=lambda x: x["cost"]["total_fixed"])
-        return recommendations
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # DEFAULT_MATRIX is resolved lazily so importing the module stays cheap
+    if name == "DEFAULT_MATRIX":
+        return get_default_matrix()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
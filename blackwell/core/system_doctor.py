@@ -9,22 +9,37 @@ Provides comprehensive health checks for all CLI dependencies including:
 - Configuration validation
 """
 
+import json
+import logging
+import os
+import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, as_completed
+from contextlib import nullcontext
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from dataclasses import asdict, dataclass
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from blackwell import CLI_CONFIG_DIR
 from blackwell.core.config_manager import ConfigManager
-from blackwell.core.cdk_bootstrap_checker import CDKBootstrapChecker
+from blackwell.core.cdk_bootstrap_checker import BootstrapStatus, CDKBootstrapChecker
 
+if TYPE_CHECKING:
+    import configparser
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
 class DiagnosticResult:
     """Result of a diagnostic check."""
     name: str
@@ -34,6 +49,177 @@ class DiagnosticResult:
     fix_suggestion: Optional[str] = None
 
 
+# Overall time limit in seconds for the diagnosis check groups
+DIAGNOSIS_TIMEOUT = 20
+
+# Results of a healthy diagnosis, reused by repeated invocations
+DOCTOR_CACHE_PATH = Path(CLI_CONFIG_DIR).expanduser() / "cache" / "doctor_results.json"
+DOCTOR_CACHE_DURATION = 60
+
+# Table color and title for each diagnostic status, in display order
+_STATUS_STYLES: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "healthy": ("green", "✓ Healthy"),
+    "warning": ("yellow", "⚠ Warnings"),
+    "error": ("red", "✗ Errors"),
+    "info": ("blue", "ℹ Information"),
+})
+
+# Version probe results, keyed on (command, version_arg), shared for the process.
+# Timed-out probes are not cached, so a slow tool is probed again next time
+_command_probes: Dict[Tuple[str, str], Tuple[Optional[bool], str]] = {}
+
+
+def _python_version_result() -> DiagnosticResult:
+    """Check the running interpreter against the CLI's minimum Python version."""
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    if sys.version_info >= (3, 13):
+        return DiagnosticResult(
+            name="Python Version",
+            status="healthy",
+            message=f"Python {python_version} (compatible)",
+            details="Blackwell CLI requires Python 3.13+"
+        )
+    return DiagnosticResult(
+        name="Python Version",
+        status="error",
+        message=f"Python {python_version} (incompatible)",
+        details="Blackwell CLI requires Python 3.13+",
+        fix_suggestion="Upgrade Python to 3.13 or higher"
+    )
+
+
+# The interpreter cannot change within a process, so check it once at import
+_PYTHON_VERSION_RESULT = _python_version_result()
+
+
+def _probe_commands(probes: List[Tuple[str, str]], timeout: float = 3) -> List[Tuple[Optional[bool], str]]:
+    """
+    Run version probes concurrently, reusing results from earlier probes.
+
+    All uncached commands are spawned before any is waited on, so the probes
+    together take about as long as the slowest one.
+
+    Args:
+        probes: (command, version_arg) pairs to run
+        timeout: Overall time limit in seconds for the pending probes
+
+    Returns:
+        (available, output) for each probe, in the order given. available is
+        None when the command was found but its probe timed out, in which
+        case output is the command's path
+    """
+    results: Dict[Tuple[str, str], Tuple[Optional[bool], str]] = {}
+    pending = {}
+    for probe in probes:
+        if probe in _command_probes or probe in pending:
+            continue
+        # A PATH scan is far cheaper than spawning a missing binary
+        executable = shutil.which(probe[0])
+        if not executable:
+            _command_probes[probe] = (False, "")
+            continue
+        try:
+            pending[probe] = subprocess.Popen(
+                [executable, probe[1]],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                # Own process group, so a hung probe can be killed with its children
+                start_new_session=True
+            )
+        except FileNotFoundError:
+            _command_probes[probe] = (False, "")
+
+    deadline = time.monotonic() + timeout
+    for probe, process in pending.items():
+        try:
+            # A probe that already exited is collected even once the deadline has passed
+            remaining = None if process.poll() is not None else max(0, deadline - time.monotonic())
+            stdout, stderr = process.communicate(timeout=remaining)
+            _command_probes[probe] = (process.returncode == 0, stdout or stderr)
+        except subprocess.TimeoutExpired:
+            _kill_process_group(process)
+            process.communicate()
+            results[probe] = (None, process.args[0])
+
+    return [results.get(probe) or _command_probes[probe] for probe in probes]
+
+
+def _probe_timeout_result(name: str, path: str) -> DiagnosticResult:
+    """Result for a command that is installed but didn't report its version in time."""
+    return DiagnosticResult(
+        name=name,
+        status="warning",
+        message=f"{name} found at {path}, version probe timed out",
+        details="The command is installed but was slow to report its version",
+        fix_suggestion="Run 'blackwell doctor' again once the system is less busy"
+    )
+
+
+def _kill_process_group(process: subprocess.Popen) -> None:
+    """Kill a probe started with ``start_new_session`` along with its children."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        process.kill()
+
+
+def _run_in_daemon_thread(fn: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run a call on a daemon thread and return a Future for its result.
+
+    Executor worker threads are joined at interpreter exit, so a hung call
+    would keep the process alive after its future was abandoned; a daemon
+    thread doesn't, which is what bounds doctor's run time.
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _cache_context() -> Dict[str, Optional[str]]:
+    """Environment that selects the AWS identity and region being diagnosed."""
+    return {
+        name: os.environ.get(name)
+        for name in ("AWS_PROFILE", "AWS_DEFAULT_REGION", "AWS_REGION", "AWS_CONFIG_FILE")
+    }
+
+
+def _terse_row(result: DiagnosticResult) -> Tuple[str, ...]:
+    """Table row with the check name and status message."""
+    return result.name, result.message
+
+
+def _verbose_row(result: DiagnosticResult) -> Tuple[str, ...]:
+    """Table row that also carries details and any fix suggestion."""
+    details = result.details or ""
+    if result.fix_suggestion:
+        details += f"\nFix: {result.fix_suggestion}"
+    return result.name, result.message, details
+
+
+class _NullProgress:
+    """Progress stand-in used when output is not a terminal (CI, pipes)."""
+
+    def add_task(self, description: str, total: Optional[float] = None) -> int:
+        return 0
+
+    def advance(self, task_id: int, advance: float = 1) -> None:
+        pass
+
+
 class SystemDoctor:
     """
     Comprehensive system diagnostics for Blackwell CLI.
@@ -47,17 +233,26 @@ class SystemDoctor:
         self.config_manager = config_manager or ConfigManager()
         self.console = console or Console()
         self.bootstrap_checker = CDKBootstrapChecker(console=self.console)
+        # Per-profile results so readiness checks reuse the diagnosis probes
+        self._creds_cache: Dict[Optional[str], Tuple[bool, str]] = {}
+        self._creds_lock = threading.Lock()
+        self._region_cache: Dict[Optional[str], Optional[str]] = {}
+        self._boto_sessions: Dict[Optional[str], Any] = {}
 
-    def run_full_diagnosis(self, verbose: bool = False) -> bool:
+    def run_full_diagnosis(self, verbose: bool = False, use_cache: bool = True) -> bool:
         """
         Run comprehensive system diagnostics.
 
         Args:
             verbose: Show detailed diagnostic information
+            use_cache: Reuse results of a healthy run from the last
+                DOCTOR_CACHE_DURATION seconds instead of re-running checks
 
         Returns:
             True if all critical checks pass, False otherwise
         """
+        from rich.panel import Panel
+
         self.console.print(Panel.fit(
             "[bold blue]Blackwell CLI System Diagnostics[/bold blue]\n\n"
             "Running comprehensive health checks for CLI dependencies,\n"
@@ -65,51 +260,131 @@ class SystemDoctor:
             border_style="blue"
         ))
 
+        cached = self._load_cached_results() if use_cache else None
+        if cached:
+            results, critical_failures = cached
+            self.console.print("[dim]Showing results cached from a recent healthy run[/dim]\n")
+        else:
+            results, critical_failures = self._run_checks()
+            if use_cache:
+                self._save_cached_results(results, critical_failures)
+
+        # Display results
+        self._display_diagnostic_results(results, verbose)
+
+        # Summary
+        self._display_diagnostic_summary(results, critical_failures)
+
+        return critical_failures == 0
+
+    def _run_checks(self) -> Tuple[List[DiagnosticResult], int]:
+        """
+        Run all check groups concurrently.
+
+        Returns:
+            Results in display order and the number of critical errors
+        """
         results = []
         critical_failures = 0
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-            transient=True
-        ) as progress:
-            # 1. System Dependencies
-            task = progress.add_task("Checking system dependencies...", total=None)
-            sys_results = self._check_system_dependencies()
-            results.extend(sys_results)
-            critical_failures += len([r for r in sys_results if r.status == "error"])
-
-            # 2. AWS Configuration
-            progress.update(task, description="Checking AWS configuration...")
-            aws_results = self._check_aws_configuration()
-            results.extend(aws_results)
-            critical_failures += len([r for r in aws_results if r.status == "error"])
-
-            # 3. CDK Bootstrap Status
-            progress.update(task, description="Checking CDK bootstrap status...")
-            bootstrap_results = self._check_cdk_bootstrap_status()
-            results.extend(bootstrap_results)
+        # Check groups in display order, with whether their errors are critical
+        checks = [
+            ("System Dependencies", self._check_system_dependencies, True),
+            ("AWS Configuration", self._check_aws_configuration, True),
             # Bootstrap is warning, not critical for basic CLI functionality
-
-            # 4. Platform Integration
-            progress.update(task, description="Checking platform integration...")
-            platform_results = self._check_platform_integration()
-            results.extend(platform_results)
+            ("CDK Bootstrap", self._check_cdk_bootstrap_status, False),
             # Platform integration is also warning, not critical
+            ("Platform Integration", self._check_platform_integration, False),
+            ("Configuration", self._check_configuration_health, False),
+        ]
+
+        with self._progress() as progress:
+            task = progress.add_task("Running health checks...", total=len(checks))
+
+            # The groups are independent subprocess/network probes, so run them
+            # concurrently; total latency becomes that of the slowest group
+            group_results: List[List[DiagnosticResult]] = [[] for _ in checks]
+            futures = {
+                _run_in_daemon_thread(list, check()): index
+                for index, (_, check, _) in enumerate(checks)
+            }
+            try:
+                for future in as_completed(futures, timeout=DIAGNOSIS_TIMEOUT):
+                    group_results[futures[future]] = future.result()
+                    progress.advance(task)
+            except TimeoutError:
+                # Report hung groups instead of letting an upstream stall block
+                # doctor; their daemon threads are abandoned and don't hold exit
+                for future, index in futures.items():
+                    if not future.done():
+                        name, _, critical = checks[index]
+                        group_results[index] = [DiagnosticResult(
+                            name=name,
+                            status="error" if critical else "warning",
+                            message=f"Check did not finish within {DIAGNOSIS_TIMEOUT}s",
+                            details="A dependency or AWS endpoint is not responding"
+                        )]
+
+        for (_, _, critical), group in zip(checks, group_results):
+            results.extend(group)
+            if critical:
+                critical_failures += len([r for r in group if r.status == "error"])
+
+        return results, critical_failures
+
+    def _load_cached_results(self) -> Optional[Tuple[List[DiagnosticResult], int]]:
+        """Load results of a recent healthy diagnosis run in the same AWS context."""
+        if not DOCTOR_CACHE_PATH.exists():
+            return None
 
-            # 5. Configuration Validation
-            progress.update(task, description="Validating configuration...")
-            config_results = self._check_configuration_health()
-            results.extend(config_results)
+        try:
+            if time.time() - DOCTOR_CACHE_PATH.stat().st_mtime >= DOCTOR_CACHE_DURATION:
+                return None
 
-        # Display results
-        self._display_diagnostic_results(results, verbose)
+            cached = json.loads(DOCTOR_CACHE_PATH.read_text())
+            if cached["context"] != _cache_context():
+                return None
 
-        # Summary
-        self._display_diagnostic_summary(results, critical_failures)
+            results = [DiagnosticResult(**result) for result in cached["results"]]
+            return results, cached["critical_failures"]
 
-        return critical_failures == 0
+        except Exception as e:
+            logger.debug("Ignoring unreadable doctor cache: %s", e)
+            return None
+
+    def _save_cached_results(self, results: List[DiagnosticResult], critical_failures: int) -> None:
+        """
+        Persist diagnosis results for subsequent invocations.
+
+        Only fully healthy runs are cached, so a fix made after a failing run
+        is always picked up by the next one.
+        """
+        if any(result.status in ("error", "warning") for result in results):
+            return
+
+        try:
+            DOCTOR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            DOCTOR_CACHE_PATH.write_text(json.dumps({
+                "context": _cache_context(),
+                "critical_failures": critical_failures,
+                "results": [asdict(result) for result in results],
+            }))
+        except Exception as e:
+            logger.debug("Could not write doctor cache: %s", e)
+
+    def _progress(self):
+        """Spinner for the running checks, or a no-op stand-in when not on a terminal."""
+        if not self.console.is_terminal:
+            return nullcontext(_NullProgress())
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console,
+            transient=True
+        )
 
     def check_deployment_readiness(
         self,
@@ -130,18 +405,19 @@ class SystemDoctor:
         """
         self.console.print("[bold blue]Deployment Readiness Check[/bold blue]\n")
 
-        ready = True
-        issues = []
+        # Issue messages in display order, plus tags selecting the quick fixes
+        issues: List[str] = []
+        issue_tags = set()
 
         # Check CDK installation
         if not self._check_cdk_available():
             issues.append("AWS CDK is not installed")
-            ready = False
+            issue_tags.add("cdk")
 
         # Check AWS credentials
-        if not self._check_aws_credentials(profile):
+        if not self._check_aws_credentials(profile)[0]:
             issues.append("AWS credentials are not configured or invalid")
-            ready = False
+            issue_tags.add("credentials")
 
         # Check CDK bootstrap
         bootstrap_status = self.bootstrap_checker.check_bootstrap_status(
@@ -152,12 +428,14 @@ class SystemDoctor:
 
         if not bootstrap_status.is_bootstrapped:
             issues.append(f"CDK is not bootstrapped in {bootstrap_status.account_id}/{bootstrap_status.region}")
-            ready = False
+            issue_tags.add("bootstrap")
 
         # Check platform path if deploying clients
         if not self.config_manager.is_platform_available():
             issues.append("Platform-infrastructure path is not configured")
-            ready = False
+            issue_tags.add("platform")
+
+        ready = not issues
 
         # Display results
         if ready:
@@ -170,396 +448,383 @@ class SystemDoctor:
                 self.console.print(f"  • [red]{issue}[/red]")
 
             self.console.print("\n[yellow]💡 Quick fixes:[/yellow]")
-            if "CDK is not installed" in issues:
+            if "cdk" in issue_tags:
                 self.console.print("   npm install -g aws-cdk")
-            if "AWS credentials" in str(issues):
+            if "credentials" in issue_tags:
                 if profile:
                     self.console.print(f"   aws configure --profile {profile}")
                 else:
                     self.console.print("   aws configure")
-            if "not bootstrapped" in str(issues):
+            if "bootstrap" in issue_tags:
                 self.console.print("   blackwell deploy bootstrap")
-            if "platform-infrastructure" in str(issues):
+            if "platform" in issue_tags:
                 self.console.print("   blackwell platform path --auto-discover")
 
         return ready
 
-    def _check_system_dependencies(self) -> List[DiagnosticResult]:
+    def _check_system_dependencies(self) -> Iterator[DiagnosticResult]:
         """Check system-level dependencies."""
-        results = []
-
         # Check Python version
-        python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-        if sys.version_info >= (3, 13):
-            results.append(DiagnosticResult(
-                name="Python Version",
-                status="healthy",
-                message=f"Python {python_version} (compatible)",
-                details="Blackwell CLI requires Python 3.13+"
-            ))
-        else:
-            results.append(DiagnosticResult(
-                name="Python Version",
-                status="error",
-                message=f"Python {python_version} (incompatible)",
-                details="Blackwell CLI requires Python 3.13+",
-                fix_suggestion="Upgrade Python to 3.13 or higher"
-            ))
+        yield _PYTHON_VERSION_RESULT
+
+        # Version probes are independent process spawns, so launch them together
+        node_result, cdk_result, aws_result, git_result = _probe_commands([
+            ("node", "--version"),
+            ("cdk", "--version"),
+            ("aws", "--version"),
+            ("git", "--version"),
+        ])
 
         # Check Node.js (required for CDK)
-        node_result = self._check_command_available("node", "--version")
         if node_result[0]:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="Node.js",
                 status="healthy",
                 message=f"Node.js {node_result[1].strip()} (available)",
                 details="Required for AWS CDK"
-            ))
+            )
+        elif node_result[0] is None:
+            yield _probe_timeout_result("Node.js", node_result[1])
         else:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="Node.js",
                 status="error",
                 message="Node.js not found",
                 details="Node.js is required for AWS CDK",
                 fix_suggestion="Install Node.js from https://nodejs.org"
-            ))
+            )
 
         # Check AWS CDK
-        cdk_result = self._check_command_available("cdk", "--version")
         if cdk_result[0]:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS CDK",
                 status="healthy",
                 message=f"CDK {cdk_result[1].strip()} (available)",
                 details="AWS Cloud Development Kit"
-            ))
+            )
+        elif cdk_result[0] is None:
+            yield _probe_timeout_result("AWS CDK", cdk_result[1])
         else:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS CDK",
                 status="error",
                 message="AWS CDK not found",
                 details="CDK is required for infrastructure deployment",
                 fix_suggestion="Install CDK with: npm install -g aws-cdk"
-            ))
+            )
 
         # Check AWS CLI
-        aws_result = self._check_command_available("aws", "--version")
         if aws_result[0]:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS CLI",
                 status="healthy",
                 message=f"AWS CLI {aws_result[1].split()[0]} (available)",
                 details="AWS Command Line Interface"
-            ))
+            )
+        elif aws_result[0] is None:
+            yield _probe_timeout_result("AWS CLI", aws_result[1])
         else:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS CLI",
                 status="error",
                 message="AWS CLI not found",
                 details="AWS CLI is required for deployment and configuration",
                 fix_suggestion="Install AWS CLI from https://aws.amazon.com/cli/"
-            ))
+            )
 
         # Check Git (helpful for version control)
-        git_result = self._check_command_available("git", "--version")
         if git_result[0]:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="Git",
                 status="info",
                 message=f"Git {git_result[1].strip()} (available)",
                 details="Version control system (recommended)"
-            ))
+            )
+        elif git_result[0] is None:
+            yield _probe_timeout_result("Git", git_result[1])
         else:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="Git",
                 status="warning",
                 message="Git not found (optional)",
                 details="Git is recommended for version control",
                 fix_suggestion="Install Git from https://git-scm.com"
-            ))
-
-        return results
+            )
 
-    def _check_aws_configuration(self) -> List[DiagnosticResult]:
+    def _check_aws_configuration(self) -> Iterator[DiagnosticResult]:
         """Check AWS configuration and credentials."""
-        results = []
-
         # Check default AWS credentials
         credentials_valid, creds_info = self._check_aws_credentials()
         if credentials_valid:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS Credentials",
                 status="healthy",
                 message="AWS credentials are configured and valid",
                 details=creds_info
-            ))
+            )
         else:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS Credentials",
                 status="error",
                 message="AWS credentials are missing or invalid",
                 details=creds_info,
                 fix_suggestion="Run: aws configure"
-            ))
+            )
 
         # Check AWS region configuration
         region = self._get_aws_region()
         if region:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS Region",
                 status="healthy",
                 message=f"Default region: {region}",
                 details="AWS region is configured"
-            ))
+            )
         else:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS Region",
                 status="warning",
                 message="No default AWS region configured",
                 details="Will use us-east-1 as fallback",
                 fix_suggestion="Set region with: aws configure set region <region>"
-            ))
+            )
 
         # Check AWS profiles
         profiles = self._get_aws_profiles()
         if profiles:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS Profiles",
                 status="info",
                 message=f"Available profiles: {', '.join(profiles[:3])}{'...' if len(profiles) > 3 else ''}",
                 details=f"Total profiles: {len(profiles)}"
-            ))
+            )
         else:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="AWS Profiles",
                 status="info",
                 message="Using default profile only",
                 details="Additional profiles can be configured for multi-account deployment"
-            ))
-
-        return results
+            )
 
-    def _check_cdk_bootstrap_status(self) -> List[DiagnosticResult]:
+    def _check_cdk_bootstrap_status(self) -> Iterator[DiagnosticResult]:
         """Check CDK bootstrap status for current account/region."""
-        results = []
+        # Only probe once credentials are known to be valid; the check is shared
+        # with the AWS configuration group, so it runs once
+        if not self._check_aws_credentials()[0]:
+            yield DiagnosticResult(
+                name="CDK Bootstrap Status",
+                status="warning",
+                message="Skipped — AWS credentials invalid",
+                details="Bootstrap status can only be checked with valid AWS credentials",
+                fix_suggestion="Run: aws configure"
+            )
+            return
 
         try:
-            # Get current AWS context
-            account_id, region = self.bootstrap_checker._get_aws_context()
+            account_id, region, bootstrap_status = self._probe_bootstrap_status()
 
-            if not account_id or not region:
-                results.append(DiagnosticResult(
+            if bootstrap_status is None:
+                yield DiagnosticResult(
                     name="CDK Bootstrap Status",
                     status="warning",
                     message="Cannot check bootstrap status",
                     details="AWS account ID or region could not be determined",
                     fix_suggestion="Ensure AWS credentials are properly configured"
-                ))
-                return results
-
-            # Check bootstrap status
-            bootstrap_status = self.bootstrap_checker.check_bootstrap_status(
-                account_id=account_id,
-                region=region
-            )
+                )
+                return
 
             if bootstrap_status.is_bootstrapped:
-                results.append(DiagnosticResult(
+                yield DiagnosticResult(
                     name="CDK Bootstrap",
                     status="healthy",
                     message=f"Account {account_id} region {region} is bootstrapped",
                     details=f"CDK version: {bootstrap_status.cdk_toolkit_version or 'detected'}"
-                ))
+                )
             elif bootstrap_status.cdk_toolkit_stack_exists:
-                results.append(DiagnosticResult(
+                yield DiagnosticResult(
                     name="CDK Bootstrap",
                     status="warning",
                     message=f"Partial bootstrap in {account_id}/{region}",
                     details="CDKToolkit stack exists but some resources may be missing",
                     fix_suggestion="Run: blackwell deploy bootstrap"
-                ))
+                )
             else:
-                results.append(DiagnosticResult(
+                yield DiagnosticResult(
                     name="CDK Bootstrap",
                     status="warning",
                     message=f"Account {account_id} region {region} is not bootstrapped",
                     details="CDK bootstrap is required for deployment",
                     fix_suggestion="Run: blackwell deploy bootstrap"
-                ))
+                )
 
             # Check for errors
             if bootstrap_status.errors:
                 for error in bootstrap_status.errors:
-                    results.append(DiagnosticResult(
+                    yield DiagnosticResult(
                         name="CDK Bootstrap Error",
                         status="warning",
                         message="Bootstrap check encountered issues",
                         details=error
-                    ))
+                    )
 
         except Exception as e:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="CDK Bootstrap Check",
                 status="warning",
                 message="Bootstrap status check failed",
                 details=str(e),
                 fix_suggestion="Check AWS credentials and permissions"
-            ))
+            )
 
-        return results
+    def _probe_bootstrap_status(self) -> Tuple[Optional[str], Optional[str], Optional[BootstrapStatus]]:
+        """Resolve the current AWS account/region and check its bootstrap status."""
+        account_id, region = self.bootstrap_checker._get_aws_context()
+        if not account_id or not region:
+            return account_id, region, None
 
-    def _check_platform_integration(self) -> List[DiagnosticResult]:
-        """Check platform-infrastructure integration status."""
-        results = []
+        bootstrap_status = self.bootstrap_checker.check_bootstrap_status(
+            account_id=account_id,
+            region=region
+        )
+        return account_id, region, bootstrap_status
 
+    def _check_platform_integration(self) -> Iterator[DiagnosticResult]:
+        """Check platform-infrastructure integration status."""
         try:
             # Check if platform path is configured
             platform_path = self.config_manager.get_platform_path()
             if platform_path:
-                results.append(DiagnosticResult(
+                yield DiagnosticResult(
                     name="Platform Path",
                     status="healthy",
                     message=f"Platform path configured: {platform_path}",
                     details="Path to platform-infrastructure project"
-                ))
+                )
 
                 # Check if platform is available
                 if self.config_manager.is_platform_available():
-                    results.append(DiagnosticResult(
+                    yield DiagnosticResult(
                         name="Platform Integration",
                         status="healthy",
                         message="Platform integration is active",
                         details="Dynamic provider matrix available"
-                    ))
+                    )
 
                     # Check provider matrix
                     try:
-                        provider_matrix = self.config_manager.get_provider_matrix()
-                        providers = provider_matrix.list_all_providers()
+                        providers = self._provider_snapshot
 
                         cms_count = len(providers.get("cms", {}))
                         ecommerce_count = len(providers.get("ecommerce", {}))
                         ssg_count = len(providers.get("ssg", {}))
 
-                        results.append(DiagnosticResult(
+                        yield DiagnosticResult(
                             name="Provider Matrix",
                             status="healthy",
                             message=f"Providers available: {cms_count} CMS, {ecommerce_count} E-commerce, {ssg_count} SSG",
                             details="Provider data loaded successfully"
-                        ))
+                        )
                     except Exception as e:
-                        results.append(DiagnosticResult(
+                        yield DiagnosticResult(
                             name="Provider Matrix",
                             status="warning",
                             message="Provider matrix load failed",
                             details=str(e)
-                        ))
+                        )
                 else:
-                    results.append(DiagnosticResult(
+                    yield DiagnosticResult(
                         name="Platform Integration",
                         status="warning",
                         message="Platform path configured but not available",
                         details="Check platform-infrastructure installation",
                         fix_suggestion="Verify platform-infrastructure is properly installed"
-                    ))
+                    )
             else:
-                results.append(DiagnosticResult(
+                yield DiagnosticResult(
                     name="Platform Path",
                     status="warning",
                     message="Platform path not configured",
                     details="Using static provider definitions",
                     fix_suggestion="Run: blackwell platform path --auto-discover"
-                ))
+                )
 
         except Exception as e:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="Platform Integration Check",
                 status="warning",
                 message="Platform integration check failed",
                 details=str(e)
-            ))
+            )
 
-        return results
+    @cached_property
+    def _provider_snapshot(self) -> Mapping[str, Tuple[str, ...]]:
+        """Read-only provider names by type, loaded once per SystemDoctor."""
+        return self.config_manager.get_provider_matrix().list_all_providers()
 
-    def _check_configuration_health(self) -> List[DiagnosticResult]:
+    def _check_configuration_health(self) -> Iterator[DiagnosticResult]:
         """Check CLI configuration health."""
-        results = []
-
         try:
             # Check configuration file
             config_path = self.config_manager.get_config_path()
             if config_path and config_path.exists():
-                results.append(DiagnosticResult(
+                yield DiagnosticResult(
                     name="Configuration File",
                     status="healthy",
                     message=f"Configuration loaded from {config_path}",
                     details="CLI configuration file exists and loaded"
-                ))
+                )
             else:
-                results.append(DiagnosticResult(
+                yield DiagnosticResult(
                     name="Configuration File",
                     status="info",
                     message="Using default configuration",
                     details="No custom configuration file found (using defaults)"
-                ))
+                )
 
             # Validate configuration
             issues = self.config_manager.validate_configuration()
             if issues:
                 for issue in issues:
-                    results.append(DiagnosticResult(
+                    yield DiagnosticResult(
                         name="Configuration Issue",
                         status="warning",
                         message="Configuration validation issue",
                         details=issue,
                         fix_suggestion="Check configuration settings"
-                    ))
+                    )
             else:
-                results.append(DiagnosticResult(
+                yield DiagnosticResult(
                     name="Configuration Validation",
                     status="healthy",
                     message="Configuration validation passed",
                     details="All configuration settings are valid"
-                ))
+                )
 
         except Exception as e:
-            results.append(DiagnosticResult(
+            yield DiagnosticResult(
                 name="Configuration Check",
                 status="warning",
                 message="Configuration check failed",
                 details=str(e)
-            ))
-
-        return results
+            )
 
     def _display_diagnostic_results(self, results: List[DiagnosticResult], verbose: bool = False) -> None:
         """Display diagnostic results in formatted tables."""
-        # Group results by status
-        status_groups = {
-            "healthy": [],
-            "warning": [],
-            "error": [],
-            "info": []
-        }
+        from rich.table import Table
 
+        # Group results by status in a single pass
+        status_groups: Dict[str, List[DiagnosticResult]] = defaultdict(list)
         for result in results:
             status_groups[result.status].append(result)
 
+        build_row = _verbose_row if verbose else _terse_row
+
         # Display each group
-        for status, group_results in status_groups.items():
+        for status, (color, title) in _STATUS_STYLES.items():
+            group_results = status_groups.get(status)
             if not group_results:
                 continue
 
-            # Status styling
-            status_styles = {
-                "healthy": ("green", "✓ Healthy"),
-                "warning": ("yellow", "⚠ Warnings"),
-                "error": ("red", "✗ Errors"),
-                "info": ("blue", "ℹ Information")
-            }
-
-            color, title = status_styles[status]
-
             table = Table(title=title, title_style=color)
             table.add_column("Check", style="cyan", no_wrap=True)
             table.add_column("Status", style=color)
@@ -568,20 +833,15 @@ class SystemDoctor:
                 table.add_column("Details", style="dim")
 
             for result in group_results:
-                row = [result.name, result.message]
-                if verbose:
-                    details = result.details or ""
-                    if result.fix_suggestion:
-                        details += f"\nFix: {result.fix_suggestion}"
-                    row.append(details)
-
-                table.add_row(*row)
+                table.add_row(*build_row(result))
 
             self.console.print(table)
             self.console.print()
 
     def _display_diagnostic_summary(self, results: List[DiagnosticResult], critical_failures: int) -> None:
         """Display diagnostic summary."""
+        from rich.panel import Panel
+
         # Count results by status
         status_counts = {"healthy": 0, "warning": 0, "error": 0, "info": 0}
         for result in results:
@@ -628,82 +888,91 @@ class SystemDoctor:
             self.console.print("• Run 'blackwell deploy bootstrap' if planning to deploy")
             self.console.print("• Use 'blackwell platform path --auto-discover' for enhanced features")
 
-    def _check_command_available(self, command: str, version_arg: str = "--version") -> Tuple[bool, str]:
+    def _check_command_available(self, command: str, version_arg: str = "--version") -> Tuple[Optional[bool], str]:
         """Check if a command is available and get version info."""
-        try:
-            result = subprocess.run(
-                [command, version_arg],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return result.returncode == 0, result.stdout or result.stderr
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False, ""
+        return _probe_commands([(command, version_arg)])[0]
 
     def _check_cdk_available(self) -> bool:
         """Check if CDK is available."""
-        return self._check_command_available("cdk", "--version")[0]
+        # A probe that timed out still found the command installed
+        return self._check_command_available("cdk", "--version")[0] is not False
 
     def _check_aws_credentials(self, profile: Optional[str] = None) -> Tuple[bool, str]:
         """Check AWS credentials validity."""
-        try:
-            cmd = ["aws", "sts", "get-caller-identity"]
-            if profile:
-                cmd.extend(["--profile", profile])
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-
-            if result.returncode == 0:
-                # Parse account info
-                import json
-                identity = json.loads(result.stdout)
-                account_id = identity.get("Account", "unknown")
-                user_arn = identity.get("Arn", "unknown")
-                return True, f"Account: {account_id}, Identity: {user_arn.split('/')[-1]}"
-            else:
-                return False, result.stderr.strip() or "Invalid credentials"
+        with self._creds_lock:
+            if profile not in self._creds_cache:
+                self._creds_cache[profile] = self._fetch_aws_credentials(profile)
+            return self._creds_cache[profile]
 
+    def _fetch_aws_credentials(self, profile: Optional[str] = None) -> Tuple[bool, str]:
+        """Validate AWS credentials with an STS ``GetCallerIdentity`` call."""
+        try:
+            from botocore.config import Config
+            from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
+
+            # Fail fast on unreachable endpoints instead of retrying for minutes
+            sts_config = Config(connect_timeout=3, read_timeout=5, retries={"max_attempts": 1})
+            try:
+                identity = self._get_boto_session(profile).client("sts", config=sts_config).get_caller_identity()
+            except (NoCredentialsError, ProfileNotFound, ClientError) as e:
+                return False, str(e) or "Invalid credentials"
+
+            account_id = identity.get("Account", "unknown")
+            user_arn = identity.get("Arn", "unknown")
+            return True, f"Account: {account_id}, Identity: {user_arn.split('/')[-1]}"
+
+        except ImportError:
+            return False, "boto3 not available"
         except Exception as e:
             return False, str(e)
 
-    def _get_aws_region(self, profile: Optional[str] = None) -> Optional[str]:
-        """Get configured AWS region."""
-        try:
-            cmd = ["aws", "configure", "get", "region"]
-            if profile:
-                cmd.extend(["--profile", profile])
+    def _get_boto_session(self, profile: Optional[str] = None):
+        """Get the boto3 session for a profile, creating it on first use."""
+        if profile not in self._boto_sessions:
+            import boto3
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            region = result.stdout.strip() if result.returncode == 0 else None
-
-            # Fallback to environment variable
-            if not region:
-                import os
-                region = os.environ.get("AWS_DEFAULT_REGION")
+            # boto3 resolves the region from the profile and environment itself
+            self._boto_sessions[profile] = boto3.Session(profile_name=profile)
+        return self._boto_sessions[profile]
 
+    def _get_aws_region(self, profile: Optional[str] = None) -> Optional[str]:
+        """Get configured AWS region."""
+        if profile not in self._region_cache:
+            self._region_cache[profile] = self._fetch_aws_region(profile)
+        return self._region_cache[profile]
+
+    @cached_property
+    def _aws_config(self) -> "configparser.ConfigParser":
+        """The shared AWS config file, parsed once per SystemDoctor."""
+        import configparser
+
+        config = configparser.ConfigParser()
+        # A missing file simply leaves the parser empty
+        config.read(os.environ.get("AWS_CONFIG_FILE") or Path.home() / ".aws" / "config")
+        return config
+
+    def _fetch_aws_region(self, profile: Optional[str] = None) -> Optional[str]:
+        """Resolve the AWS region with the same precedence as the AWS CLI."""
+        # Environment variables override the config file
+        region = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
+        if region:
             return region
+
+        try:
+            profile = profile or os.environ.get("AWS_PROFILE")
+            section = "default" if profile in (None, "default") else f"profile {profile}"
+            return self._aws_config.get(section, "region", fallback=None)
         except Exception:
             return None
 
     def _get_aws_profiles(self) -> List[str]:
         """Get list of configured AWS profiles."""
         try:
-            from pathlib import Path
-            import configparser
-
-            aws_config_path = Path.home() / ".aws" / "config"
-            if not aws_config_path.exists():
-                return []
-
-            config = configparser.ConfigParser()
-            config.read(aws_config_path)
-
             profiles = []
-            for section in config.sections():
+            for section in self._aws_config.sections():
                 if section.startswith("profile "):
                     profiles.append(section.replace("profile ", ""))
 
             return profiles
         except Exception:
-            return []
\ No newline at end of file
+            return []
@@ -0,0 +1,34 @@
+"""
+Blackwell CLI - Console Script Launcher
+
+Answers top-level queries that need no command tree, such as --version,
+before Typer, Rich and the command modules are imported, and hands every
+other invocation to blackwell.main.
+"""
+
+import sys
+
+
+def _print_version() -> None:
+    """Print the version line; a bare version query needs nothing else."""
+    from blackwell import __version__, CLI_NAME
+
+    print(f"{CLI_NAME.title()} CLI v{__version__}")
+
+
+# Flags answered without Typer when they are the only argument
+_FAST_HANDLERS = {
+    "--version": _print_version,
+    "-v": _print_version,
+}
+
+
+def main() -> None:
+    """Run the 'blackwell' command."""
+    if len(sys.argv) == 2 and sys.argv[1] in _FAST_HANDLERS:
+        _FAST_HANDLERS[sys.argv[1]]()
+        sys.exit(0)
+
+    from blackwell.main import main_entry_point
+
+    main_entry_point()
@@ -5,39 +5,90 @@ This is the main entry point for the Blackwell CLI application.
 It sets up the command structure and handles global configuration.
 """
 
+import importlib
+import os
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+from typer.core import TyperGroup
 from pathlib import Path
 import sys
-from typing import Optional
-
-# Import command modules
-from blackwell.commands import (
-    init,
-    create,
-    delete,
-    deploy,
-    migrate,
-    list as list_cmd,
-    config,
-    templates,
-    platform,
-    bootstrap,
-)
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-# Import core components
-from blackwell.core.config_manager import ConfigManager
+# Package constants only; the package defers importing its managers
 from blackwell import __version__, CLI_NAME
 
-# Initialize Rich console for beautiful output
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from blackwell.core.config_manager import ConfigManager
+
+# Command groups by name: (module path, help text, help panel). Modules are
+# imported only when their group is dispatched to, so --help, --version and
+# single-group invocations don't load every command tree and its dependencies
+_COMMAND_GROUPS: Dict[str, Tuple[str, str, str]] = {
+    "init": ("blackwell.commands.init", "Initialize workspace and create new projects", "Setup Commands"),
+    "create": ("blackwell.commands.create", "Create clients, stacks, and templates", "Creation Commands"),
+    "delete": ("blackwell.commands.delete", "Delete clients, templates, and configurations", "Deletion Commands"),
+    "deploy": ("blackwell.commands.deploy", "Deploy, update, and destroy infrastructure", "Deployment Commands"),
+    # Cost command removed - platform focuses on capabilities, not pricing
+    "migrate": ("blackwell.commands.migrate", "Migrate between providers and modes", "Migration Commands"),
+    "list": ("blackwell.commands.list", "List clients, providers, and deployments", "Information Commands"),
+    "config": ("blackwell.commands.config", "Manage CLI configuration and settings", "Configuration"),
+    "templates": ("blackwell.commands.templates", "Manage and apply client templates", "Template Management"),
+    "platform": ("blackwell.commands.platform", "Manage platform-infrastructure integration", "Platform Integration"),
+}
+
+
+def _load_command_group(name: str):
+    """Import a command group's module and build its Click command."""
+    module_path, help_text, panel = _COMMAND_GROUPS[name]
+    sub_app = importlib.import_module(module_path).app
+
+    # Register through a throwaway Typer so the group gets exactly the
+    # name, help and panel handling of a regular add_typer call
+    holder = typer.Typer()
+    holder.add_typer(sub_app, name=name, help=help_text, rich_help_panel=panel)
+    return typer.main.get_group(holder).commands[name]
+
+
+class LazyCommandGroup(TyperGroup):
+    """
+    Root command group whose command groups are imported on dispatch.
 
-# Create the main Typer app
-app = typer.Typer(
-    name=CLI_NAME,
-    help=f"""
+    Help listings only need each group's name, help text and panel, so they
+    are served by lightweight placeholder groups; the real module is imported
+    once the group is actually resolved for invocation or completion.
+    """
+
+    def list_commands(self, ctx) -> List[str]:
+        commands = super().list_commands(ctx)
+        return commands + [name for name in _COMMAND_GROUPS if name not in commands]
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _COMMAND_GROUPS:
+            _, help_text, panel = _COMMAND_GROUPS[cmd_name]
+            command = TyperGroup(name=cmd_name, help=help_text, rich_help_panel=panel)
+        return command
+
+    def resolve_command(self, ctx, args):
+        cmd_name, command, args = super().resolve_command(ctx, args)
+        if cmd_name in _COMMAND_GROUPS and cmd_name not in self.commands:
+            command = _load_command_group(cmd_name)
+            self.add_command(command, cmd_name)
+        return cmd_name, command, args
+
+
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Rich console for beautiful output, created on first print."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Root help text, formatted once at import and reused by every help path
+_APP_HELP = f"""
     {CLI_NAME.title()} CLI - Simplify composable web stack deployment
 
     Create, deploy, and manage sophisticated multi-client web infrastructure
@@ -51,36 +102,57 @@ app = typer.Typer(
     • Provider migration and upgrade assistance
 
     Get started: {CLI_NAME} init workspace
-    """,
+    """
+
+# Create the main Typer app
+app = typer.Typer(
+    name=CLI_NAME,
+    help=_APP_HELP,
     rich_markup_mode="rich",
     no_args_is_help=True,
-    add_completion=True,
+    # Completion is served by the `completion` command, so its machinery
+    # isn't set up on every invocation
+    add_completion=False,
     context_settings={"help_option_names": ["-h", "--help"]},
+    cls=LazyCommandGroup,
 )
 
-# Global state
-config_manager: Optional[ConfigManager] = None
+# Subcommands that fetch the configuration manager themselves when needed;
+# None is a bare invocation, which only shows help
+_SELF_CONFIGURING_COMMANDS = frozenset({None, "doctor", "quickstart", "completion"})
+
+# Environment variable through which the shell requests completions
+_COMPLETE_VAR = f"_{CLI_NAME.upper()}_COMPLETE"
 
+# Global options from the root callback, applied when the configuration
+# manager is first built
+_config_options: Dict[str, Any] = {}
 
-def get_config_manager() -> ConfigManager:
+
+@lru_cache(maxsize=None)
+def get_config_manager() -> "ConfigManager":
     """Get or create the global configuration manager."""
-    global config_manager
-    if config_manager is None:
-        config_manager = ConfigManager()
-    return config_manager
+    from blackwell.core.config_manager import ConfigManager
+
+    return ConfigManager(**_config_options)
 
 
 def version_callback(value: bool):
     """Display version information and exit."""
     if value:
+        from rich.panel import Panel
+        from rich.text import Text
+
         version_panel = Panel(
             Text(f"{CLI_NAME.title()} CLI v{__version__}", style="bold blue"),
             title="Version Information",
             subtitle=f"Simplify composable web stack deployment",
             border_style="blue",
         )
-        console.print(version_panel)
-        raise typer.Exit()
+        _console().print(version_panel)
+        # Eager option with nothing to unwind, so exit without Click teardown
+        sys.stdout.flush()
+        sys.exit(0)
 
 
 def check_dependencies_callback(value: bool):
@@ -90,11 +162,13 @@ def check_dependencies_callback(value: bool):
 
         checker = DependencyChecker()
         checker.check_all_dependencies()
-        raise typer.Exit()
+        sys.stdout.flush()
+        sys.exit(0)
 
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: bool = typer.Option(
         None,
         "--version",
@@ -129,91 +203,21 @@ def main(
     intelligent provider selection and capability-focused recommendations.
     """
     # Set up global configuration
-    global config_manager
-    try:
-        config_manager = ConfigManager(config_path=config_path, verbose=verbose)
-    except Exception as e:
-        console.print(f"[red]Error initializing configuration: {e}[/red]")
-        raise typer.Exit(1)
+    _config_options.update(config_path=config_path, verbose=verbose)
+    get_config_manager.cache_clear()
+
+    # Build it now, so errors are reported up front, unless the command
+    # builds it itself on demand
+    if ctx.invoked_subcommand not in _SELF_CONFIGURING_COMMANDS:
+        try:
+            get_config_manager()
+        except Exception as e:
+            _console().print(f"[red]Error initializing configuration: {e}[/red]")
+            raise typer.Exit(1)
 
     # Set verbosity level
     if verbose:
-        console.print("[dim]Verbose mode enabled[/dim]")
-
-
-# Register all command groups
-app.add_typer(
-    init.app,
-    name="init",
-    help="Initialize workspace and create new projects",
-    rich_help_panel="Setup Commands",
-)
-
-app.add_typer(
-    create.app,
-    name="create",
-    help="Create clients, stacks, and templates",
-    rich_help_panel="Creation Commands",
-)
-
-app.add_typer(
-    delete.app,
-    name="delete",
-    help="Delete clients, templates, and configurations",
-    rich_help_panel="Deletion Commands",
-)
-
-app.add_typer(
-    deploy.app,
-    name="deploy",
-    help="Deploy, update, and destroy infrastructure",
-    rich_help_panel="Deployment Commands",
-)
-
-# Add bootstrap commands as subcommands under deploy
-deploy.app.add_typer(
-    bootstrap.app,
-    name="bootstrap",
-    help="Manage CDK bootstrap operations",
-    rich_help_panel="Bootstrap Management",
-)
-
-# Cost command removed - platform focuses on capabilities, not pricing
-
-app.add_typer(
-    migrate.app,
-    name="migrate",
-    help="Migrate between providers and modes",
-    rich_help_panel="Migration Commands",
-)
-
-app.add_typer(
-    list_cmd.app,
-    name="list",
-    help="List clients, providers, and deployments",
-    rich_help_panel="Information Commands",
-)
-
-app.add_typer(
-    config.app,
-    name="config",
-    help="Manage CLI configuration and settings",
-    rich_help_panel="Configuration",
-)
-
-app.add_typer(
-    templates.app,
-    name="templates",
-    help="Manage and apply client templates",
-    rich_help_panel="Template Management",
-)
-
-app.add_typer(
-    platform.app,
-    name="platform",
-    help="Manage platform-infrastructure integration",
-    rich_help_panel="Platform Integration",
-)
+        _console().print("[dim]Verbose mode enabled[/dim]")
 
 
 @app.command(name="doctor", rich_help_panel="Utilities")
@@ -248,6 +252,41 @@ def doctor(
         raise typer.Exit(0 if success else 1)
 
 
+@app.command(name="completion", rich_help_panel="Utilities")
+def completion(
+    action: str = typer.Argument(..., help="'install' to set up completion, 'show' to print the script"),
+    shell: Optional[str] = typer.Option(None, "--shell", help="Target shell (detected when omitted)"),
+):
+    """
+    Install or show shell completion.
+
+    Examples:
+      blackwell completion install
+      blackwell completion show --shell zsh
+    """
+    from typer.completion import completion_init, get_completion_script, install
+
+    completion_init()
+
+    if action == "install":
+        shell, path = install(shell=shell, prog_name=CLI_NAME, complete_var=_COMPLETE_VAR)
+        _console().print(f"[green]{shell} completion installed in {path}[/green]")
+        _console().print("Completion will take effect once you restart the terminal")
+    elif action == "show":
+        if shell is None:
+            import shellingham
+
+            try:
+                shell = shellingham.detect_shell()[0]
+            except shellingham.ShellDetectionFailure:
+                _console().print("[red]Could not detect the shell, pass it with --shell[/red]")
+                raise typer.Exit(1)
+        print(get_completion_script(prog_name=CLI_NAME, complete_var=_COMPLETE_VAR, shell=shell))
+    else:
+        _console().print(f"[red]Unknown action '{action}', use 'install' or 'show'[/red]")
+        raise typer.Exit(1)
+
+
 @app.command(name="quickstart", rich_help_panel="Setup Commands")
 def quickstart():
     """
@@ -266,27 +305,42 @@ def quickstart():
 @app.command(hidden=True)
 def _handle_error(error_code: int = 1):
     """Handle CLI errors gracefully."""
-    console.print(
+    _console().print(
         f"[red]An error occurred. Use '{CLI_NAME} doctor' to diagnose issues.[/red]"
     )
     raise typer.Exit(error_code)
 
 
+def _is_debug_mode() -> bool:
+    """Check debug mode without loading the configuration just to format an error."""
+    # Reuse the configuration manager if the command already built it
+    if get_config_manager.cache_info().currsize:
+        return get_config_manager().is_debug_mode()
+    return os.getenv("BLACKWELL_DEBUG", "").lower() in ("true", "1", "yes")
+
+
 def cli_exception_handler(exc_type, exc_value, exc_traceback):
     """Custom exception handler for the CLI."""
     if exc_type == KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user.[/yellow]")
+        _console().print("\n[yellow]Operation cancelled by user.[/yellow]")
         sys.exit(130)  # Standard exit code for Ctrl+C
 
-    # For development, show full traceback
-    if get_config_manager().is_debug_mode():
-        import traceback
-
-        console.print("[red]Debug mode - Full traceback:[/red]")
-        traceback.print_exception(exc_type, exc_value, exc_traceback)
+    # Each branch renders as a single print
+    if _is_debug_mode():
+        # For development, show full traceback
+        from rich.console import Group
+        from rich.text import Text
+        from rich.traceback import Traceback
+
+        _console().print(Group(
+            Text("Debug mode - Full traceback:", style="red"),
+            Traceback.from_exception(exc_type, exc_value, exc_traceback),
+        ))
     else:
-        console.print(f"[red]Unexpected error: {exc_value}[/red]")
-        console.print(f"[dim]Use --verbose or '{CLI_NAME} doctor' for more details[/dim]")
+        _console().print(
+            f"[red]Unexpected error: {exc_value}[/red]\n"
+            f"[dim]Use --verbose or '{CLI_NAME} doctor' for more details[/dim]"
+        )
 
     sys.exit(1)
 
@@ -294,16 +348,23 @@ def cli_exception_handler(exc_type, exc_value, exc_traceback):
 def main_entry_point():
     """
     Main entry point for the CLI when called from command line.
-    This is what gets called when user runs 'blackwell' command.
+    The 'blackwell' command reaches this through blackwell.entry, which
+    answers queries like --version before Typer is imported.
     """
     # Set up custom exception handling
     sys.excepthook = cli_exception_handler
 
+    # Completion requests from the shell need Typer's completion classes
+    if _COMPLETE_VAR in os.environ:
+        from typer.completion import completion_init
+
+        completion_init()
+
     try:
         app()
     except Exception as e:
-        console.print(f"[red]Fatal error: {e}[/red]")
-        console.print(f"[dim]Run '{CLI_NAME} doctor' to diagnose the issue[/dim]")
+        _console().print(f"[red]Fatal error: {e}[/red]")
+        _console().print(f"[dim]Run '{CLI_NAME} doctor' to diagnose the issue[/dim]")
         sys.exit(1)
 
 
@@ -10,29 +10,46 @@ from pathlib import Path
 # Add current directory to path
 sys.path.insert(0, '.')
 
+# Resolved once; resolve() stats every path component
+try:
+    _PLATFORM_PATH = Path("../platform-infrastructure").resolve()
+except OSError:
+    _PLATFORM_PATH = Path("../platform-infrastructure").absolute()
+
+
+def _list_dir(path: Path) -> set:
+    """Return the entry names of a directory in one scan (empty if missing)."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _add_platform_path():
+    """Put the platform path on sys.path once."""
+    if str(_PLATFORM_PATH) not in sys.path:
+        sys.path.insert(0, str(_PLATFORM_PATH))
+
 def test_platform_import():
     """Test the platform import directly"""
     print("🔍 Testing Platform Import...")
 
     # Check if platform-infrastructure path exists
-    platform_path = Path("../platform-infrastructure").resolve()
+    platform_path = _PLATFORM_PATH
+    platform_entries = _list_dir(platform_path)
+    platform_exists = platform_path.is_dir()
     print(f"Platform path: {platform_path}")
-    print(f"Platform path exists: {platform_path.exists()}")
+    print(f"Platform path exists: {platform_exists}")
 
-    if platform_path.exists():
+    if platform_exists:
         # Check if it has the required structure
-        required_files = [
-            "shared/factories/platform_stack_factory.py",
-            "pyproject.toml"
-        ]
-
-        for file in required_files:
-            file_path = platform_path / file
-            print(f"  {file}: {file_path.exists()}")
-
-    # Add platform path to Python path
-    if platform_path.exists():
-        sys.path.insert(0, str(platform_path))
+        factory_entries = _list_dir(platform_path / "shared" / "factories")
+        print(f"  shared/factories/platform_stack_factory.py: {'platform_stack_factory.py' in factory_entries}")
+        print(f"  pyproject.toml: {'pyproject.toml' in platform_entries}")
+
+        # Add platform path to Python path
+        _add_platform_path()
         print(f"Added to Python path: {platform_path}")
 
     # Test the import directly
@@ -59,18 +76,14 @@ def test_platform_import():
         print(f"❌ Import failed: {e}")
 
         # Check if the module file exists
-        module_file = platform_path / "platform_infrastructure" / "shared" / "factories" / "platform_stack_factory.py"
-        print(f"Module file exists: {module_file.exists()}")
+        package_dir = platform_path / "platform_infrastructure"
+        package_dirs = [package_dir, package_dir / "shared", package_dir / "shared" / "factories"]
+        listings = [_list_dir(directory) for directory in package_dirs]
+        print(f"Module file exists: {'platform_stack_factory.py' in listings[-1]}")
 
         # Check if __init__.py files exist
-        init_files = [
-            platform_path / "platform_infrastructure" / "__init__.py",
-            platform_path / "platform_infrastructure" / "shared" / "__init__.py",
-            platform_path / "platform_infrastructure" / "shared" / "factories" / "__init__.py"
-        ]
-
-        for init_file in init_files:
-            print(f"  {init_file.name}: {init_file.exists()}")
+        for entries in listings:
+            print(f"  __init__.py: {'__init__.py' in entries}")
 
         return False
 
@@ -85,9 +98,8 @@ def test_safe_import_pattern():
     print("\n🛡️ Testing Safe Import Pattern...")
 
     # Add platform path to Python path if it exists
-    platform_path = Path("../platform-infrastructure").resolve()
-    if platform_path.exists():
-        sys.path.insert(0, str(platform_path))
+    if _PLATFORM_PATH.is_dir():
+        _add_platform_path()
 
     # Test the pattern from our module
     PLATFORM_AVAILABLE = False
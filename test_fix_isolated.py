@@ -4,6 +4,35 @@ Isolated test to verify the providers command fix logic
 without importing the full module dependencies.
 """
 
+from types import MappingProxyType
+
+# Provider types, in the order the providers command lists them
+PROVIDER_TYPES = ("cms", "ecommerce", "ssg")
+
+# Provider details served by MockProviderMatrix, built once rather than per lookup
+_PROVIDER_DATA = MappingProxyType({
+    "cms": {
+        "decap": {"name": "Decap CMS", "features": ["git_based", "free"]},
+        "tina": {"name": "Tina CMS", "features": ["visual_editing", "live_preview"]},
+        "sanity": {"name": "Sanity CMS", "features": ["structured_content", "api_first"]},
+        "contentful": {"name": "Contentful", "features": ["enterprise", "cdn"]}
+    },
+    "ecommerce": {
+        "snipcart": {"name": "Snipcart", "features": ["simple", "embed"]},
+        "foxy": {"name": "Foxy.io", "features": ["advanced", "customizable"]},
+        "shopify_basic": {"name": "Shopify Basic", "features": ["full_platform", "inventory"]}
+    },
+    "ssg": {
+        "hugo": {"name": "Hugo", "features": ["blazing_fast", "simple"]},
+        "eleventy": {"name": "Eleventy", "features": ["flexible", "zero_config"]},
+        "astro": {"name": "Astro", "features": ["component_islands", "modern"]},
+        "gatsby": {"name": "Gatsby", "features": ["react_based", "graphql"]},
+        "nextjs": {"name": "Next.js", "features": ["react_framework", "ssr"]},
+        "nuxt": {"name": "Nuxt.js", "features": ["vue_framework", "ssr"]},
+        "jekyll": {"name": "Jekyll", "features": ["github_pages", "blog_ready"]}
+    }
+})
+
 def test_list_vs_dict_handling():
     """Test the logic for handling both list and dict provider formats."""
     print("🧪 Testing List vs Dict Handling Logic...")
@@ -56,33 +85,6 @@ def test_list_vs_dict_handling():
         }
     }
 
-    # Mock provider matrix for get_provider_info calls
-    class MockProviderMatrix:
-        def get_provider_info(self, provider_type, provider_key):
-            provider_data = {
-                "cms": {
-                    "decap": {"name": "Decap CMS", "features": ["git_based", "free"]},
-                    "tina": {"name": "Tina CMS", "features": ["visual_editing", "live_preview"]},
-                    "sanity": {"name": "Sanity CMS", "features": ["structured_content", "api_first"]},
-                    "contentful": {"name": "Contentful", "features": ["enterprise", "cdn"]}
-                },
-                "ecommerce": {
-                    "snipcart": {"name": "Snipcart", "features": ["simple", "embed"]},
-                    "foxy": {"name": "Foxy.io", "features": ["advanced", "customizable"]},
-                    "shopify_basic": {"name": "Shopify Basic", "features": ["full_platform", "inventory"]}
-                },
-                "ssg": {
-                    "hugo": {"name": "Hugo", "features": ["blazing_fast", "simple"]},
-                    "eleventy": {"name": "Eleventy", "features": ["flexible", "zero_config"]},
-                    "astro": {"name": "Astro", "features": ["component_islands", "modern"]},
-                    "gatsby": {"name": "Gatsby", "features": ["react_based", "graphql"]},
-                    "nextjs": {"name": "Next.js", "features": ["react_framework", "ssr"]},
-                    "nuxt": {"name": "Nuxt.js", "features": ["vue_framework", "ssr"]},
-                    "jekyll": {"name": "Jekyll", "features": ["github_pages", "blog_ready"]}
-                }
-            }
-            return provider_data.get(provider_type, {}).get(provider_key, {})
-
     provider_matrix = MockProviderMatrix()
 
     # Test both formats with the fixed logic
@@ -95,7 +97,7 @@ def test_list_vs_dict_handling():
         print(f"\n🔍 Testing {case_name}:")
 
         try:
-            for provider_type in ["cms", "ecommerce", "ssg"]:
+            for provider_type in PROVIDER_TYPES:
                 if provider_type in providers_info:
                     providers = providers_info[provider_type]
                     print(f"  {provider_type}: {type(providers).__name__}")
@@ -197,15 +199,7 @@ def test_error_scenario():
 class MockProviderMatrix:
     """Mock provider matrix for testing."""
     def get_provider_info(self, provider_type, provider_key):
-        provider_data = {
-            "cms": {
-                "decap": {"name": "Decap CMS", "features": ["git_based", "free"]},
-                "tina": {"name": "Tina CMS", "features": ["visual_editing", "live_preview"]},
-                "sanity": {"name": "Sanity CMS", "features": ["structured_content", "api_first"]},
-                "contentful": {"name": "Contentful", "features": ["enterprise", "cdn"]}
-            }
-        }
-        return provider_data.get(provider_type, {}).get(provider_key, {})
+        return _PROVIDER_DATA.get(provider_type, {}).get(provider_key, {})
 
 def main():
     """Run all isolated tests."""
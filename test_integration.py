@@ -14,6 +14,9 @@ import sys
 import traceback
 from pathlib import Path
 
+# Top-level keys of transform_to_cli_format() output
+CLI_FORMAT_KEYS = frozenset({"cms", "ecommerce", "ssg"})
+
 def test_safe_imports():
     """Test that safe import patterns work correctly."""
     print("🧪 Testing Safe Import Patterns...")
@@ -62,17 +65,19 @@ def test_dynamic_provider_matrix():
         print(f"  📊 Data source: {data_source}")
 
         # Test provider counts
-        cms_providers = matrix.list_all_providers()["cms"]
-        ecommerce_providers = matrix.list_all_providers()["ecommerce"]
-        ssg_engines = matrix.list_all_providers()["ssg"]
+        providers = matrix.list_all_providers()
+        cms_providers = providers["cms"]
+        ecommerce_providers = providers["ecommerce"]
+        ssg_engines = providers["ssg"]
 
         print(f"  📊 CMS providers: {len(cms_providers)}")
         print(f"  📊 E-commerce providers: {len(ecommerce_providers)}")
         print(f"  📊 SSG engines: {len(ssg_engines)}")
 
         # Test enhanced features if available
-        if hasattr(matrix, 'get_platform_status'):
-            status = matrix.get_platform_status()
+        get_platform_status = getattr(matrix, 'get_platform_status', None)
+        if get_platform_status is not None:
+            status = get_platform_status()
             print(f"  📊 Platform metadata count: {status.get('platform_metadata_count', 0)}")
 
         return True
@@ -122,11 +127,11 @@ def test_config_manager_integration():
         # Test get_provider_matrix method
         provider_matrix = config_manager.get_provider_matrix()
 
-        data_source = "unknown"
-        if hasattr(provider_matrix, 'get_data_source'):
-            data_source = provider_matrix.get_data_source()
-        elif hasattr(provider_matrix, '__class__'):
-            data_source = provider_matrix.__class__.__name__
+        get_data_source = getattr(provider_matrix, 'get_data_source', None)
+        if get_data_source is not None:
+            data_source = get_data_source()
+        else:
+            data_source = type(provider_matrix).__name__
 
         print(f"  📊 Provider matrix type: {data_source}")
 
@@ -183,9 +188,7 @@ def test_transformation_functions():
 
         # Test with empty metadata (should return empty structure)
         empty_result = transform_to_cli_format({})
-        expected_keys = {"cms", "ecommerce", "ssg"}
-
-        if set(empty_result.keys()) == expected_keys:
+        if empty_result.keys() == CLI_FORMAT_KEYS:
             print("  ✅ Empty metadata transformation correct")
         else:
             print(f"  ❌ Empty metadata keys incorrect: {empty_result.keys()}")
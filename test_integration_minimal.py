@@ -8,39 +8,57 @@ Focuses on validating the implementation patterns and logic.
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent
 
 # Add the project to the path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Source files checked by these tests, relative to the project root
+PLATFORM_INTEGRATION_FILE = "blackwell/core/platform_integration.py"
+DYNAMIC_MATRIX_FILE = "blackwell/core/dynamic_provider_matrix.py"
+PLATFORM_COMMAND_FILE = "blackwell/commands/platform.py"
+CONFIG_MANAGER_FILE = "blackwell/core/config_manager.py"
+MAIN_FILE = "blackwell/main.py"
+
+@lru_cache(maxsize=None)
+def _read_source(file_path: str) -> Optional[str]:
+    """Read a source file once per run; None if it doesn't exist."""
+    try:
+        return (PROJECT_ROOT / file_path).read_text()
+    except FileNotFoundError:
+        return None
+
+def _check_patterns(content, patterns, description):
+    """Report the patterns missing from content in one write; True if none are."""
+    missing = [pattern for pattern in patterns if pattern not in content]
+    if missing:
+        print("\n".join(f"  ❌ Missing {description}: {pattern}" for pattern in missing))
+    else:
+        print(f"  ✅ Found all {len(patterns)} {description} checks")
+    return not missing
 
 def test_file_structure():
     """Test that all required files were created correctly."""
     print("📁 Testing File Structure...")
 
-    required_files = [
-        "blackwell/core/platform_integration.py",
-        "blackwell/core/dynamic_provider_matrix.py",
-        "blackwell/commands/platform.py"
-    ]
-
-    modified_files = [
-        "blackwell/core/config_manager.py",
-        "blackwell/main.py"
-    ]
+    required_files = [PLATFORM_INTEGRATION_FILE, DYNAMIC_MATRIX_FILE, PLATFORM_COMMAND_FILE]
+    modified_files = [CONFIG_MANAGER_FILE, MAIN_FILE]
 
     all_present = True
 
     for file_path in required_files:
-        full_path = Path(file_path)
-        if full_path.exists():
+        if _read_source(file_path) is not None:
             print(f"  ✅ Created: {file_path}")
         else:
             print(f"  ❌ Missing: {file_path}")
             all_present = False
 
     for file_path in modified_files:
-        full_path = Path(file_path)
-        if full_path.exists():
+        if _read_source(file_path) is not None:
             print(f"  ✅ Modified: {file_path}")
         else:
             print(f"  ❌ Missing: {file_path}")
@@ -52,14 +70,12 @@ def test_safe_import_pattern():
     """Test that the safe import pattern is implemented correctly."""
     print("\n🛡️ Testing Safe Import Pattern...")
 
-    platform_integration_file = Path("blackwell/core/platform_integration.py")
+    content = _read_source(PLATFORM_INTEGRATION_FILE)
 
-    if not platform_integration_file.exists():
+    if content is None:
         print("  ❌ platform_integration.py not found")
         return False
 
-    content = platform_integration_file.read_text()
-
     # Check for safe import pattern
     patterns_to_check = [
         "try:",
@@ -71,12 +87,8 @@ def test_safe_import_pattern():
     ]
 
     all_patterns_found = True
-    for pattern in patterns_to_check:
-        if pattern in content:
-            print(f"  ✅ Found safe import pattern: {pattern[:50]}...")
-        else:
-            print(f"  ❌ Missing pattern: {pattern}")
-            all_patterns_found = False
+    if not _check_patterns(content, patterns_to_check, "pattern"):
+        all_patterns_found = False
 
     # Check for graceful fallback functions
     key_functions = [
@@ -86,12 +98,8 @@ def test_safe_import_pattern():
         "def get_integration_status()"
     ]
 
-    for func in key_functions:
-        if func in content:
-            print(f"  ✅ Found function: {func}")
-        else:
-            print(f"  ❌ Missing function: {func}")
-            all_patterns_found = False
+    if not _check_patterns(content, key_functions, "function"):
+        all_patterns_found = False
 
     return all_patterns_found
 
@@ -99,14 +107,12 @@ def test_dynamic_provider_matrix_structure():
     """Test the DynamicProviderMatrix class structure."""
     print("\n🔄 Testing DynamicProviderMatrix Structure...")
 
-    dynamic_matrix_file = Path("blackwell/core/dynamic_provider_matrix.py")
+    content = _read_source(DYNAMIC_MATRIX_FILE)
 
-    if not dynamic_matrix_file.exists():
+    if content is None:
         print("  ❌ dynamic_provider_matrix.py not found")
         return False
 
-    content = dynamic_matrix_file.read_text()
-
     # Check for key class and method definitions
     required_elements = [
         "class DynamicProviderMatrix(ProviderMatrix):",
@@ -119,12 +125,8 @@ def test_dynamic_provider_matrix_structure():
     ]
 
     all_found = True
-    for element in required_elements:
-        if element in content:
-            print(f"  ✅ Found: {element}")
-        else:
-            print(f"  ❌ Missing: {element}")
-            all_found = False
+    if not _check_patterns(content, required_elements, "element"):
+        all_found = False
 
     # Check for proper imports
     imports_to_check = [
@@ -132,12 +134,8 @@ def test_dynamic_provider_matrix_structure():
         "from .platform_integration import"
     ]
 
-    for import_stmt in imports_to_check:
-        if import_stmt in content:
-            print(f"  ✅ Found import: {import_stmt}")
-        else:
-            print(f"  ❌ Missing import: {import_stmt}")
-            all_found = False
+    if not _check_patterns(content, imports_to_check, "import"):
+        all_found = False
 
     return all_found
 
@@ -145,14 +143,12 @@ def test_config_manager_enhancements():
     """Test ConfigManager enhancements."""
     print("\n⚙️ Testing ConfigManager Enhancements...")
 
-    config_manager_file = Path("blackwell/core/config_manager.py")
+    content = _read_source(CONFIG_MANAGER_FILE)
 
-    if not config_manager_file.exists():
+    if content is None:
         print("  ❌ config_manager.py not found")
         return False
 
-    content = config_manager_file.read_text()
-
     # Check for new imports
     new_imports = [
         "from .dynamic_provider_matrix import DynamicProviderMatrix",
@@ -160,12 +156,8 @@ def test_config_manager_enhancements():
     ]
 
     imports_found = True
-    for import_stmt in new_imports:
-        if import_stmt in content:
-            print(f"  ✅ Added import: {import_stmt}")
-        else:
-            print(f"  ❌ Missing import: {import_stmt}")
-            imports_found = False
+    if not _check_patterns(content, new_imports, "import"):
+        imports_found = False
 
     # Check for new methods
     new_methods = [
@@ -178,12 +170,8 @@ def test_config_manager_enhancements():
     ]
 
     methods_found = True
-    for method in new_methods:
-        if method in content:
-            print(f"  ✅ Added method: {method}")
-        else:
-            print(f"  ❌ Missing method: {method}")
-            methods_found = False
+    if not _check_patterns(content, new_methods, "method"):
+        methods_found = False
 
     # Check for new configuration fields
     config_fields = [
@@ -193,12 +181,8 @@ def test_config_manager_enhancements():
     ]
 
     fields_found = True
-    for field in config_fields:
-        if field in content:
-            print(f"  ✅ Added config field: {field}")
-        else:
-            print(f"  ❌ Missing config field: {field}")
-            fields_found = False
+    if not _check_patterns(content, config_fields, "config field"):
+        fields_found = False
 
     return imports_found and methods_found and fields_found
 
@@ -206,14 +190,12 @@ def test_cli_command_structure():
     """Test CLI command structure."""
     print("\n💻 Testing CLI Command Structure...")
 
-    platform_cmd_file = Path("blackwell/commands/platform.py")
+    content = _read_source(PLATFORM_COMMAND_FILE)
 
-    if not platform_cmd_file.exists():
+    if content is None:
         print("  ❌ platform.py command file not found")
         return False
 
-    content = platform_cmd_file.read_text()
-
     # Check for Typer setup
     typer_elements = [
         "import typer",
@@ -222,12 +204,8 @@ def test_cli_command_structure():
     ]
 
     typer_found = True
-    for element in typer_elements:
-        if element in content:
-            print(f"  ✅ Found Typer element: {element[:40]}...")
-        else:
-            print(f"  ❌ Missing Typer element: {element}")
-            typer_found = False
+    if not _check_patterns(content, typer_elements, "Typer element"):
+        typer_found = False
 
     # Check for command functions
     commands = [
@@ -241,12 +219,8 @@ def test_cli_command_structure():
     ]
 
     commands_found = True
-    for cmd in commands:
-        if cmd in content:
-            print(f"  ✅ Found command: {cmd.split('(')[0].split('def ')[-1]}")
-        else:
-            print(f"  ❌ Missing command: {cmd}")
-            commands_found = False
+    if not _check_patterns(content, commands, "command"):
+        commands_found = False
 
     return typer_found and commands_found
 
@@ -254,23 +228,21 @@ def test_main_cli_registration():
     """Test that platform command is registered in main CLI."""
     print("\n🔗 Testing CLI Registration...")
 
-    main_file = Path("blackwell/main.py")
+    content = _read_source(MAIN_FILE)
 
-    if not main_file.exists():
+    if content is None:
         print("  ❌ main.py not found")
         return False
 
-    content = main_file.read_text()
-
-    # Check for import
-    if "platform," in content:
+    # Check for lazy import
+    if '"blackwell.commands.platform"' in content:
         print("  ✅ Platform command imported")
     else:
         print("  ❌ Platform command not imported")
         return False
 
     # Check for registration
-    registration_pattern = 'app.add_typer(\n    platform.app,'
+    registration_pattern = '"platform": ("blackwell.commands.platform",'
     if registration_pattern in content:
         print("  ✅ Platform command registered")
     else:
@@ -290,14 +262,12 @@ def test_transformation_logic():
     """Test transformation logic patterns."""
     print("\n🔄 Testing Transformation Logic...")
 
-    platform_integration_file = Path("blackwell/core/platform_integration.py")
+    content = _read_source(PLATFORM_INTEGRATION_FILE)
 
-    if not platform_integration_file.exists():
+    if content is None:
         print("  ❌ platform_integration.py not found")
         return False
 
-    content = platform_integration_file.read_text()
-
     # Check for transformation function structure
     transformation_elements = [
         "def transform_to_cli_format(",
@@ -311,12 +281,8 @@ def test_transformation_logic():
     ]
 
     logic_found = True
-    for element in transformation_elements:
-        if element in content:
-            print(f"  ✅ Found transformation logic: {element[:40]}...")
-        else:
-            print(f"  ❌ Missing transformation logic: {element}")
-            logic_found = False
+    if not _check_patterns(content, transformation_elements, "transformation logic"):
+        logic_found = False
 
     return logic_found
 
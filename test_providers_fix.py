@@ -4,11 +4,48 @@ Test script to verify the providers command fix
 """
 
 import sys
+from collections.abc import Mapping
+from itertools import islice
 from pathlib import Path
 
 # Add the project to the path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Provider types, in the order the providers command lists them
+PROVIDER_TYPES = ("cms", "ecommerce", "ssg")
+
+# Full provider data attribute on ProviderMatrix for each provider type
+_FULL_DATA_ATTRIBUTES = {
+    "cms": "cms_providers",
+    "ecommerce": "ecommerce_providers",
+    "ssg": "ssg_engines",
+}
+
+def _describe(provider_key, provider_data, fallback_name):
+    """Return (key, name, features) as the providers command lists a provider."""
+    if isinstance(provider_data, Mapping):
+        name = provider_data.get("name", provider_key.title())
+        features = ", ".join(provider_data.get("features", [])[:3])
+    else:
+        name = fallback_name
+        features = ""
+    return provider_key, name, features
+
+def _rows_from_mapping(providers, limit):
+    """Rows for dictionary-format providers, which carry their own details."""
+    return [
+        _describe(provider_key, provider_data, str(provider_data))
+        for provider_key, provider_data in islice(providers.items(), limit)
+    ]
+
+def _rows_from_list(provider_matrix, provider_type, providers, limit):
+    """Rows for list-format providers, with details from get_provider_info."""
+    get_provider_info = provider_matrix.get_provider_info
+    return [
+        _describe(provider_key, get_provider_info(provider_type, provider_key), provider_key.title())
+        for provider_key in islice(providers, limit)
+    ]
+
 def test_provider_matrix_data_format():
     """Test that the provider matrix returns the expected data formats."""
     print("🧪 Testing Provider Matrix Data Formats...")
@@ -26,19 +63,14 @@ def test_provider_matrix_data_format():
             print(f"  {provider_type}: {type(providers)} - {providers[:3] if providers else 'empty'}")
 
         # Test accessing full provider data
-        for provider_type in ["cms", "ecommerce", "ssg"]:
-            if provider_type == "cms":
-                full_data = matrix.cms_providers
-            elif provider_type == "ecommerce":
-                full_data = matrix.ecommerce_providers
-            else:
-                full_data = matrix.ssg_engines
+        for provider_type in PROVIDER_TYPES:
+            full_data = getattr(matrix, _FULL_DATA_ATTRIBUTES[provider_type])
 
             print(f"✅ Full {provider_type} data: {type(full_data)} with keys: {list(full_data.keys())[:3] if full_data else 'empty'}")
 
             # Test get_provider_info method
             if full_data:
-                first_key = list(full_data.keys())[0]
+                first_key = next(iter(full_data))
                 info = matrix.get_provider_info(provider_type, first_key)
                 print(f"  get_provider_info('{provider_type}', '{first_key}'): {type(info)}")
 
@@ -66,16 +98,16 @@ def test_dynamic_provider_matrix():
         providers_with_source = matrix.list_all_providers_with_source()
         print(f"✅ list_all_providers_with_source() format: {type(providers_with_source)}")
 
-        for provider_type in ["cms", "ecommerce", "ssg"]:
+        for provider_type in PROVIDER_TYPES:
             if provider_type in providers_with_source:
                 providers = providers_with_source[provider_type]
                 print(f"  {provider_type}: {type(providers)}")
 
-                if isinstance(providers, dict) and providers:
+                if isinstance(providers, Mapping) and providers:
                     first_key = list(providers.keys())[0]
                     first_value = providers[first_key]
                     print(f"    Example: {first_key} -> {type(first_value)}")
-                    if isinstance(first_value, dict):
+                    if isinstance(first_value, Mapping):
                         print(f"    Has 'name': {'name' in first_value}")
                         print(f"    Has 'features': {'features' in first_value}")
                 elif isinstance(providers, list) and providers:
@@ -114,7 +146,7 @@ def test_platform_integration():
         # Test transformation (even with empty metadata)
         cli_format = transform_to_cli_format(metadata)
         print(f"✅ CLI format: {type(cli_format)}")
-        for category in ["cms", "ecommerce", "ssg"]:
+        for category in PROVIDER_TYPES:
             if category in cli_format:
                 providers = cli_format[category]
                 print(f"  {category}: {type(providers)} - {len(providers) if isinstance(providers, dict) else 'not dict'}")
@@ -136,23 +168,25 @@ def simulate_providers_command_logic():
         provider_matrix = DynamicProviderMatrix()
 
         # Get data source information (as in the command)
-        if hasattr(provider_matrix, 'get_data_source'):
-            data_source = provider_matrix.get_data_source()
+        get_data_source = getattr(provider_matrix, 'get_data_source', None)
+        if get_data_source is not None:
+            data_source = get_data_source()
             print(f"✅ Data source: {data_source}")
         else:
             data_source = "static"
             print(f"✅ Data source: {data_source} (fallback)")
 
         # Get provider information (as in the command)
-        if hasattr(provider_matrix, 'list_all_providers_with_source'):
-            providers_info = provider_matrix.list_all_providers_with_source()
+        list_all_providers_with_source = getattr(provider_matrix, 'list_all_providers_with_source', None)
+        if list_all_providers_with_source is not None:
+            providers_info = list_all_providers_with_source()
         else:
             providers_info = provider_matrix.list_all_providers()
 
         print(f"✅ Provider info type: {type(providers_info)}")
 
         # Simulate the loop over provider types (the critical part that was failing)
-        for provider_type in ["cms", "ecommerce", "ssg"]:
+        for provider_type in PROVIDER_TYPES:
             if provider_type in providers_info:
                 providers = providers_info[provider_type]
                 print(f"\n  Testing {provider_type.upper()} providers:")
@@ -160,35 +194,16 @@ def simulate_providers_command_logic():
 
                 if providers:
                     # Simulate the table creation logic (the part that was failing)
-                    if isinstance(providers, dict):
+                    if isinstance(providers, Mapping):
                         print("    ✅ Dictionary format - can use .items()")
-                        count = 0
-                        for provider_key, provider_data in providers.items():
-                            if count >= 2:  # Just test first 2
-                                break
-                            if isinstance(provider_data, dict):
-                                name = provider_data.get("name", provider_key.title())
-                                features = ", ".join(provider_data.get("features", [])[:3])
-                            else:
-                                name = str(provider_data)
-                                features = ""
-                            print(f"      {provider_key}: {name} - {features}")
-                            count += 1
+                        rows = _rows_from_mapping(providers, limit=2)
                     else:
                         print("    ✅ List format - using get_provider_info fallback")
-                        count = 0
-                        for provider_key in providers:
-                            if count >= 2:  # Just test first 2
-                                break
-                            provider_data = provider_matrix.get_provider_info(provider_type, provider_key)
-                            if isinstance(provider_data, dict):
-                                name = provider_data.get("name", provider_key.title())
-                                features = ", ".join(provider_data.get("features", [])[:3])
-                            else:
-                                name = provider_key.title()
-                                features = ""
-                            print(f"      {provider_key}: {name} - {features}")
-                            count += 1
+                        rows = _rows_from_list(provider_matrix, provider_type, providers, limit=2)
+
+                    # Just test first 2
+                    for provider_key, name, features in rows:
+                        print(f"      {provider_key}: {name} - {features}")
 
         print("\n✅ Providers command logic simulation completed successfully!")
         return True